@@ -0,0 +1,87 @@
+"""Benchmark the cost of `ext()`, `apply()` and reads per call."""
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+import timeit
+import tracemalloc
+from typing import List
+
+from pydantic import Field
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+
+class BenchExtension(BaseExtension):
+    """Extension used for benchmarking."""
+
+    __schema_uri__ = "https://example.com/bench/v1.0.0/schema.json"
+    label: str = Field(title="Label", alias="bench:label")
+    authors: List[str] = Field(title="Authors", alias="bench:authors")
+
+
+def main(number: int = 10000):
+    """Run the benchmark."""
+    item, col = create_dummy_item()
+    asset = item.assets["ndvi"]
+    BenchExtension.ext(item, add_if_missing=True)
+    BenchExtension.ext(col, add_if_missing=True)
+    for name, obj in (("item", item), ("asset", asset), ("collection", col)):
+        elapsed = timeit.timeit(lambda o=obj: BenchExtension.ext(o), number=number)
+        print(f"ext({name}): {1e6 * elapsed / number:.2f} us/call")
+
+    ext = BenchExtension.ext(item)
+    md = BenchExtension(label="thing", authors=["sylvie", "andre"])
+    for name, func in (
+        ("apply(md)", lambda: ext.apply(md)),
+        ("apply(**kwargs)", lambda: ext.apply(label="thing", authors=["sylvie"])),
+        ("read", lambda: BenchExtension(item)),
+    ):
+        elapsed = timeit.timeit(func, number=number)
+        print(f"{name}: {1e6 * elapsed / number:.2f} us/call")
+
+    items = [create_dummy_item()[0] for _ in range(number)]
+
+    def _apply_each():
+        for it in items:
+            BenchExtension.ext(it, add_if_missing=True).apply(md)
+
+    for name, func in (
+        ("ext().apply() per item", _apply_each),
+        ("apply_many()", lambda: BenchExtension.apply_many(items, md)),
+    ):
+        elapsed = timeit.timeit(func, number=1)
+        print(f"{name}: {1e6 * elapsed / number:.2f} us/item")
+
+
+def adapter_memory(count: int = 10000):
+    """Measure the memory used per `ext()` adapter."""
+    item, _ = create_dummy_item()
+    BenchExtension.ext(item, add_if_missing=True)
+    tracemalloc.start()
+    adapters = [BenchExtension.ext(item) for _ in range(count)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"adapter memory: {size / len(adapters):.0f} bytes/adapter")
+
+
+def threaded(count: int = 20000, workers: int = 8):
+    """Measure `ext().apply()` throughput from a thread pool."""
+    items = [create_dummy_item()[0] for _ in range(count)]
+    md = BenchExtension(label="thing", authors=["sylvie", "andre"])
+
+    def _apply(item):
+        BenchExtension.ext(item, add_if_missing=True).apply(md)
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        start = time.perf_counter()
+        list(executor.map(_apply, items, chunksize=256))
+        elapsed = time.perf_counter() - start
+    assert all(BenchExtension(item).label == "thing" for item in items)
+    print(f"{workers} threads: {count / elapsed:.0f} ext().apply()/s")
+
+
+if __name__ == "__main__":
+    adapter_memory()
+    threaded()
+    main()
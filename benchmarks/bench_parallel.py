@@ -0,0 +1,33 @@
+"""Benchmark the scaling of `parallel_apply()` with the number of workers."""
+
+import os
+import time
+
+from pydantic_pystac_extensions.parallel import parallel_apply
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+from benchmarks.bench_ext import BenchExtension
+
+
+def main(count: int = 5000, validate: bool = False):
+    """Run the benchmark."""
+    stac_dicts = [create_dummy_item()[0].to_dict() for _ in range(count)]
+    md = BenchExtension(label="thing", authors=["sylvie", "andre"])
+    workers = 1
+    while workers <= (os.cpu_count() or 1):
+        start = time.perf_counter()
+        for res in parallel_apply(
+            BenchExtension,
+            stac_dicts,
+            md,
+            validate=validate,
+            max_workers=workers,
+        ):
+            assert res.ok or validate, res.error
+        elapsed = time.perf_counter() - start
+        print(f"{workers} worker(s): {count / elapsed:.0f} items/s")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,248 @@
+"""Benchmark suite of the extensions hot paths.
+
+Runs `ext()`, `apply()` (with kwargs and with a model), reads
+(`BaseExtension(obj)`), `get_schema()` and `export_schema()` against a small,
+a wide (200 fields) and a deeply nested extension model, over several
+numbers of STAC objects, and writes the results as JSON so that they can be
+compared across releases:
+
+    python -m benchmarks.suite --output new.json --compare old.json
+"""
+
+import argparse
+from importlib.metadata import PackageNotFoundError, version
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from typing import Any, Callable, Optional
+
+from pydantic import BaseModel, Field, create_model
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+
+SCHEMA_URI = "https://example.com/benchmarks/{}/v1.0.0/schema.json"
+DEFAULT_SIZES = (1, 1000, 100000)
+SCHEMA_REPEATS = 20
+
+
+class SmallExtension(BaseExtension):
+    """Small extension."""
+
+    __schema_uri__ = SCHEMA_URI.format("small")
+    label: str = Field(alias="small:label")
+    authors: list[str] = Field(alias="small:authors")
+    count: int = Field(alias="small:count", default=0)
+
+
+WideExtension = create_model(  # type: ignore
+    "WideExtension",
+    __base__=BaseExtension,
+    **{f"field_{i}": (int, Field(alias=f"wide:field_{i}")) for i in range(200)},
+)
+WideExtension.__schema_uri__ = SCHEMA_URI.format("wide")
+
+
+class Level3(BaseModel):
+    """Deepest level of the nested extension."""
+
+    values: list[float]
+    name: str
+
+
+class Level2(BaseModel):
+    """Third level of the nested extension."""
+
+    children: list[Level3]
+    attrs: dict[str, str]
+
+
+class Level1(BaseModel):
+    """Second level of the nested extension."""
+
+    child: Level2
+    others: list[Level2]
+
+
+class NestedExtension(BaseExtension):
+    """Deeply nested extension."""
+
+    __schema_uri__ = SCHEMA_URI.format("nested")
+    root: Level1 = Field(alias="nested:root")
+    label: str = Field(alias="nested:label")
+
+
+def _level2() -> dict[str, Any]:
+    """Values of a `Level2`."""
+    return {
+        "children": [{"values": [1.0, 2.5], "name": f"c{i}"} for i in range(3)],
+        "attrs": {"a": "b", "c": "d"},
+    }
+
+
+MODELS: dict[str, tuple[type[BaseExtension], dict[str, Any]]] = {
+    "small": (SmallExtension, {"label": "thing", "authors": ["sylvie"], "count": 3}),
+    "wide": (WideExtension, {f"field_{i}": i for i in range(200)}),
+    "nested": (
+        NestedExtension,
+        {"root": {"child": _level2(), "others": [_level2()] * 2}, "label": "x"},
+    ),
+}
+
+
+def _measure(func: Callable[[], Any], calls: int) -> dict[str, float]:
+    """Run `func` (which makes `calls` calls) and measure it."""
+    start = time.perf_counter()
+    func()
+    total = time.perf_counter() - start
+    return {"total_s": total, "per_call_us": 1e6 * total / calls}
+
+
+def _object_benchmarks(
+    ext_cls: type[BaseExtension], values: dict[str, Any], size: int
+) -> dict[str, dict[str, float]]:
+    """Benchmark the per-object operations over `size` items."""
+    items = [create_dummy_item()[0] for _ in range(size)]
+    md = ext_cls(**values)
+    exts = []
+
+    def _ext():
+        exts.extend(ext_cls.ext(item, add_if_missing=True) for item in items)
+
+    def _apply_kwargs():
+        for ext in exts:
+            ext.apply(**values)
+
+    def _apply_md():
+        for item in items:
+            item.properties.clear()
+        for ext in exts:
+            ext.apply(md)
+
+    def _read():
+        for item in items:
+            ext_cls(item)
+
+    return {
+        "ext": _measure(_ext, size),
+        "apply_kwargs": _measure(_apply_kwargs, size),
+        "apply_md": _measure(_apply_md, size),
+        "read": _measure(_read, size),
+    }
+
+
+def _schema_benchmarks(ext_cls: type[BaseExtension]) -> dict[str, dict[str, float]]:
+    """Benchmark the schema generation and export."""
+
+    def _get_schema_cold():
+        for _ in range(SCHEMA_REPEATS):
+            ext_cls.invalidate_schema()
+            ext_cls.get_schema()
+
+    def _get_schema():
+        for _ in range(SCHEMA_REPEATS):
+            ext_cls.get_schema()
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        json_file = os.path.join(tmpdir, "schema.json")
+
+        def _export_schema():
+            for _ in range(SCHEMA_REPEATS):
+                ext_cls.export_schema(json_file)
+
+        return {
+            "get_schema_cold": _measure(_get_schema_cold, SCHEMA_REPEATS),
+            "get_schema": _measure(_get_schema, SCHEMA_REPEATS),
+            "export_schema": _measure(_export_schema, SCHEMA_REPEATS),
+        }
+
+
+def run_suite(sizes=DEFAULT_SIZES, models=tuple(MODELS)) -> dict[str, Any]:
+    """Run the benchmark suite.
+
+    Returns:
+        the environment and the results, keyed by "model/operation[/size]"
+
+    """
+    try:
+        package_version = version("pydantic-pystac-extensions")
+    except PackageNotFoundError:
+        package_version = None
+    results = {}
+    for model in models:
+        ext_cls, values = MODELS[model]
+        for op, res in _schema_benchmarks(ext_cls).items():
+            results[f"{model}/{op}"] = res
+        for size in sizes:
+            for op, res in _object_benchmarks(ext_cls, values, size).items():
+                results[f"{model}/{op}/{size}"] = res
+            print(f"{model} x {size}: done", file=sys.stderr)
+    return {
+        "environment": {
+            "package_version": package_version,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "pydantic": version("pydantic"),
+            "pystac": version("pystac"),
+        },
+        "results": results,
+    }
+
+
+def compare(
+    new: dict[str, Any], old: dict[str, Any], threshold: float = 1.2
+) -> list[str]:
+    """Compare two suite results and print the ratios.
+
+    Returns:
+        the benchmarks that are slower than `threshold` times the old ones
+
+    """
+    regressions = []
+    for key, res in new["results"].items():
+        old_res: Optional[dict[str, float]] = old["results"].get(key)
+        if old_res is None:
+            continue
+        ratio = res["per_call_us"] / old_res["per_call_us"]
+        flag = ""
+        if ratio > threshold:
+            regressions.append(key)
+            flag = "  <-- regression"
+        print(
+            f"{key:36} {old_res['per_call_us']:12.2f} us "
+            f"-> {res['per_call_us']:12.2f} us  (x{ratio:.2f}){flag}"
+        )
+    return regressions
+
+
+def main(argv=None):
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--models", nargs="+", default=list(MODELS), choices=MODELS)
+    parser.add_argument("--output", help="JSON file to write the results to")
+    parser.add_argument("--compare", help="JSON file of previous results")
+    parser.add_argument("--threshold", type=float, default=1.2)
+    args = parser.parse_args(argv)
+
+    suite = run_suite(sizes=args.sizes, models=args.models)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(suite, f, indent=2)
+    else:
+        print(json.dumps(suite, indent=2))
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            regressions = compare(suite, json.load(f), args.threshold)
+        if regressions:
+            print(f"Regressions: {', '.join(regressions)}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
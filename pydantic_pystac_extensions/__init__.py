@@ -1,11 +1,46 @@
-"""Pydantic-Pystac extensions module."""
+"""Pydantic-Pystac extensions module.
 
-from importlib.metadata import version, PackageNotFoundError
+Attributes are loaded on first access, so that importing the package does not
+import `pystac` and `pydantic` until they are needed.
+"""
 
-from .core import BaseExtension  # noqa
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
 
+if TYPE_CHECKING:
+    from .core import BaseExtension  # noqa
+    from .reader import MultiExtensionReader  # noqa
+    from .registry import read_all  # noqa
 
-try:
-    __version__ = version("pydantic-pystac-extension")
-except PackageNotFoundError:
-    pass
+
+#: Lazily loaded attributes, and the module that defines them
+_LAZY_ATTRIBUTES = {
+    "BaseExtension": ".core",
+    "MultiExtensionReader": ".reader",
+    "read_all": ".registry",
+}
+
+__all__ = ["BaseExtension", "MultiExtensionReader", "read_all"]
+
+
+def __getattr__(name: str) -> Any:
+    """Load the lazy attributes on first access."""
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    elif name == "__version__":
+        # pylint: disable=import-outside-toplevel
+        from importlib.metadata import version, PackageNotFoundError
+
+        try:
+            value = version("pydantic-pystac-extension")
+        except PackageNotFoundError as err:
+            raise AttributeError(name) from err
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the module attributes, including the lazy ones."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
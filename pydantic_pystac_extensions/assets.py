@@ -0,0 +1,136 @@
+"""Bulk apply and read of an extension over all the assets of a STAC object.
+
+Applying an extension asset per asset with `ext()` checks the schema URI of
+the owner for every asset. These functions check it once per item or
+collection, then read or write the fields of the assets directly. They also
+apply to the `item_assets` definitions of collections.
+"""
+
+from collections.abc import Iterable, Mapping
+from typing import Any, Optional, Type, Union
+
+import pystac
+from pydantic import BaseModel
+
+from .core import BaseExtension
+
+
+def get_asset_fields(
+    obj: Union[pystac.Item, pystac.Collection], item_assets: bool = False
+) -> dict[str, dict[str, Any]]:
+    """Get the fields of the assets of a STAC object, keyed by asset key.
+
+    Args:
+        obj: item or collection
+        item_assets: get the `item_assets` definitions of the collection
+            instead of its assets (empty if the collection has none)
+
+    """
+    if item_assets:
+        if not isinstance(obj, pystac.Collection):
+            raise pystac.ExtensionTypeError(
+                f"item_assets do not apply to type {type(obj).__name__}"
+            )
+        return obj.extra_fields.get("item_assets", {})
+    if not isinstance(obj, (pystac.Item, pystac.Collection)):
+        raise pystac.ExtensionTypeError(
+            f"Assets extensions do not apply to type {type(obj).__name__}"
+        )
+    return {key: asset.extra_fields for key, asset in obj.assets.items()}
+
+
+def _check_keys(keys: Iterable[str], fields: Mapping[str, Any]):
+    """Check that assets exist.
+
+    Raises:
+        KeyError: naming the missing assets
+
+    """
+    if missing := [key for key in keys if key not in fields]:
+        raise KeyError(f"No such assets: {', '.join(missing)}")
+
+
+def apply_assets(
+    ext_cls: Type[BaseExtension],
+    obj: Union[pystac.Item, pystac.Collection],
+    values: Union[BaseExtension, Mapping[str, Any]],
+    add_if_missing: bool = True,
+    item_assets: bool = False,
+    only_changed: bool = False,
+) -> int:
+    """Apply the extension metadata to the assets of a STAC object.
+
+    Args:
+        ext_cls: extension class
+        obj: item or collection owning the assets
+        values: a single model applied to every asset, or models (or dicts
+            of fields) keyed by asset key
+        add_if_missing: add the schema URI to `obj` if it is missing (and
+            there are assets to apply to)
+        item_assets: apply to the `item_assets` definitions of the
+            collection instead of its assets
+        only_changed: only write the fields assigned since the models were
+            read (see `BaseExtension.changed_fields`)
+
+    Returns:
+        number of assets whose extension fields were modified
+
+    """
+    fields = get_asset_fields(obj, item_assets)
+    if isinstance(values, BaseModel):
+        keys: Iterable[str] = fields
+        models: Iterable[BaseExtension] = [values] * len(fields)
+    else:
+        keys = list(values)
+        _check_keys(keys, fields)
+        models = ext_cls._get_list_adapter().validate_python(list(values.values()))  # pylint: disable=protected-access
+    if not keys:
+        # Nothing to apply to: the owner is left unchanged
+        return 0
+    ext_cls._ensure_has_extension(obj, add_if_missing)  # pylint: disable=protected-access
+
+    layout = ext_cls.get_layout()
+    changed = 0
+    for key, md in zip(keys, models):
+        changed += layout.write(
+            fields[key], md, md.changed_fields if only_changed else None
+        )
+    return changed
+
+
+def read_assets(
+    ext_cls: Type[BaseExtension],
+    obj: Union[pystac.Item, pystac.Collection],
+    keys: Optional[Iterable[str]] = None,
+    item_assets: bool = False,
+) -> dict[str, BaseExtension]:
+    """Read the extension metadata of the assets of a STAC object.
+
+    Assets without any of the extension fields are skipped.
+
+    Args:
+        ext_cls: extension class
+        obj: item or collection owning the assets
+        keys: read these assets only
+        item_assets: read the `item_assets` definitions of the collection
+            instead of its assets
+
+    Returns:
+        the models keyed by asset key
+
+    Raises:
+        KeyError: some of `keys` are not assets of `obj`
+
+    """
+    fields = get_asset_fields(obj, item_assets)
+    if keys is None:
+        keys = fields
+    else:
+        keys = list(keys)
+        _check_keys(keys, fields)
+    layout = ext_cls.get_layout()
+    models = {}
+    for key in keys:
+        if kwargs := layout.read(fields[key]):
+            models[key] = ext_cls._from_fields(kwargs)  # pylint: disable=protected-access
+    return models
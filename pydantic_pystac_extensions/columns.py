@@ -0,0 +1,130 @@
+"""Columnar extraction of extension metadata."""
+
+from collections.abc import Iterable
+import types
+from typing import Any, Type, Union, get_args, get_origin
+
+from .core import BaseExtension, get_properties
+
+
+BACKENDS = ("list", "numpy", "arrow")
+
+
+def get_scalar_type(annotation: Any) -> Any:
+    """Get the scalar type (bool, int, float, str) of an annotation, if any."""
+    if get_origin(annotation) in (Union, types.UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) != 1:
+            return None
+        annotation = args[0]
+    return annotation if annotation in (bool, int, float, str) else None
+
+
+def is_scalar(scalar_type: Any, value: Any) -> bool:
+    """Whether a value is of a scalar type (ints are floats, bools are not ints)."""
+    accepted = (int, float) if scalar_type is float else scalar_type
+    return isinstance(value, accepted) and not (
+        scalar_type is int and isinstance(value, bool)
+    )
+
+
+def check_scalar(name: str, scalar_type: Any, value: Any):
+    """Check that a value can be compared to the values of a scalar field.
+
+    Raises:
+        TypeError: value not of the scalar type (see `is_scalar`)
+
+    """
+    if not is_scalar(scalar_type, value):
+        raise TypeError(
+            f"Field {name!r} is of type {scalar_type.__name__}, got {value!r}"
+        )
+
+
+def _to_numpy(values: list[Any], scalar_type: Any) -> Any:
+    """Convert a column to a numpy array, masked where values are missing."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    if scalar_type in (bool, int, float):
+        mask = [value is None for value in values]
+        default = scalar_type()
+        data = np.array(
+            [default if value is None else value for value in values],
+            dtype={bool: np.bool_, int: np.int64, float: np.float64}[scalar_type],
+        )
+        return np.ma.masked_array(data, mask=mask) if any(mask) else data
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+
+def _to_arrow(columns: dict[str, list[Any]], scalar_types: dict[str, Any]) -> Any:
+    """Convert columns to a pyarrow table."""
+    import pyarrow as pa  # pylint: disable=import-outside-toplevel
+
+    arrow_types = {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+    }
+    return pa.table(
+        {
+            name: pa.array(values, type=arrow_types.get(scalar_types[name]))
+            for name, values in columns.items()
+        }
+    )
+
+
+def to_columns(
+    ext_cls: Type[BaseExtension],
+    objs: Iterable[Any],
+    backend: str = "list",
+    by_alias: bool = False,
+) -> Any:
+    """Extract the extension fields of many STAC objects as columns.
+
+    Values are read as stored in the STAC objects, without building the
+    models. Missing values are None (list and arrow backends) or masked
+    (numpy backend).
+
+    Args:
+        ext_cls: extension class
+        objs: items, assets or collections, as pystac objects or dicts
+        backend: "list" for lists, "numpy" for numpy arrays, "arrow" for a
+            `pyarrow.Table`
+        by_alias: name the columns after the fields aliases instead of the
+            fields names
+
+    Returns:
+        dict of columns, or a `pyarrow.Table` for the "arrow" backend
+
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend {backend}, must be one of {BACKENDS}")
+
+    fields = ext_cls.get_layout().fields
+    names = [alias if by_alias else key for key, alias in fields]
+    columns: dict[str, list[Any]] = {name: [] for name in names}
+    appenders = [
+        (alias, columns[name].append) for name, (_, alias) in zip(names, fields)
+    ]
+    for obj in objs:
+        props = get_properties(obj)
+        for alias, append in appenders:
+            append(props.get(alias))
+
+    if backend == "list":
+        return columns
+
+    model_fields = ext_cls.model_fields
+    scalar_types = {
+        name: get_scalar_type(model_fields[key].annotation)
+        for name, (key, _) in zip(names, fields)
+    }
+    if backend == "numpy":
+        return {
+            name: _to_numpy(values, scalar_types[name])
+            for name, values in columns.items()
+        }
+    return _to_arrow(columns, scalar_types)
@@ -1,19 +1,39 @@
 """Generic custom pystac extensions creation."""
 
-from collections.abc import Iterable
+from collections.abc import Iterable, Mapping, Sequence
+import copy
+import hashlib
+import itertools
 import json
 from typing import Any, Generic, TypeVar, Union, Optional
 import pystac.asset
 from pystac.extensions.base import PropertiesExtension, ExtensionManagementMixin
 import pystac
-from pydantic import BaseModel, ConfigDict
-from .schema import generate_schema
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from .instrumentation import instrumented
+from .trusted import init_trusted, is_trusted
 
 
 T = TypeVar("T", pystac.Item, pystac.Asset, pystac.Collection)
 
 
 DROPPED_ATTRIBUTES_NAMES = ["properties", "additional_read_properties"]
+DROPPED_ATTRIBUTES = frozenset(DROPPED_ATTRIBUTES_NAMES)
+_MISSING = object()
+_CHANGED_FIELDS_KEY = "__ext_changed_fields__"
+#: Caches built once per extension class, dropped by `invalidate_schema()`
+_CLASS_CACHES = (
+    "__ext_schema__",
+    "__ext_schema_json__",
+    "__ext_schema_etag__",
+    "__ext_validator__",
+    "__ext_layout__",
+    "__ext_list_adapter__",
+    "__ext_field_adapters__",
+    "__ext_trusted_layout__",
+    "__ext_dumps_by_model__",
+    "__ext_model_validated__",
+)
 
 
 class ClassProperty(property):
@@ -24,6 +44,99 @@ class ClassProperty(property):
         return self.fget(cls)
 
 
+def get_properties(obj: Union[T, dict[str, Any]]) -> dict[str, Any]:
+    """Get the dict carrying the extension fields of a STAC object.
+
+    `obj` can also be a STAC object as dict: the "properties" of features,
+    the dict itself for collections and assets.
+    """
+    # Dicts first: isinstance checks of pystac classes are slow (protocols)
+    if isinstance(obj, dict):
+        return obj["properties"] if obj.get("type") == "Feature" else obj
+    if isinstance(obj, pystac.Item):
+        return obj.properties
+    if isinstance(obj, (pystac.Asset, pystac.Collection)):
+        return obj.extra_fields
+    raise pystac.ExtensionTypeError(
+        f"Extensions do not apply to type {type(obj).__name__}"
+    )
+
+
+def _add_to_dict(ext_cls: Any, stac_dict: dict[str, Any]) -> bool:
+    """Add the schema URI of an extension to an item or collection as dict.
+
+    Returns:
+        whether the STAC dict was modified
+
+    """
+    if stac_dict.get("type") not in ("Feature", "Collection"):
+        raise pystac.ExtensionTypeError(
+            f"Cannot add {ext_cls.__name__} to a dict that is not an item or a "
+            "collection (add it to the owner of assets instead)"
+        )
+    stac_extensions = stac_dict.setdefault("stac_extensions", [])
+    if (uri := ext_cls.get_schema_uri()) in stac_extensions:
+        return False
+    stac_extensions.append(uri)
+    return True
+
+
+class ExtensionLayout:
+    """Field/alias layout of an extension model, compiled once per class."""
+
+    __slots__ = ("fields", "names_by_alias", "aliases_by_name")
+
+    def __init__(self, model_cls: type[BaseModel]):
+        """Initializer."""
+        self.fields = tuple(
+            (key, info.alias or key)
+            for key, info in model_cls.model_fields.items()
+            if key not in DROPPED_ATTRIBUTES
+        )
+        self.names_by_alias = {alias: key for key, alias in self.fields}
+        self.aliases_by_name = dict(self.fields)
+
+    @property
+    def aliases(self) -> tuple[str, ...]:
+        """Aliases of the extension fields, in the model order."""
+        return tuple(self.names_by_alias)
+
+    def read(self, props: dict[str, Any]) -> dict[str, Any]:
+        """Read the non-None extension fields from properties, keyed by name."""
+        return {
+            key: value
+            for key, alias in self.fields
+            if (value := props.get(alias)) is not None
+        }
+
+    def write(
+        self,
+        props: dict[str, Any],
+        md: BaseModel,
+        include: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Write the non-None fields of the model in properties, keyed by alias.
+
+        Only the values differing from the ones already in properties are
+        written. `include` restricts the fields to write.
+
+        Returns:
+            whether properties were modified
+
+        """
+        values = md.model_dump(
+            include=None if include is None else set(include),
+            exclude=DROPPED_ATTRIBUTES,
+        )
+        changed = False
+        for key, alias in self.fields:
+            value = values.get(key)
+            if value is not None and props.get(alias, _MISSING) != value:
+                props[alias] = value
+                changed = True
+        return changed
+
+
 class PystacExtensionAdapter(
     Generic[T],
     PropertiesExtension,
@@ -31,22 +144,10 @@ class PystacExtensionAdapter(
 ):
     """Custom extension class."""
 
-    properties: dict[str, Any] = {}
+    properties: dict[str, Any]
     __schema_uri__: str = ""
     __name_prefix__: str = ""
 
-    def __init__(self, obj: T, extension_cls: Any = None):
-        """Initializer."""
-        self.extension_cls = extension_cls
-        self.__name_prefix__ = extension_cls.__name_prefix__
-        self.__class__.__name__ = (
-            f"{obj.__class__.__name__}{self.extension_cls.__name__}"
-        )
-        if isinstance(obj, pystac.Item):
-            self.properties = obj.properties
-        elif isinstance(obj, (pystac.Asset, pystac.Collection)):
-            self.properties = obj.extra_fields
-
     @ClassProperty
     def name(cls):  # type: ignore # pylint: disable=no-self-argument
         """Fetch name of the extension.
@@ -55,8 +156,30 @@ class PystacExtensionAdapter(
         """
         return cls.__name_prefix__
 
-    def apply(self, md: Optional["BaseExtension"] = None, **kwargs):
-        """Apply the metadata."""
+    @instrumented("apply", lambda self, *args, **kwargs: self.extension_cls)
+    def apply(
+        self,
+        md: Optional["BaseExtension"] = None,
+        only_changed: bool = False,
+        **kwargs,
+    ) -> bool:
+        """Apply the metadata.
+
+        Only the fields whose value differs from the one carried by the STAC
+        object are written.
+
+        Args:
+            md: extension metadata
+            only_changed: when `md` was read from a STAC object (e.g.
+                `MyExtension(item)`), only write the fields assigned since
+                then (see `BaseExtension.changed_fields`). Use it to write
+                back to the object the model was read from.
+            **kwargs: extension fields, instead of `md`
+
+        Returns:
+            whether the STAC object was modified
+
+        """
         if md is None and not kwargs:
             raise ValueError("At least `md` or kwargs is required")
 
@@ -64,13 +187,11 @@ class PystacExtensionAdapter(
             raise ValueError("You must use either `md` or kwargs")
 
         md = md or self.extension_cls(**kwargs)
-        # Set properties
-        for key, value in md.model_dump(exclude_unset=False).items():
-            if key in DROPPED_ATTRIBUTES_NAMES:
-                continue
-            alias = md.__class__.model_fields[key].alias or key
-            if value is not None:
-                self._set_property(alias, value, pop_if_none=False)
+        if isinstance(md, BaseExtension):
+            return md.get_layout().write(
+                self.properties, md, include=md.changed_fields if only_changed else None
+            )
+        return ExtensionLayout(type(md)).write(self.properties, md)
 
     @classmethod
     def get_schema_uri(cls) -> str:
@@ -83,15 +204,71 @@ class PystacExtensionAdapter(
         return _parent_class.__schema_uri__
 
     @classmethod
+    @instrumented("get_schema")
     def get_schema(cls) -> dict:
-        """Get schema as dict."""
-        assert issubclass(cls, BaseExtension)
-        return generate_schema(
-            model_cls=cls,
-            title=f"STAC extension from {cls.__name__} model",
-            description=f"STAC extension based on the {cls.__name__} model",
-            schema_uri=cls.__schema_uri__,
-        )
+        """Get schema as dict.
+
+        The schema is generated once per class: this returns a copy of it, that
+        can be modified freely.
+        """
+        return copy.deepcopy(cls._get_cached_schema())
+
+    @classmethod
+    def get_schema_json(cls) -> bytes:
+        """Get the schema as canonical JSON (sorted keys, compact, UTF-8)."""
+        schema_json = cls.__dict__.get("__ext_schema_json__")
+        if schema_json is None:
+            schema_json = json.dumps(
+                cls._get_cached_schema(),
+                sort_keys=True,
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ).encode("utf-8")
+            cls.__ext_schema_json__ = schema_json
+        return schema_json
+
+    @classmethod
+    def get_schema_etag(cls) -> str:
+        """Get a strong ETag (quoted SHA-256 of the canonical JSON) of the schema."""
+        etag = cls.__dict__.get("__ext_schema_etag__")
+        if etag is None:
+            etag = f'"{hashlib.sha256(cls.get_schema_json()).hexdigest()}"'
+            cls.__ext_schema_etag__ = etag
+        return etag
+
+    @classmethod
+    def invalidate_schema(cls):
+        """Drop the cached schema of the class, and all that derives from its fields.
+
+        This is only needed when the model is modified after the schema was
+        first generated, e.g. after `model_rebuild()` or a `__schema_uri__`
+        change: the schema (JSON, ETag, validator), the fields layouts and the
+        validators of lists and fields are rebuilt on next use. The extensions
+        registry is reindexed as well.
+        """
+        for attr in _CLASS_CACHES:
+            if attr in cls.__dict__:
+                delattr(cls, attr)
+        from .registry import get_registry  # pylint: disable=import-outside-toplevel
+
+        get_registry().invalidate()
+
+    @classmethod
+    def _get_cached_schema(cls) -> dict:
+        """Get the schema, generated once per class."""
+        schema = cls.__dict__.get("__ext_schema__")
+        if schema is None:
+            assert issubclass(cls, BaseExtension)
+            from .schema import generate_schema  # pylint: disable=import-outside-toplevel
+
+            schema = generate_schema(
+                model_cls=cls,
+                title=f"STAC extension from {cls.__name__} model",
+                description=f"STAC extension based on the {cls.__name__} model",
+                schema_uri=cls.__schema_uri__,
+            )
+            cls.__ext_schema__ = schema
+        return schema
 
     @classmethod
     def print_schema(cls):
@@ -109,6 +286,7 @@ class PystacExtensionAdapter(
             json.dump(cls.get_schema(), f, indent=2)
 
     @classmethod
+    @instrumented("ext")
     def ext(
         cls, obj: T, add_if_missing: bool = False
     ) -> Union[
@@ -117,29 +295,70 @@ class PystacExtensionAdapter(
         "CollectionCustomExtension",
     ]:
         """Create the extension."""
-
-        class ItemExt(ItemCustomExtension[cls]):  # type: ignore
-            """Item extension."""
-
-        class AssetExt(AssetCustomExtension[cls]):  # type: ignore
-            """Asset extension."""
-
-        class CollectionExt(CollectionCustomExtension[cls]):  # type: ignore
-            """Collection extension."""
-
+        ext_classes = cls._get_ext_classes()
         if isinstance(obj, pystac.Item):
-            cls.ensure_has_extension(obj, add_if_missing)
-            return ItemExt(obj, cls)
+            cls._ensure_has_extension(obj, add_if_missing)
+            return ext_classes[pystac.Item](obj, cls)
         if isinstance(obj, pystac.Asset):
-            cls.ensure_owner_has_extension(obj, add_if_missing)
-            return AssetExt(obj, cls)
+            cls._ensure_has_extension(obj, add_if_missing)
+            return ext_classes[pystac.Asset](obj, cls)
         if isinstance(obj, pystac.Collection):
-            cls.ensure_has_extension(obj, add_if_missing)
-            return CollectionExt(obj, cls)
+            cls._ensure_has_extension(obj, add_if_missing)
+            return ext_classes[pystac.Collection](obj, cls)
         raise pystac.ExtensionTypeError(
             f"{cls.__name__} does not apply to type {type(obj).__name__}"
         )
 
+    @classmethod
+    def _ensure_has_extension(cls, obj: T, add_if_missing: bool):
+        """Ensure that the object (or the asset owner) has the extension.
+
+        The pystac checks (matching any version of the schema URI) are skipped
+        when the exact schema URI is already listed.
+        """
+        owner = obj.owner if isinstance(obj, pystac.Asset) else obj
+        if owner is None or cls.get_schema_uri() not in (owner.stac_extensions or ()):
+            if isinstance(obj, pystac.Asset):
+                cls.ensure_owner_has_extension(obj, add_if_missing)
+            else:
+                cls.ensure_has_extension(obj, add_if_missing)
+
+    @classmethod
+    def _get_ext_classes(cls) -> dict[type, type]:
+        """Get the item/asset/collection extension classes, built once per class."""
+        ext_classes = cls.__dict__.get("__ext_classes__")
+        if ext_classes is None:
+
+            class ItemExt(ItemCustomExtension[cls]):  # type: ignore
+                """Item extension."""
+
+                __slots__ = ()
+                __name_prefix__ = cls.__name_prefix__
+
+            class AssetExt(AssetCustomExtension[cls]):  # type: ignore
+                """Asset extension."""
+
+                __slots__ = ()
+                __name_prefix__ = cls.__name_prefix__
+
+            class CollectionExt(CollectionCustomExtension[cls]):  # type: ignore
+                """Collection extension."""
+
+                __slots__ = ()
+                __name_prefix__ = cls.__name_prefix__
+
+            ext_classes = {
+                pystac.Item: ItemExt,
+                pystac.Asset: AssetExt,
+                pystac.Collection: CollectionExt,
+            }
+            for stac_cls, ext_cls in ext_classes.items():
+                ext_cls.__name__ = ext_cls.__qualname__ = (
+                    f"{stac_cls.__name__}{cls.__name__}"
+                )
+            cls.__ext_classes__ = ext_classes
+        return ext_classes
+
     def to_dict(self) -> dict[str, Any]:
         """Return the extension properties as a dictionary."""
         return self.properties
@@ -148,48 +367,307 @@ class PystacExtensionAdapter(
 BaseExtensionTypeVar = TypeVar("BaseExtensionTypeVar", bound="BaseExtension")
 
 
-class ItemCustomExtension(
-    Generic[BaseExtensionTypeVar], PystacExtensionAdapter[pystac.Item]
-):
+class CustomExtension(Generic[T], PystacExtensionAdapter[T]):
+    """Custom extension wrapping the fields of a STAC object.
+
+    Instances only hold references to the extension class and to the fields
+    of the STAC object, in slots: they are cheap to create and do not share
+    any mutable state.
+    """
+
+    __slots__ = ("extension_cls", "properties", "additional_read_properties")
+
+    def __init__(self, obj: T, extension_cls: Any = None):
+        """Initializer."""
+        self.extension_cls = extension_cls
+        self.properties = get_properties(obj)
+        self.additional_read_properties = None
+
+
+class ItemCustomExtension(Generic[BaseExtensionTypeVar], CustomExtension[pystac.Item]):
     """Item custom extension."""
 
+    __slots__ = ()
+
 
 class AssetCustomExtension(
-    Generic[BaseExtensionTypeVar], PystacExtensionAdapter[pystac.Asset]
+    Generic[BaseExtensionTypeVar], CustomExtension[pystac.Asset]
 ):
     """Asset custom extension."""
 
-    asset_href: str
-    properties: dict[str, Any]
-    additional_read_properties: Iterable[dict[str, Any]] | None = None
+    __slots__ = ()
+    additional_read_properties: Iterable[dict[str, Any]] | None
 
 
-class CollectionCustomExtension(Generic[T], PystacExtensionAdapter[pystac.Collection]):
+class CollectionCustomExtension(Generic[T], CustomExtension[pystac.Collection]):
     """Collection curstom extension."""
 
-    properties: dict[str, Any]
+    __slots__ = ()
 
 
 class BaseExtension(BaseModel, PystacExtensionAdapter):
     """Base class for extensions models."""
 
     model_config = ConfigDict(populate_by_name=True, extra="forbid")
+    properties: dict[str, Any] = {}
 
+    #: Read the models of this class from STAC objects without validation (see
+    #: `pydantic_pystac_extensions.trusted`)
+    __trusted__: bool = False
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any):
+        """Register the subclasses in the extensions registry."""
+        super().__pydantic_init_subclass__(**kwargs)
+        from .registry import get_registry  # pylint: disable=import-outside-toplevel
+
+        get_registry().register(cls)
+
+    @instrumented(
+        "read", lambda self, obj=None, **kwargs: None if obj is None else type(self)
+    )
     def __init__(self, obj: Any = None, **kwargs):
         """Initializer."""
-        if isinstance(obj, (pystac.Asset, pystac.Item, pystac.Collection)):
+        # Checking None first spares the (slow, as pystac classes are protocols)
+        # isinstance checks when models are built from fields
+        if obj is not None and isinstance(
+            obj, (pystac.Asset, pystac.Item, pystac.Collection)
+        ):
             # Read properties from stac object
             props = obj.properties if isinstance(obj, pystac.Item) else obj.extra_fields
 
             # Keep only properties matching the extension model
-            kwargs = {
-                key: value
-                for key, info in self.__class__.model_fields.items()
-                if (value := props.get(info.alias or key)) is not None
-            }
+            kwargs = self.get_layout().read(props)
+            if is_trusted(type(self)) and init_trusted(self, kwargs):
+                self.__dict__[_CHANGED_FIELDS_KEY] = frozenset()
+                return
         elif obj:
             raise pystac.ExtensionTypeError(
                 f"{self.__class__.__name__} cannot be instantiated from type {type(obj).__name__}"
             )
         super().__init__(**kwargs)
         self.properties = kwargs
+        if obj is not None:
+            # Track the fields modified after reading from the stac object. This
+            # is kept out of the model fields and private attributes, so that it
+            # is ignored by serialization and equality.
+            self.__dict__[_CHANGED_FIELDS_KEY] = frozenset()
+
+    def __setattr__(self, name: str, value: Any):
+        """Set an attribute, tracking the modified extension fields."""
+        super().__setattr__(name, value)
+        changed_fields = self.__dict__.get(_CHANGED_FIELDS_KEY)
+        if changed_fields is not None and name in self.get_layout().aliases_by_name:
+            self.__dict__[_CHANGED_FIELDS_KEY] = changed_fields | {name}
+
+    @property
+    def changed_fields(self) -> Optional[frozenset[str]]:
+        """Fields assigned since the model was read from a STAC object.
+
+        None when the model was not read from a STAC object. Note that in-place
+        modifications of field values (e.g. appending to a list) are not
+        tracked: assign the field instead.
+        """
+        return self.__dict__.get(_CHANGED_FIELDS_KEY)
+
+    def model_copy(
+        self, *, update: Optional[Mapping[str, Any]] = None, deep: bool = False
+    ) -> "BaseExtension":
+        """Copy the model, tracking the updated extension fields as changed."""
+        copied = super().model_copy(update=update, deep=deep)
+        changed_fields = copied.__dict__.get(_CHANGED_FIELDS_KEY)
+        if update and changed_fields is not None:
+            copied.__dict__[_CHANGED_FIELDS_KEY] = changed_fields | (
+                update.keys() & self.get_layout().aliases_by_name.keys()
+            )
+        return copied
+
+    @classmethod
+    @instrumented("apply_many")
+    def apply_many(
+        cls,
+        objs: Iterable[T],
+        values: Union["BaseExtension", dict[str, Any], Sequence[Any]],
+        add_if_missing: bool = True,
+        only_changed: bool = False,
+    ) -> int:
+        """Apply the metadata to many STAC objects at once.
+
+        Args:
+            objs: items, assets or collections (e.g. a `pystac.ItemCollection`)
+            values: a single model (or dict of fields) applied to every object,
+                or a sequence of models (or dicts of fields) matching `objs`
+            add_if_missing: add the schema URI to the objects missing it
+            only_changed: only write the fields assigned since the models
+                were read (see `apply()`)
+
+        Returns:
+            number of objects whose extension fields were modified
+
+        """
+        if isinstance(values, (BaseModel, dict)):
+            models: Iterable[BaseExtension] = itertools.repeat(
+                values if isinstance(values, cls) else cls(**dict(values))
+            )
+        else:
+            objs = list(objs)
+            values = list(values)
+            if len(values) != len(objs):
+                raise ValueError(
+                    f"Got {len(values)} values for {len(objs)} STAC objects"
+                )
+            models = cls._get_list_adapter().validate_python(values)
+
+        layout = cls.get_layout()
+        owners = set()
+        changed = 0
+        for obj, md in zip(objs, models):
+            props = get_properties(obj)
+            if isinstance(obj, pystac.Asset):
+                if id(obj.owner) not in owners:
+                    cls._ensure_has_extension(obj, add_if_missing)
+                    owners.add(id(obj.owner))
+            else:
+                cls._ensure_has_extension(obj, add_if_missing)
+            changed += layout.write(
+                props, md, md.changed_fields if only_changed else None
+            )
+        return changed
+
+    @classmethod
+    @instrumented("apply_assets")
+    def apply_assets(
+        cls,
+        obj: Union[pystac.Item, pystac.Collection],
+        values: Union["BaseExtension", dict[str, Any]],
+        add_if_missing: bool = True,
+        item_assets: bool = False,
+        only_changed: bool = False,
+    ) -> int:
+        """Apply the metadata to the assets (or `item_assets`) of a STAC object.
+
+        See `pydantic_pystac_extensions.assets.apply_assets`.
+        """
+        from .assets import apply_assets  # pylint: disable=import-outside-toplevel
+
+        return apply_assets(cls, obj, values, add_if_missing, item_assets, only_changed)
+
+    @classmethod
+    @instrumented("read_assets")
+    def read_assets(
+        cls,
+        obj: Union[pystac.Item, pystac.Collection],
+        keys: Optional[Iterable[str]] = None,
+        item_assets: bool = False,
+    ) -> dict[str, "BaseExtension"]:
+        """Read the metadata of the assets (or `item_assets`) of a STAC object.
+
+        See `pydantic_pystac_extensions.assets.read_assets`.
+        """
+        from .assets import read_assets  # pylint: disable=import-outside-toplevel
+
+        return read_assets(cls, obj, keys, item_assets)
+
+    def to_json(self) -> bytes:
+        """Serialize the non-None extension fields to JSON bytes, keyed by alias.
+
+        See `pydantic_pystac_extensions.serialization.fields_json`.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        from .serialization import fields_json
+
+        return fields_json(self)
+
+    @classmethod
+    def to_columns(
+        cls, objs: Iterable[Any], backend: str = "list", by_alias: bool = False
+    ) -> Any:
+        """Extract the extension fields of many STAC objects as columns.
+
+        See `pydantic_pystac_extensions.columns.to_columns`.
+        """
+        from .columns import to_columns  # pylint: disable=import-outside-toplevel
+
+        return to_columns(cls, objs, backend=backend, by_alias=by_alias)
+
+    @classmethod
+    def fingerprint(cls, obj: Union[T, dict[str, Any]]) -> str:
+        """Get the fingerprint of the extension fields of a STAC object.
+
+        See `pydantic_pystac_extensions.fingerprint.fingerprint`.
+        """
+        from .fingerprint import fingerprint  # pylint: disable=import-outside-toplevel
+
+        return fingerprint(cls, obj)
+
+    @classmethod
+    def view(cls, obj: Union[T, dict[str, Any]], add_if_missing: bool = False) -> Any:
+        """Get a lazy view over the extension fields of a STAC object.
+
+        See `pydantic_pystac_extensions.view.ExtensionView`.
+        """
+        from .view import ExtensionView  # pylint: disable=import-outside-toplevel
+
+        if add_if_missing:
+            if isinstance(obj, dict):
+                _add_to_dict(cls, obj)
+            else:
+                cls.ext(obj, add_if_missing=True)
+        return ExtensionView(cls, obj)
+
+    @classmethod
+    def get_validator(cls) -> Any:
+        """Get the offline validator of the extension, built once per class.
+
+        See `pydantic_pystac_extensions.validation.ExtensionValidator`.
+        """
+        validator = cls.__dict__.get("__ext_validator__")
+        if validator is None:
+            # pylint: disable-next=import-outside-toplevel
+            from .validation import ExtensionValidator
+
+            validator = ExtensionValidator(cls)
+            cls.__ext_validator__ = validator
+        return validator
+
+    @classmethod
+    def read_trusted(cls, obj: Union[T, dict[str, Any]]) -> "BaseExtension":
+        """Read the model from a STAC object without validation.
+
+        See `pydantic_pystac_extensions.trusted`.
+        """
+        return cls._from_fields(cls.get_layout().read(get_properties(obj)), True)
+
+    @classmethod
+    @instrumented("read")
+    def _from_fields(
+        cls, fields: dict[str, Any], trusted: Optional[bool] = None
+    ) -> "BaseExtension":
+        """Build a model from the fields read from a STAC object (by name).
+
+        As with `BaseExtension(obj)`, the model is built without validation in
+        trusted mode, and the fields modified afterwards are tracked.
+        """
+        model = cls.__new__(cls)
+        if not (is_trusted(cls, trusted) and init_trusted(model, fields)):
+            model.__init__(**fields)
+        model.__dict__[_CHANGED_FIELDS_KEY] = frozenset()
+        return model
+
+    @classmethod
+    def _get_list_adapter(cls) -> TypeAdapter:
+        """Get the validator of lists of models, built once per class."""
+        adapter = cls.__dict__.get("__ext_list_adapter__")
+        if adapter is None:
+            adapter = TypeAdapter(list[cls])  # type: ignore
+            cls.__ext_list_adapter__ = adapter
+        return adapter
+
+    @classmethod
+    def get_layout(cls) -> ExtensionLayout:
+        """Get the field/alias layout of the extension, built once per class."""
+        layout = cls.__dict__.get("__ext_layout__")
+        if layout is None:
+            layout = ExtensionLayout(cls)
+            cls.__ext_layout__ = layout
+        return layout
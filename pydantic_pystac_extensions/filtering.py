@@ -0,0 +1,377 @@
+"""Vectorized filtering of STAC objects on their extension fields.
+
+Predicates are built in Python with `col()`, then compiled against an
+extension class, which checks that the fields exist, are scalar (bool, int,
+float or str, optional or not) and are compared to values of their types.
+Compiled filters evaluate the predicates with numpy, over columns of values
+read from chunks of objects, without building the models.
+
+Missing values (missing fields, objects without the extension, or values
+not of the type of the field, e.g. ints beyond int64) never satisfy
+comparisons nor `isin()`, only `is_null()`. Negating a predicate
+with `~` negates its result: missing values satisfy `~(col("count") > 2)`.
+
+Example:
+    predicate = (col("count") >= 3) & col("label").isin(["a", "b"])
+    selected = list(ExtensionFilter(MyExtension, predicate).select(items))
+
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable, Iterator, Sequence
+import itertools
+import operator
+from typing import Any, Callable, Type
+
+from .columns import check_scalar, get_scalar_type, is_scalar
+from .core import BaseExtension, get_properties
+
+
+CHUNK_SIZE = 65536
+NUMPY_TYPES = {bool: "bool", int: "int64", float: "float64", str: "str"}
+INT64_MIN, INT64_MAX = -(2**63), 2**63 - 1
+
+#: Columns of a chunk, keyed by field name: (values, missing values mask)
+Columns = dict[str, tuple[Any, Any]]
+
+_COMPARISONS: dict[str, Callable[[Any, Any], Any]] = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    "<": operator.lt,
+    "<=": operator.le,
+    ">": operator.gt,
+    ">=": operator.ge,
+}
+
+
+class Predicate(ABC):
+    """Predicate on extension fields, combined with `&`, `|` and `~`."""
+
+    @abstractmethod
+    def fields(self) -> set[str]:
+        """Names of the fields the predicate depends on."""
+
+    @abstractmethod
+    def check(self, ext_cls: Type[BaseExtension], scalar_types: dict[str, Any]):
+        """Check the predicate against the scalar types of the fields.
+
+        Raises:
+            ValueError: unknown or non-scalar field, or unsupported operator
+            TypeError: value not of the type of the field
+
+        """
+
+    @abstractmethod
+    def evaluate(self, columns: Columns) -> Any:
+        """Evaluate the predicate over columns, as a numpy boolean mask."""
+
+    def __and__(self, other: "Predicate") -> "Predicate":
+        """Both predicates."""
+        return And(self, other)
+
+    def __or__(self, other: "Predicate") -> "Predicate":
+        """Any of the predicates."""
+        return Or(self, other)
+
+    def __invert__(self) -> "Predicate":
+        """Negated predicate."""
+        return Not(self)
+
+    def __bool__(self):
+        """Refuse the truth value, e.g. of `a < col("x") < b` or `p and q`."""
+        raise TypeError("Predicates have no truth value, combine them with &, | and ~")
+
+
+def _check_field(
+    ext_cls: Type[BaseExtension], scalar_types: dict[str, Any], name: str
+) -> Any:
+    """Check that a field can be filtered on, and get its scalar type."""
+    if name not in scalar_types:
+        raise ValueError(f"{ext_cls.__name__} has no field {name!r}")
+    scalar_type = scalar_types[name]
+    if scalar_type is None:
+        raise ValueError(f"Field {name!r} is not a scalar field, it cannot be filtered")
+    return scalar_type
+
+
+class Comparison(Predicate):
+    """Comparison of a field with a value."""
+
+    def __init__(self, name: str, op: str, value: Any):
+        """Initializer."""
+        self.name = name
+        self.op = op
+        self.value = value
+
+    def fields(self) -> set[str]:
+        """The compared field."""
+        return {self.name}
+
+    def check(self, ext_cls: Type[BaseExtension], scalar_types: dict[str, Any]):
+        """Check the field, the operator and the type of the value."""
+        scalar_type = _check_field(ext_cls, scalar_types, self.name)
+        if scalar_type is bool and self.op not in ("==", "!="):
+            raise ValueError(f"Field {self.name!r} is boolean, it cannot be ordered")
+        check_scalar(self.name, scalar_type, self.value)
+
+    def evaluate(self, columns: Columns) -> Any:
+        """Compare the values, False where missing."""
+        values, missing = columns[self.name]
+        return _COMPARISONS[self.op](values, self.value) & ~missing
+
+    def __repr__(self) -> str:
+        """Python expression of the predicate."""
+        return f"(col({self.name!r}) {self.op} {self.value!r})"
+
+
+class IsIn(Predicate):
+    """Membership of the value of a field in a set of values."""
+
+    def __init__(self, name: str, values: Iterable[Any]):
+        """Initializer."""
+        self.name = name
+        self.values = list(values)
+
+    def fields(self) -> set[str]:
+        """The compared field."""
+        return {self.name}
+
+    def check(self, ext_cls: Type[BaseExtension], scalar_types: dict[str, Any]):
+        """Check the field and the types of the values."""
+        scalar_type = _check_field(ext_cls, scalar_types, self.name)
+        for value in self.values:
+            check_scalar(self.name, scalar_type, value)
+
+    def evaluate(self, columns: Columns) -> Any:
+        """Look the values up, False where missing."""
+        import numpy as np  # pylint: disable=import-outside-toplevel
+
+        values, missing = columns[self.name]
+        return np.isin(values, self.values) & ~missing
+
+    def __repr__(self) -> str:
+        """Python expression of the predicate."""
+        return f"col({self.name!r}).isin({self.values!r})"
+
+
+class IsNull(Predicate):
+    """Missing value of a field."""
+
+    def __init__(self, name: str):
+        """Initializer."""
+        self.name = name
+
+    def fields(self) -> set[str]:
+        """The compared field."""
+        return {self.name}
+
+    def check(self, ext_cls: Type[BaseExtension], scalar_types: dict[str, Any]):
+        """Check the field."""
+        _check_field(ext_cls, scalar_types, self.name)
+
+    def evaluate(self, columns: Columns) -> Any:
+        """Mask of the missing values."""
+        return columns[self.name][1].copy()
+
+    def __repr__(self) -> str:
+        """Python expression of the predicate."""
+        return f"col({self.name!r}).is_null()"
+
+
+class _Binary(Predicate):
+    """Combination of two predicates."""
+
+    def __init__(self, left: Predicate, right: Predicate):
+        """Initializer."""
+        self.left = left
+        self.right = right
+
+    def fields(self) -> set[str]:
+        """Fields of both predicates."""
+        return self.left.fields() | self.right.fields()
+
+    def check(self, ext_cls: Type[BaseExtension], scalar_types: dict[str, Any]):
+        """Check both predicates."""
+        self.left.check(ext_cls, scalar_types)
+        self.right.check(ext_cls, scalar_types)
+
+
+class And(_Binary):
+    """Conjunction of predicates."""
+
+    def evaluate(self, columns: Columns) -> Any:
+        """True where both predicates are."""
+        return self.left.evaluate(columns) & self.right.evaluate(columns)
+
+    def __repr__(self) -> str:
+        """Python expression of the predicate."""
+        return f"({self.left!r} & {self.right!r})"
+
+
+class Or(_Binary):
+    """Disjunction of predicates."""
+
+    def evaluate(self, columns: Columns) -> Any:
+        """True where any of the predicates is."""
+        return self.left.evaluate(columns) | self.right.evaluate(columns)
+
+    def __repr__(self) -> str:
+        """Python expression of the predicate."""
+        return f"({self.left!r} | {self.right!r})"
+
+
+class Not(Predicate):
+    """Negation of a predicate."""
+
+    def __init__(self, predicate: Predicate):
+        """Initializer."""
+        self.predicate = predicate
+
+    def fields(self) -> set[str]:
+        """Fields of the negated predicate."""
+        return self.predicate.fields()
+
+    def check(self, ext_cls: Type[BaseExtension], scalar_types: dict[str, Any]):
+        """Check the negated predicate."""
+        self.predicate.check(ext_cls, scalar_types)
+
+    def evaluate(self, columns: Columns) -> Any:
+        """True where the negated predicate is False."""
+        return ~self.predicate.evaluate(columns)
+
+    def __repr__(self) -> str:
+        """Python expression of the predicate."""
+        return f"~{self.predicate!r}"
+
+
+class Column:
+    """Field of an extension, by field name, to build predicates."""
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(self, name: str):
+        """Initializer."""
+        self.name = name
+
+    def __eq__(self, value: Any) -> Predicate:  # type: ignore[override]
+        """Equal to a value."""
+        return Comparison(self.name, "==", value)
+
+    def __ne__(self, value: Any) -> Predicate:  # type: ignore[override]
+        """Not equal to a value."""
+        return Comparison(self.name, "!=", value)
+
+    def __lt__(self, value: Any) -> Predicate:
+        """Lower than a value."""
+        return Comparison(self.name, "<", value)
+
+    def __le__(self, value: Any) -> Predicate:
+        """Lower than or equal to a value."""
+        return Comparison(self.name, "<=", value)
+
+    def __gt__(self, value: Any) -> Predicate:
+        """Greater than a value."""
+        return Comparison(self.name, ">", value)
+
+    def __ge__(self, value: Any) -> Predicate:
+        """Greater than or equal to a value."""
+        return Comparison(self.name, ">=", value)
+
+    def isin(self, values: Iterable[Any]) -> Predicate:
+        """Value in a set of values."""
+        return IsIn(self.name, values)
+
+    def is_null(self) -> Predicate:
+        """Missing value."""
+        return IsNull(self.name)
+
+    def __repr__(self) -> str:
+        """Python expression of the column."""
+        return f"col({self.name!r})"
+
+
+def col(name: str) -> Column:
+    """Field of an extension, by field name, to build predicates."""
+    return Column(name)
+
+
+def _is_valid(scalar_type: Any, value: Any) -> bool:
+    """Whether a value fits in a column of a scalar type."""
+    return is_scalar(scalar_type, value) and (
+        scalar_type is not int or INT64_MIN <= value <= INT64_MAX
+    )
+
+
+def _to_column(values: list[Any], scalar_type: Any) -> tuple[Any, Any]:
+    """Convert values to a numpy array, and the mask of the missing values.
+
+    Values not of the scalar type are missing values.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    valid = [_is_valid(scalar_type, value) for value in values]
+    default = scalar_type()
+    data = np.array(
+        [value if ok else default for value, ok in zip(values, valid)],
+        dtype=NUMPY_TYPES[scalar_type],
+    )
+    return data, ~np.array(valid, dtype=bool)
+
+
+class ExtensionFilter:
+    """Predicate compiled against an extension class."""
+
+    def __init__(self, ext_cls: Type[BaseExtension], predicate: Predicate):
+        """Initializer.
+
+        Raises:
+            ValueError: unknown or non-scalar field, or unsupported operator
+            TypeError: value not of the type of the field
+
+        """
+        self.ext_cls = ext_cls
+        self.predicate = predicate
+        scalar_types = {
+            name: get_scalar_type(ext_cls.model_fields[name].annotation)
+            for name, _ in ext_cls.get_layout().fields
+        }
+        predicate.check(ext_cls, scalar_types)
+        aliases = dict(ext_cls.get_layout().fields)
+        #: Fields read from the objects: (name, alias, scalar type)
+        self.columns = [
+            (name, aliases[name], scalar_types[name])
+            for name in sorted(predicate.fields())
+        ]
+
+    def mask(self, objs: Sequence[Any]) -> Any:
+        """Evaluate the predicate over STAC objects.
+
+        Args:
+            objs: items, assets or collections, as pystac objects or dicts
+
+        Returns:
+            numpy boolean array, True for the objects satisfying the predicate
+
+        """
+        props = [get_properties(obj) for obj in objs]
+        columns = {
+            name: _to_column([p.get(alias) for p in props], scalar_type)
+            for name, alias, scalar_type in self.columns
+        }
+        return self.predicate.evaluate(columns)
+
+    def select(self, objs: Iterable[Any], chunksize: int = CHUNK_SIZE) -> Iterator[Any]:
+        """Yield the STAC objects satisfying the predicate, evaluated by chunks.
+
+        Args:
+            objs: items, assets or collections, as pystac objects or dicts
+            chunksize: number of objects evaluated at once
+
+        """
+        it = iter(objs)
+        while chunk := list(itertools.islice(it, chunksize)):
+            yield from itertools.compress(chunk, self.mask(chunk).tolist())
+
+    def __repr__(self) -> str:
+        """Class and predicate of the filter."""
+        return f"ExtensionFilter({self.ext_cls.__name__}, {self.predicate!r})"
@@ -0,0 +1,67 @@
+"""Content fingerprints of the extension fields of STAC objects.
+
+A fingerprint is a hash of the canonical JSON of the extension fields an
+object carries (sorted keys, compact separators, integral floats written as
+integers), computed from the raw values without building the model. Two
+objects carrying the same extension metadata have the same fingerprint,
+whatever the order of their keys or the other fields they carry.
+
+Values that are not JSON (e.g. datetimes, as written by `apply()`) are
+converted as pydantic serializes them, so that an object has the same
+fingerprint in memory and once written to and loaded from JSON.
+"""
+
+from collections.abc import Iterable, Iterator
+import hashlib
+import json
+from typing import Any, Type, Union
+
+import pydantic_core
+
+from .core import BaseExtension, T, get_properties
+
+
+def _normalize(value: Any) -> Any:
+    """Normalize numbers (integral floats to int) in a JSON-like value."""
+    if isinstance(value, float):
+        return int(value) if value.is_integer() else value
+    if isinstance(value, dict):
+        return {key: _normalize(val) for key, val in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_normalize(val) for val in value]
+    return value
+
+
+def canonical_json(
+    ext_cls: Type[BaseExtension], obj: Union[T, dict[str, Any]]
+) -> bytes:
+    """Canonical JSON of the extension fields of a STAC object."""
+    props = get_properties(obj)
+    payload = _normalize(
+        pydantic_core.to_jsonable_python(
+            {
+                alias: value
+                for _, alias in ext_cls.get_layout().fields
+                if (value := props.get(alias)) is not None
+            }
+        )
+    )
+    return json.dumps(
+        payload,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+    ).encode("utf-8")
+
+
+def fingerprint(ext_cls: Type[BaseExtension], obj: Union[T, dict[str, Any]]) -> str:
+    """Fingerprint (hex digest) of the extension fields of a STAC object."""
+    return hashlib.blake2b(canonical_json(ext_cls, obj), digest_size=16).hexdigest()
+
+
+def fingerprints(
+    ext_cls: Type[BaseExtension], objs: Iterable[Union[T, dict[str, Any]]]
+) -> Iterator[str]:
+    """Yield the fingerprints of the extension fields of STAC objects."""
+    for obj in objs:
+        yield fingerprint(ext_cls, obj)
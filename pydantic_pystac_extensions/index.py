@@ -0,0 +1,248 @@
+"""Local SQLite index of the extension fields of items.
+
+The table of an extension has one typed column per extension field (named
+after the field alias), plus the collection and item ids and the item bbox.
+Scalar fields (bool, int, float, str, optional or not) are indexed, so that
+equality, range and IN queries are answered without scanning the items;
+other fields are stored as JSON.
+
+Example:
+    index = ExtensionIndex(MyExtension, "index.sqlite")
+    index.add(items)
+    index.query(name="thing", count=between(2, 10))
+
+"""
+
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+import itertools
+import json
+import sqlite3
+from typing import Any, Optional, Type, Union
+
+import pystac
+
+from .columns import check_scalar, get_scalar_type
+from .core import BaseExtension, get_properties
+from .streaming import read_ndjson
+
+
+SQL_TYPES = {bool: "INTEGER", int: "INTEGER", float: "REAL", str: "TEXT"}
+BULK_SIZE = 10000
+
+
+@dataclass(frozen=True)
+class Range:
+    """Range condition, bounds included (None for open bounds)."""
+
+    low: Any = None
+    high: Any = None
+
+
+def between(low: Any = None, high: Any = None) -> Range:
+    """Range condition, bounds included (None for open bounds)."""
+    return Range(low, high)
+
+
+def _bbox_2d(bbox: Sequence[float]) -> tuple[float, float, float, float]:
+    """Get the (minx, miny, maxx, maxy) of a 2D or 3D bbox."""
+    half = len(bbox) // 2
+    return bbox[0], bbox[1], bbox[half], bbox[half + 1]
+
+
+def _quote(name: str) -> str:
+    """Quote an SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+class ExtensionIndex:
+    """SQLite index of the extension fields of items."""
+
+    def __init__(
+        self,
+        ext_cls: Type[BaseExtension],
+        path: str = ":memory:",
+        table: Optional[str] = None,
+    ):
+        """Initializer.
+
+        Args:
+            ext_cls: extension class
+            path: SQLite database file (in memory by default)
+            table: table name, defaults to the extension class name
+
+        """
+        self.ext_cls = ext_cls
+        self.table = table or ext_cls.__name__
+        self.fields = ext_cls.get_layout().fields
+        self.scalar_types = {
+            name: get_scalar_type(ext_cls.model_fields[name].annotation)
+            for name, _ in self.fields
+        }
+        self.connection = sqlite3.connect(path)
+        self._create_table()
+
+    def _create_table(self):
+        """Create the table and its indexes, if they do not exist."""
+        table = _quote(self.table)
+        columns = [
+            f"{_quote(alias)} {SQL_TYPES.get(self.scalar_types[name], 'TEXT')}"
+            for name, alias in self.fields
+        ]
+        with self.connection:
+            self.connection.execute(
+                f"CREATE TABLE IF NOT EXISTS {table} ("
+                "collection TEXT NOT NULL DEFAULT '', id TEXT NOT NULL, "
+                "minx REAL, miny REAL, maxx REAL, maxy REAL, "
+                f"{', '.join(columns)}, PRIMARY KEY (collection, id))"
+            )
+            self.connection.execute(
+                f"CREATE INDEX IF NOT EXISTS {_quote(self.table + '__bbox')} "
+                f"ON {table} (minx, maxx, miny, maxy)"
+            )
+            for name, alias in self.fields:
+                if self.scalar_types[name] is not None:
+                    self.connection.execute(
+                        "CREATE INDEX IF NOT EXISTS "
+                        f"{_quote(self.table + '__' + alias)} "
+                        f"ON {table} ({_quote(alias)})"
+                    )
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def _row(self, item: Union[pystac.Item, dict[str, Any]]) -> tuple[Any, ...]:
+        """Get the row of an item."""
+        if isinstance(item, pystac.Item):
+            collection, item_id, bbox = item.collection_id, item.id, item.bbox
+        else:
+            collection, item_id, bbox = (
+                item.get("collection"),
+                item["id"],
+                item.get("bbox"),
+            )
+        props = get_properties(item)
+        values = []
+        for name, alias in self.fields:
+            value = props.get(alias)
+            if value is not None and self.scalar_types[name] is None:
+                value = json.dumps(value)
+            values.append(value)
+        minx, miny, maxx, maxy = _bbox_2d(bbox) if bbox else (None,) * 4
+        return (collection or "", item_id, minx, miny, maxx, maxy, *values)
+
+    def add(self, items: Iterable[Union[pystac.Item, dict[str, Any]]]) -> int:
+        """Add (or update) items, as pystac items or dicts.
+
+        Returns:
+            the number of items added or updated
+
+        """
+        sql = (
+            f"INSERT OR REPLACE INTO {_quote(self.table)} VALUES "
+            f"({', '.join('?' * (6 + len(self.fields)))})"
+        )
+        rows = map(self._row, items)
+        count = 0
+        with self.connection:
+            while chunk := list(itertools.islice(rows, BULK_SIZE)):
+                self.connection.executemany(sql, chunk)
+                count += len(chunk)
+        return count
+
+    def add_ndjson(self, lines: Iterable[Union[str, bytes]]) -> int:
+        """Add (or update) items from NDJSON lines (e.g. an opened file)."""
+        return self.add(read_ndjson(lines))
+
+    def remove(self, ids: Iterable[str], collection: Optional[str] = None) -> int:
+        """Remove items.
+
+        Returns:
+            the number of items removed
+
+        """
+        with self.connection:
+            cursor = self.connection.executemany(
+                f"DELETE FROM {_quote(self.table)} WHERE collection = ? AND id = ?",
+                ((collection or "", item_id) for item_id in ids),
+            )
+        return cursor.rowcount
+
+    def __len__(self) -> int:
+        """Number of indexed items."""
+        return self.connection.execute(
+            f"SELECT COUNT(*) FROM {_quote(self.table)}"
+        ).fetchone()[0]
+
+    def _condition(self, name: str, condition: Any) -> tuple[str, list[Any]]:
+        """Get the SQL condition on a field, and its parameters."""
+        aliases = dict(self.fields)
+        if name not in aliases:
+            raise ValueError(f"{self.ext_cls.__name__} has no field {name!r}")
+        scalar_type = self.scalar_types[name]
+        if scalar_type is None:
+            raise ValueError(
+                f"Field {name!r} is not a scalar field, it cannot be queried"
+            )
+        column = _quote(aliases[name])
+        if condition is None:
+            return f"{column} IS NULL", []
+        if isinstance(condition, Range):
+            bounds = [
+                (op, value)
+                for op, value in ((">=", condition.low), ("<=", condition.high))
+                if value is not None
+            ]
+            values = [value for _, value in bounds]
+            sql = " AND ".join(f"{column} {op} ?" for op, _ in bounds)
+        elif isinstance(condition, (list, tuple, set, frozenset)):
+            values = list(condition)
+            sql = f"{column} IN ({', '.join('?' * len(values))})"
+        else:
+            values = [condition]
+            sql = f"{column} = ?"
+        for value in values:
+            check_scalar(name, scalar_type, value)
+        return sql or "1", values
+
+    def query(
+        self,
+        bbox: Optional[Sequence[float]] = None,
+        collection: Optional[str] = None,
+        limit: Optional[int] = None,
+        **conditions: Any,
+    ) -> list[tuple[str, str]]:
+        """Find the items matching all the conditions.
+
+        Args:
+            bbox: items intersecting this bbox (minx, miny, maxx, maxy), the
+                heights of 3D bboxes are ignored
+            collection: items of this collection
+            limit: maximum number of results
+            **conditions: conditions on the extension fields, by field name:
+                a value (equality), None (missing field), a list/tuple/set
+                of values (IN), or a `Range` (see `between()`)
+
+        Returns:
+            the (collection id, item id) of the matching items
+
+        """
+        clauses, params = [], []
+        for name, condition in conditions.items():
+            clause, values = self._condition(name, condition)
+            clauses.append(clause)
+            params.extend(values)
+        if collection is not None:
+            clauses.append("collection = ?")
+            params.append(collection)
+        if bbox is not None:
+            clauses.append("minx <= ? AND maxx >= ? AND miny <= ? AND maxy >= ?")
+            minx, miny, maxx, maxy = _bbox_2d(bbox)
+            params.extend((maxx, minx, maxy, miny))
+        sql = f"SELECT collection, id FROM {_quote(self.table)}"
+        if clauses:
+            sql += f" WHERE {' AND '.join(clauses)}"
+        if limit is not None:
+            sql += f" LIMIT {int(limit)}"
+        return self.connection.execute(sql, params).fetchall()
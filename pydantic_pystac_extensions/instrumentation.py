@@ -0,0 +1,209 @@
+"""Opt-in instrumentation of the extensions hot paths.
+
+When enabled, calls to `ext()`, `apply()`, `apply_many()`, `apply_assets()`,
+`read_assets()`, `get_schema()` and the construction of models from STAC
+objects (including trusted and multi-extension reads) are counted and timed
+per extension class, and reported to the registered callbacks (e.g. to
+export them to a metrics system). When disabled (the default), instrumented
+functions only pay for a flag check.
+
+Example:
+    with profile() as stats:
+        run_batch_job()
+    print(stats.summary())
+
+"""
+
+from bisect import bisect_left
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import functools
+import threading
+import time
+from typing import Any, Optional
+
+
+#: Upper bounds (in seconds) of the timing histograms buckets (the last bucket
+#: is unbounded)
+BUCKETS = (1e-6, 1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+Callback = Callable[[type, str, float, bool], Any]
+
+
+@dataclass
+class OpStats:
+    """Counters and timing histogram of an operation."""
+
+    count: int = 0
+    errors: int = 0
+    total_s: float = 0.0
+    max_s: float = 0.0
+    histogram: list[int] = field(default_factory=lambda: [0] * (len(BUCKETS) + 1))
+
+    def add(self, duration: float, error: bool):
+        """Record a call."""
+        self.count += 1
+        self.errors += error
+        self.total_s += duration
+        self.max_s = max(self.max_s, duration)
+        self.histogram[bisect_left(BUCKETS, duration)] += 1
+
+    @property
+    def mean_s(self) -> float:
+        """Mean duration of the calls."""
+        return self.total_s / self.count if self.count else 0.0
+
+
+class Stats:
+    """Statistics of the operations, per extension class."""
+
+    def __init__(self):
+        """Initializer."""
+        self._lock = threading.Lock()
+        self._ops: dict[tuple[type, str], OpStats] = {}
+
+    def add(self, ext_cls: type, op: str, duration: float, error: bool):
+        """Record a call."""
+        with self._lock:
+            key = (ext_cls, op)
+            if (op_stats := self._ops.get(key)) is None:
+                op_stats = self._ops[key] = OpStats()
+            op_stats.add(duration, error)
+
+    def get(self, ext_cls: type, op: str) -> OpStats:
+        """Get the statistics of an operation of an extension class."""
+        with self._lock:
+            return self._ops.get((ext_cls, op)) or OpStats()
+
+    def snapshot(self) -> dict[tuple[type, str], OpStats]:
+        """Get a copy of all the statistics."""
+        with self._lock:
+            return {
+                key: OpStats(s.count, s.errors, s.total_s, s.max_s, list(s.histogram))
+                for key, s in self._ops.items()
+            }
+
+    def reset(self):
+        """Reset all the statistics."""
+        with self._lock:
+            self._ops.clear()
+
+    def summary(self) -> str:
+        """Human readable summary of the statistics."""
+        lines = []
+        for (ext_cls, op), s in sorted(
+            self.snapshot().items(), key=lambda item: -item[1].total_s
+        ):
+            lines.append(
+                f"{ext_cls.__name__}.{op}: {s.count} calls ({s.errors} errors), "
+                f"total {s.total_s:.6f}s, mean {1e6 * s.mean_s:.2f}us, "
+                f"max {1e6 * s.max_s:.2f}us"
+            )
+        return "\n".join(lines)
+
+
+class _State:
+    """Instrumentation state."""
+
+    enabled = False
+    stats = Stats()
+    scoped: tuple[Stats, ...] = ()
+    callbacks: tuple[Callback, ...] = ()
+    lock = threading.Lock()
+
+
+def enable():
+    """Enable the instrumentation."""
+    _State.enabled = True
+
+
+def disable():
+    """Disable the instrumentation (except within `profile()` scopes)."""
+    _State.enabled = bool(_State.scoped)
+
+
+def is_enabled() -> bool:
+    """Whether the instrumentation is enabled."""
+    return _State.enabled
+
+
+def get_stats() -> Stats:
+    """Get the global statistics (recorded whenever the instrumentation is enabled)."""
+    return _State.stats
+
+
+def add_callback(callback: Callback):
+    """Register a callback called with (ext_cls, op, duration, error) on each call."""
+    with _State.lock:
+        _State.callbacks = (*_State.callbacks, callback)
+
+
+def remove_callback(callback: Callback):
+    """Unregister a callback."""
+    with _State.lock:
+        _State.callbacks = tuple(cb for cb in _State.callbacks if cb is not callback)
+
+
+@contextmanager
+def profile() -> Iterator[Stats]:
+    """Enable the instrumentation and collect the statistics of a scope."""
+    stats = Stats()
+    with _State.lock:
+        was_enabled = _State.enabled
+        _State.scoped = (*_State.scoped, stats)
+        _State.enabled = True
+    try:
+        yield stats
+    finally:
+        with _State.lock:
+            _State.scoped = tuple(s for s in _State.scoped if s is not stats)
+            _State.enabled = was_enabled or bool(_State.scoped)
+
+
+def record(ext_cls: type, op: str, duration: float, error: bool = False):
+    """Record a call of an operation."""
+    _State.stats.add(ext_cls, op, duration, error)
+    for stats in _State.scoped:
+        stats.add(ext_cls, op, duration, error)
+    for callback in _State.callbacks:
+        callback(ext_cls, op, duration, error)
+
+
+def _first_arg(cls, *_args, **_kwargs) -> type:
+    """Get the extension class of a class method call."""
+    return cls
+
+
+def instrumented(
+    op: str, get_ext_cls: Callable[..., Optional[type]] = _first_arg
+) -> Callable[[Callable], Callable]:
+    """Decorate a function to instrument its calls.
+
+    Args:
+        op: operation name
+        get_ext_cls: called with the arguments of the decorated function, returns
+            the extension class of the call, or None not to record it
+
+    """
+
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _State.enabled:
+                return func(*args, **kwargs)
+            ext_cls = get_ext_cls(*args, **kwargs)
+            if ext_cls is None:
+                return func(*args, **kwargs)
+            error = True
+            start = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+                error = False
+                return result
+            finally:
+                record(ext_cls, op, time.perf_counter() - start, error)
+
+        return wrapper
+
+    return decorator
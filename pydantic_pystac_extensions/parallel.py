@@ -0,0 +1,108 @@
+"""Parallel application and validation of extensions over large catalogs.
+
+STAC objects are shipped to the worker processes as dicts, in chunks, along
+with the extension class (pickled by reference, so it must be importable
+from the workers).
+"""
+
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+import itertools
+import os
+from typing import Any, Optional, Type, Union
+
+from pydantic import BaseModel
+import pystac.validation
+
+from .core import BaseExtension
+from .streaming import apply_dict
+
+
+@dataclass
+class ParallelResult:
+    """Result of the processing of one STAC dict."""
+
+    index: int
+    stac_dict: dict[str, Any]
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the STAC dict was processed without error."""
+        return self.error is None
+
+
+def _process_chunk(
+    ext_cls: Type[BaseExtension],
+    chunk: list[tuple[int, dict[str, Any], Any]],
+    validate: bool,
+) -> list[ParallelResult]:
+    """Apply and/or validate a chunk of STAC dicts (runs in the workers)."""
+    results = []
+    for index, stac_dict, value in chunk:
+        try:
+            if value is not None:
+                md = value if isinstance(value, ext_cls) else ext_cls(**dict(value))
+                apply_dict(ext_cls, stac_dict, md)
+            if validate:
+                pystac.validation.validate_dict(stac_dict)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            results.append(
+                ParallelResult(index, stac_dict, f"{type(err).__name__}: {err}")
+            )
+        else:
+            results.append(ParallelResult(index, stac_dict))
+    return results
+
+
+def parallel_apply(  # pylint: disable=too-many-arguments
+    ext_cls: Type[BaseExtension],
+    stac_dicts: Iterable[dict[str, Any]],
+    values: Union[None, BaseModel, dict[str, Any], Iterable[Any]] = None,
+    validate: bool = False,
+    max_workers: Optional[int] = None,
+    chunksize: int = 256,
+) -> Iterator[ParallelResult]:
+    """Apply and/or validate an extension over STAC dicts in worker processes.
+
+    Results are yielded in the order of `stac_dicts`. Errors do not stop the
+    processing: they are reported in the results. Only a few chunks per
+    worker are in flight at a time, so `stac_dicts` can be a lazy stream.
+
+    Args:
+        ext_cls: extension class
+        stac_dicts: items or collections as dicts
+        values: None to only validate, a single model (or dict of fields)
+            applied to every STAC dict, or an iterable of models (or dicts of
+            fields) matching `stac_dicts`
+        validate: validate the STAC dicts (after applying the values)
+        max_workers: number of worker processes (defaults to the CPU count)
+        chunksize: number of STAC dicts sent to a worker at a time
+
+    Yields:
+        one `ParallelResult` per STAC dict
+
+    """
+    if values is None or isinstance(values, (BaseModel, dict)):
+        values_iter: Iterable[Any] = itertools.repeat(values)
+    else:
+        values_iter = values
+    rows = (
+        (index, stac_dict, value)
+        for index, (stac_dict, value) in enumerate(
+            zip(stac_dicts, values_iter, strict=values_iter is values)
+        )
+    )
+
+    max_workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        max_pending = 2 * max_workers
+        pending: deque[Future] = deque()
+        while chunk := list(itertools.islice(rows, chunksize)):
+            pending.append(executor.submit(_process_chunk, ext_cls, chunk, validate))
+            if len(pending) >= max_pending:
+                yield from pending.popleft().result()
+        while pending:
+            yield from pending.popleft().result()
@@ -0,0 +1,135 @@
+"""Single-pass reader of several extensions of a STAC object.
+
+Reading several extensions with `BaseExtension(obj)` scans the fields of each
+extension in turn. A `MultiExtensionReader` merges the aliases of several
+extensions in one table, partitions the properties (items) or extra fields
+(assets, collections) of a STAC object in a single pass, and reports the
+keys that belong to none of the extensions.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Type, Union
+
+from pydantic import ValidationError
+
+from .core import BaseExtension, T, get_properties
+
+
+#: Fields of the STAC specification (item properties and common metadata)
+#: never reported as unknown
+STAC_COMMON_FIELDS = frozenset(
+    (
+        "datetime",
+        "start_datetime",
+        "end_datetime",
+        "created",
+        "updated",
+        "title",
+        "description",
+        "keywords",
+        "roles",
+        "license",
+        "providers",
+        "platform",
+        "instruments",
+        "constellation",
+        "mission",
+        "gsd",
+    )
+)
+
+
+@dataclass
+class MultiReadResult:
+    """Extensions read from a STAC object."""
+
+    #: Models of the extensions having fields in the STAC object, keyed by class
+    models: dict[Type[BaseExtension], BaseExtension] = field(default_factory=dict)
+    #: Keys of the STAC object belonging to none of the extensions
+    unknown: list[str] = field(default_factory=list)
+    #: Validation errors of the skipped extensions, keyed by class
+    errors: dict[Type[BaseExtension], ValidationError] = field(default_factory=dict)
+
+
+class MultiExtensionReader:
+    """Reader of several extensions of STAC objects in a single pass."""
+
+    __slots__ = ("classes", "ignore", "_targets")
+
+    def __init__(
+        self,
+        classes: Iterable[Type[BaseExtension]],
+        ignore: Iterable[str] = STAC_COMMON_FIELDS,
+    ):
+        """Initializer.
+
+        Args:
+            classes: extension classes to read
+            ignore: keys never reported as unknown
+
+        """
+        self.classes = tuple(dict.fromkeys(classes))
+        self.ignore = frozenset(ignore)
+        targets: dict[str, list[tuple[Type[BaseExtension], str]]] = {}
+        for ext_cls in self.classes:
+            for name, alias in ext_cls.get_layout().fields:
+                targets.setdefault(alias, []).append((ext_cls, name))
+        self._targets = {alias: tuple(t) for alias, t in targets.items()}
+
+    def partition(
+        self, props: dict[str, Any]
+    ) -> tuple[dict[Type[BaseExtension], dict[str, Any]], list[str]]:
+        """Partition the fields of a STAC object by extension.
+
+        Returns:
+            the values of the fields keyed by name, per extension class (empty
+            for the extensions without fields in `props`), and the unknown
+            keys
+
+        """
+        targets = self._targets
+        ignore = self.ignore
+        values: dict[Type[BaseExtension], dict[str, Any]] = {
+            ext_cls: {} for ext_cls in self.classes
+        }
+        unknown = []
+        for key, value in props.items():
+            key_targets = targets.get(key)
+            if key_targets is None:
+                if key not in ignore:
+                    unknown.append(key)
+            elif value is not None:
+                for ext_cls, name in key_targets:
+                    values[ext_cls][name] = value
+        return values, unknown
+
+    def read(
+        self, obj: Union[T, dict[str, Any]], skip_invalid: bool = False
+    ) -> MultiReadResult:
+        """Read the extensions of a STAC object.
+
+        Only the extensions having at least one field in the STAC object are
+        read. As with `BaseExtension(obj)`, the fields modified afterwards are
+        tracked (see `BaseExtension.changed_fields`).
+
+        Args:
+            obj: item, asset, collection, or STAC dict
+            skip_invalid: record the validation errors in the result instead
+                of raising
+
+        """
+        values, unknown = self.partition(get_properties(obj))
+        result = MultiReadResult(unknown=unknown)
+        for ext_cls in self.classes:
+            if not (cls_values := values[ext_cls]):
+                continue
+            try:
+                model = ext_cls._from_fields(cls_values)  # pylint: disable=protected-access
+            except ValidationError as error:
+                if not skip_invalid:
+                    raise
+                result.errors[ext_cls] = error
+            else:
+                result.models[ext_cls] = model
+        return result
@@ -0,0 +1,162 @@
+"""Registry of the extension classes, keyed by schema URI.
+
+Every `BaseExtension` subclass is registered when it is defined. Given the
+`stac_extensions` of a STAC object, the matching classes are then found with
+one dict lookup per listed URI instead of trying every class in turn.
+
+As in `pystac` (see `ExtensionManagementMixin.has_extension`), a class
+matches any version of its schema URI.
+
+Classes are referenced weakly: classes defined dynamically (e.g. in tests)
+are dropped from the registry once garbage collected.
+"""
+
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+import threading
+import weakref
+from typing import Any, Optional, Type, Union
+
+import pystac
+from pydantic import ValidationError
+from pystac.extensions.base import VERSION_REGEX
+
+from .core import BaseExtension, T, get_properties
+
+
+@lru_cache(maxsize=1024)
+def _version_prefix(uri: str) -> str:
+    """Part of a schema URI preceding its version."""
+    return VERSION_REGEX.split(uri)[0] + "/"
+
+
+def get_stac_extensions(obj: Union[T, dict[str, Any]]) -> list[str]:
+    """Get the schema URIs listed by a STAC object (or by the owner of an asset)."""
+    if isinstance(obj, pystac.Asset):
+        obj = obj.owner
+        if obj is None:
+            return []
+    if isinstance(obj, dict):
+        return obj.get("stac_extensions") or []
+    return obj.stac_extensions or []
+
+
+def _alive(refs: Iterable[weakref.ref]) -> Iterator[Type[BaseExtension]]:
+    """Classes of weak references, skipping the garbage collected ones."""
+    for ref in refs:
+        if (ext_cls := ref()) is not None:
+            yield ext_cls
+
+
+class ExtensionRegistry:
+    """Registry of extension classes."""
+
+    def __init__(self):
+        """Initializer."""
+        self._lock = threading.Lock()
+        #: Weak references to the classes (equal while the classes are alive)
+        self._classes: dict[weakref.ref, None] = {}
+        self._index: Optional[dict[str, tuple[weakref.ref, ...]]] = None
+
+    def register(self, ext_cls: Type[BaseExtension]):
+        """Register an extension class."""
+        with self._lock:
+            self._classes[weakref.ref(ext_cls, self._discard)] = None
+            self._index = None
+
+    def unregister(self, ext_cls: Type[BaseExtension]):
+        """Unregister an extension class."""
+        with self._lock:
+            self._classes.pop(weakref.ref(ext_cls), None)
+            self._index = None
+
+    def _discard(self, ref: weakref.ref):
+        """Forget a garbage collected class."""
+        # Not locked: called by the garbage collector, maybe within a locked block
+        self._classes.pop(ref, None)
+        self._index = None
+
+    def invalidate(self):
+        """Rebuild the index on next lookup, e.g. after a `__schema_uri__` change."""
+        self._index = None
+
+    @property
+    def classes(self) -> tuple[Type[BaseExtension], ...]:
+        """Registered classes, in registration order."""
+        return tuple(_alive(tuple(self._classes)))
+
+    def _get_index(self) -> dict[str, tuple[weakref.ref, ...]]:
+        """Get the classes references keyed by versionless schema URI, built once."""
+        index = self._index
+        if index is None:
+            with self._lock:
+                lists: dict[str, list[weakref.ref]] = {}
+                for ref in tuple(self._classes):
+                    ext_cls = ref()
+                    if ext_cls is not None and (uri := ext_cls.get_schema_uri()):
+                        lists.setdefault(_version_prefix(uri), []).append(ref)
+                index = {prefix: tuple(refs) for prefix, refs in lists.items()}
+                self._index = index
+        return index
+
+    def lookup(self, uri: str) -> tuple[Type[BaseExtension], ...]:
+        """Get the classes matching a schema URI."""
+        return tuple(_alive(self._get_index().get(_version_prefix(uri), ())))
+
+    def classes_for(self, obj: Union[T, dict[str, Any]]) -> list[Type[BaseExtension]]:
+        """Get the classes of the extensions listed by a STAC object."""
+        index = self._get_index()
+        found: dict[Type[BaseExtension], None] = {}
+        for uri in get_stac_extensions(obj):
+            for ext_cls in _alive(index.get(_version_prefix(uri), ())):
+                found[ext_cls] = None
+        return list(found)
+
+    def read_all(
+        self, obj: Union[T, dict[str, Any]], skip_invalid: bool = False
+    ) -> dict[Type[BaseExtension], BaseExtension]:
+        """Read all the known extensions listed by a STAC object.
+
+        Only the extensions having at least one field in the STAC object are
+        read: e.g. an item listing an extension applied to its assets only
+        does not carry its fields. As with `BaseExtension(obj)`, trusted reads
+        apply and the fields modified afterwards are tracked.
+
+        Args:
+            obj: item, asset, collection, or STAC dict
+            skip_invalid: skip the extensions that fail validation instead of
+                raising
+
+        Returns:
+            the extension models, keyed by class
+
+        """
+        props = get_properties(obj)
+        models = {}
+        for ext_cls in self.classes_for(obj):
+            if not (fields := ext_cls.get_layout().read(props)):
+                continue
+            try:
+                models[ext_cls] = ext_cls._from_fields(fields)  # pylint: disable=protected-access
+            except ValidationError:
+                if not skip_invalid:
+                    raise
+        return models
+
+
+_REGISTRY = ExtensionRegistry()
+
+
+def get_registry() -> ExtensionRegistry:
+    """Get the global registry."""
+    return _REGISTRY
+
+
+def read_all(
+    obj: Union[T, dict[str, Any]], skip_invalid: bool = False
+) -> dict[Type[BaseExtension], BaseExtension]:
+    """Read all the known extensions listed by a STAC object.
+
+    See `ExtensionRegistry.read_all`.
+    """
+    return _REGISTRY.read_all(obj, skip_invalid=skip_invalid)
@@ -1,11 +1,13 @@
 """Generate the json schema."""
 
-from typing import Type
-from pydantic import BaseModel
+from typing import TYPE_CHECKING, Type
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
 
 def generate_schema(
-    model_cls: Type[BaseModel], title: str, description: str, schema_uri: str
+    model_cls: Type["BaseModel"], title: str, description: str, schema_uri: str
 ) -> dict:
     """Generate the schema."""
     raw_schema = model_cls.model_json_schema()
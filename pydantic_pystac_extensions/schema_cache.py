@@ -0,0 +1,209 @@
+"""Local on-disk cache of remote JSON schemas.
+
+Schemas are stored content-addressed (by SHA-256 of their content) in a
+local directory, alongside a small entry per URL keeping the HTTP
+validators (ETag, Last-Modified) used to revalidate them. The cache can be
+used offline (e.g. on air-gapped nodes) once seeded, either by fetching
+the schemas or with `SchemaCache.seed()`.
+
+The default cache directory and offline mode can be set with the
+`PYDANTIC_PYSTAC_EXTENSIONS_SCHEMA_CACHE` and
+`PYDANTIC_PYSTAC_EXTENSIONS_OFFLINE` environment variables.
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+import tempfile
+import time
+from typing import Any, Optional, Union
+import urllib.error
+import urllib.request
+
+import pystac
+from pystac.validation.stac_validator import GetSchemaError, JsonSchemaSTACValidator
+
+
+CACHE_DIR_ENV = "PYDANTIC_PYSTAC_EXTENSIONS_SCHEMA_CACHE"
+OFFLINE_ENV = "PYDANTIC_PYSTAC_EXTENSIONS_OFFLINE"
+
+
+class SchemaNotCachedError(Exception):
+    """Raised when a schema is not in the cache and cannot be fetched."""
+
+
+def _sha256(data: bytes) -> str:
+    """SHA-256 hex digest."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def _write_atomic(path: Path, data: bytes):
+    """Write a file atomically, so that concurrent readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp:
+        tmp.write(data)
+    os.replace(tmp.name, path)
+
+
+class SchemaCache:
+    """Content-addressed on-disk cache of remote schemas."""
+
+    def __init__(
+        self,
+        directory: Union[str, Path, None] = None,
+        offline: Optional[bool] = None,
+        max_age: float = 3600.0,
+        timeout: float = 10.0,
+    ):
+        """Initializer.
+
+        Args:
+            directory: cache directory. Defaults to the
+                `PYDANTIC_PYSTAC_EXTENSIONS_SCHEMA_CACHE` environment variable,
+                or `~/.cache/pydantic-pystac-extensions/schemas`
+            offline: never access the network. Defaults to whether the
+                `PYDANTIC_PYSTAC_EXTENSIONS_OFFLINE` environment variable is set
+            max_age: cached schemas younger than this (in seconds) are used
+                without revalidation
+            timeout: HTTP requests timeout (in seconds)
+
+        """
+        if directory is None:
+            directory = os.environ.get(CACHE_DIR_ENV) or (
+                Path.home() / ".cache" / "pydantic-pystac-extensions" / "schemas"
+            )
+        if offline is None:
+            offline = os.environ.get(OFFLINE_ENV, "") not in ("", "0")
+        self.directory = Path(directory)
+        self.offline = offline
+        self.max_age = max_age
+        self.timeout = timeout
+
+    def _entry_path(self, url: str) -> Path:
+        """Path of the entry of an URL."""
+        return self.directory / "urls" / f"{_sha256(url.encode('utf-8'))}.json"
+
+    def _object_path(self, digest: str) -> Path:
+        """Path of a schema content."""
+        return self.directory / "objects" / f"{digest}.json"
+
+    def _read_entry(self, url: str) -> Optional[dict[str, Any]]:
+        """Read the entry of an URL, if any."""
+        try:
+            entry = json.loads(self._entry_path(url).read_bytes())
+        except (OSError, ValueError):
+            return None
+        return entry if self._object_path(entry["sha256"]).exists() else None
+
+    def _store(self, url: str, content: bytes, **validators: Optional[str]):
+        """Store a schema content and the entry of its URL."""
+        digest = _sha256(content)
+        path = self._object_path(digest)
+        if not path.exists():
+            _write_atomic(path, content)
+        entry = {"url": url, "sha256": digest, "fetched_at": time.time()}
+        entry.update(validators)
+        _write_atomic(self._entry_path(url), json.dumps(entry).encode("utf-8"))
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Get a cached schema content without any network access."""
+        entry = self._read_entry(url)
+        if entry is None:
+            return None
+        return self._object_path(entry["sha256"]).read_bytes()
+
+    def seed(self, url: str, schema: Union[bytes, str, dict[str, Any]]):
+        """Pre-seed the cache with the schema of an URL."""
+        if isinstance(schema, dict):
+            schema = json.dumps(schema, indent=2)
+        if isinstance(schema, str):
+            schema = schema.encode("utf-8")
+        self._store(url, schema)
+
+    def fetch(self, url: str) -> bytes:
+        """Get a schema content, from the cache or from the network.
+
+        Cached schemas older than `max_age` are revalidated with their ETag or
+        Last-Modified date. When the network is unavailable, the cached schema
+        is used whatever its age.
+
+        Raises:
+            SchemaNotCachedError: if the schema is neither cached nor
+                reachable
+
+        """
+        entry = self._read_entry(url)
+        if entry is not None and (
+            self.offline or time.time() - entry["fetched_at"] < self.max_age
+        ):
+            return self._object_path(entry["sha256"]).read_bytes()
+        if self.offline:
+            raise SchemaNotCachedError(f"{url} is not cached (offline mode)")
+
+        request = urllib.request.Request(url)
+        if entry is not None:
+            if entry.get("etag"):
+                request.add_header("If-None-Match", entry["etag"])
+            if entry.get("last_modified"):
+                request.add_header("If-Modified-Since", entry["last_modified"])
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                content = response.read()
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+        except urllib.error.HTTPError as err:
+            if err.code == 304 and entry is not None:
+                content = self._object_path(entry["sha256"]).read_bytes()
+                etag, last_modified = entry.get("etag"), entry.get("last_modified")
+            elif entry is not None and err.code >= 500:
+                return self._object_path(entry["sha256"]).read_bytes()
+            else:
+                raise SchemaNotCachedError(f"Cannot fetch {url}: {err}") from err
+        except OSError as err:
+            if entry is not None:
+                return self._object_path(entry["sha256"]).read_bytes()
+            raise SchemaNotCachedError(f"Cannot fetch {url}: {err}") from err
+
+        self._store(url, content, etag=etag, last_modified=last_modified)
+        return content
+
+    def fetch_json(self, url: str) -> dict[str, Any]:
+        """Get a schema as dict, from the cache or from the network."""
+        return json.loads(self.fetch(url))
+
+
+def get_default_cache() -> Optional[SchemaCache]:
+    """Get the cache configured with environment variables, if any."""
+    if os.environ.get(CACHE_DIR_ENV):
+        return SchemaCache()
+    return None
+
+
+class CachedSTACValidator(JsonSchemaSTACValidator):
+    """Pystac validator fetching schemas through a `SchemaCache`."""
+
+    def __init__(self, cache: Optional[SchemaCache] = None, **kwargs):
+        """Initializer."""
+        super().__init__(**kwargs)
+        self.cache = cache or SchemaCache()
+
+    def _get_schema(self, schema_uri: str) -> dict[str, Any]:
+        """Get a schema, from the pystac local schemas or from the cache."""
+        if schema_uri not in self.schema_cache:
+            try:
+                schema = self.cache.fetch_json(schema_uri)
+            except Exception as error:
+                raise GetSchemaError(schema_uri, error) from error
+            id_field = "$id" if "$id" in schema else "id"
+            if not schema[id_field].startswith("http"):
+                schema[id_field] = schema_uri
+            self.schema_cache[schema_uri] = schema
+        return self.schema_cache[schema_uri]
+
+
+def use_schema_cache(cache: Optional[SchemaCache] = None) -> CachedSTACValidator:
+    """Make pystac validation (e.g. `item.validate()`) use a schema cache."""
+    validator = CachedSTACValidator(cache)
+    pystac.validation.set_validator(validator)
+    return validator
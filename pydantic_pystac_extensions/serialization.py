@@ -0,0 +1,215 @@
+"""Direct serialization of extension metadata and STAC items to JSON bytes.
+
+The extension fields are serialized by pydantic-core straight from the
+models (`model_dump_json()`), then spliced into the JSON of the items, so
+that the metadata never goes through intermediate dicts. The rest of the
+items is serialized with `orjson` when installed (see the `json` extra), or
+with pydantic-core otherwise.
+
+Example:
+    with open("items.ndjson", "wb") as fp:
+        write_items_json(fp, items, ([md] for md in models))
+
+"""
+
+from collections.abc import Iterable
+from functools import cache, partial
+from typing import IO, Any, Optional, Type, Union, get_args
+import uuid
+
+import pystac
+from pydantic import BaseModel
+import pydantic_core
+
+from .core import DROPPED_ATTRIBUTES, BaseExtension
+
+
+BACKENDS = ("orjson", "pydantic")
+
+#: Placeholder of the properties of the items, spliced after serialization
+_MARKER = f"pydantic_pystac_extensions:{uuid.uuid4().hex}"
+_MARKER_JSON = f'"{_MARKER}"'.encode("utf-8")
+
+
+@cache
+def _get_dumps(backend: Optional[str]) -> Any:
+    """Get the function serializing python values to JSON bytes."""
+    if backend is None:
+        try:
+            import orjson  # pylint: disable=import-outside-toplevel,unused-import # noqa
+        except ImportError:
+            backend = "pydantic"
+        else:
+            backend = "orjson"
+    if backend == "orjson":
+        import orjson  # pylint: disable=import-outside-toplevel
+
+        # UTC datetimes written with "Z", as by pydantic (and pystac)
+        return partial(orjson.dumps, option=orjson.OPT_UTC_Z)
+    if backend == "pydantic":
+        return pydantic_core.to_json
+    raise ValueError(f"Unknown backend {backend}, use one of {', '.join(BACKENDS)}")
+
+
+def _has_nested_aliases(annotation: Any, seen: set) -> bool:
+    """Whether an annotation contains models having aliased fields."""
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        if annotation in seen:
+            return False
+        seen.add(annotation)
+        return any(
+            (info.alias is not None and info.alias != name)
+            or _has_nested_aliases(info.annotation, seen)
+            for name, info in annotation.model_fields.items()
+        )
+    return any(_has_nested_aliases(arg, seen) for arg in get_args(annotation))
+
+
+def _dumps_by_model(ext_cls: Type[BaseExtension]) -> bool:
+    """Whether the fields of a class can be serialized by `model_dump_json()`.
+
+    Extension fields are keyed by alias, but nested models are keyed by
+    field name (as written by `apply()`), which `model_dump_json()` cannot
+    do when nested models have aliases. Checked once per class.
+    """
+    by_model = ext_cls.__dict__.get("__ext_dumps_by_model__")
+    if by_model is None:
+        seen = {ext_cls}
+        by_model = not any(
+            _has_nested_aliases(info.annotation, seen)
+            for name, info in ext_cls.model_fields.items()
+            if name not in DROPPED_ATTRIBUTES
+        )
+        ext_cls.__ext_dumps_by_model__ = by_model
+    return by_model
+
+
+def fields_json(md: BaseExtension) -> bytes:
+    """Serialize the non-None extension fields of a model, keyed by alias.
+
+    Like `apply()`, only the top-level None values are dropped: the ones of
+    nested models are kept.
+
+    Returns:
+        the JSON object, as written in STAC objects by `apply()`
+
+    """
+    ext_cls = type(md)
+    if _dumps_by_model(ext_cls):
+        nones = {name for name in ext_cls.model_fields if getattr(md, name) is None}
+        return md.model_dump_json(
+            by_alias=True, exclude=DROPPED_ATTRIBUTES | nones
+        ).encode("utf-8")
+    values = md.model_dump(exclude=DROPPED_ATTRIBUTES)
+    return pydantic_core.to_json(
+        {
+            alias: value
+            for key, alias in ext_cls.get_layout().fields
+            if (value := values.get(key)) is not None
+        }
+    )
+
+
+def _merge_objects(objects: Iterable[bytes]) -> bytes:
+    """Merge JSON objects having distinct keys."""
+    return b"{" + b",".join(obj[1:-1] for obj in objects if obj != b"{}") + b"}"
+
+
+def item_json(
+    item: Union[pystac.Item, dict[str, Any]],
+    models: Iterable[BaseExtension] = (),
+    backend: Optional[str] = None,
+) -> bytes:
+    """Serialize an item, applying extension models on the fly.
+
+    The item is left unchanged: the fields of the models (and their schema
+    URIs) are spliced into its JSON, as if the models were applied.
+
+    Args:
+        item: item, or item as dict
+        models: extension models to apply
+        backend: "orjson" or "pydantic" (default: orjson when installed)
+
+    Returns:
+        the item as JSON bytes
+
+    """
+    dumps = _get_dumps(backend)
+    stac_dict = item if isinstance(item, dict) else item.to_dict()
+    models = list(models)
+    if not models:
+        return dumps(stac_dict)
+
+    props = stac_dict["properties"]
+    overridden = set()
+    stac_extensions = list(stac_dict.get("stac_extensions") or ())
+    for md in models:
+        overridden.update(
+            alias
+            for key, alias in md.get_layout().fields
+            if getattr(md, key) is not None
+        )
+        if (uri := md.get_schema_uri()) not in stac_extensions:
+            stac_extensions.append(uri)
+    props_json = _merge_objects(
+        [
+            dumps({k: v for k, v in props.items() if k not in overridden}),
+            *(fields_json(md) for md in models),
+        ]
+    )
+    stac_dict = {
+        **stac_dict,
+        "stac_extensions": stac_extensions,
+        "properties": _MARKER,
+    }
+    return dumps(stac_dict).replace(_MARKER_JSON, props_json, 1)
+
+
+def _with_models(
+    items: Iterable[Any], models: Optional[Iterable[Iterable[BaseExtension]]]
+) -> Iterable[tuple[Any, Iterable[BaseExtension]]]:
+    """Pair the items with their models (none when `models` is None)."""
+    if models is None:
+        return ((item, ()) for item in items)
+    return zip(items, models, strict=True)
+
+
+def write_items_json(
+    fp: IO[bytes],
+    items: Iterable[Union[pystac.Item, dict[str, Any]]],
+    models: Optional[Iterable[Iterable[BaseExtension]]] = None,
+    backend: Optional[str] = None,
+) -> int:
+    """Write items as NDJSON lines to a binary file.
+
+    Args:
+        fp: binary file
+        items: items, or items as dicts
+        models: extension models to apply to each item (see `item_json`)
+        backend: "orjson" or "pydantic" (default: orjson when installed)
+
+    Returns:
+        the number of items
+
+    """
+    count = 0
+    for item, item_models in _with_models(items, models):
+        fp.write(item_json(item, item_models, backend) + b"\n")
+        count += 1
+    return count
+
+
+def feature_collection_json(
+    items: Iterable[Union[pystac.Item, dict[str, Any]]],
+    models: Optional[Iterable[Iterable[BaseExtension]]] = None,
+    backend: Optional[str] = None,
+) -> bytes:
+    """Serialize items as a GeoJSON feature collection (e.g. a STAC API response).
+
+    See `write_items_json` for the arguments.
+    """
+    features = [
+        item_json(item, item_models, backend)
+        for item, item_models in _with_models(items, models)
+    ]
+    return b'{"type":"FeatureCollection","features":[' + b",".join(features) + b"]}"
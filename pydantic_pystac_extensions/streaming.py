@@ -0,0 +1,130 @@
+"""Streaming of extension metadata over STAC dicts (e.g. NDJSON dumps).
+
+STAC objects are processed one at a time as plain dicts, without building
+pystac objects, so that arbitrarily large dumps run in constant memory.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+import json
+from typing import IO, Any, Optional, Type
+
+from .core import BaseExtension, get_properties
+
+
+def read_ndjson(lines: Iterable[str | bytes]) -> Iterator[dict[str, Any]]:
+    """Parse STAC dicts from NDJSON lines (e.g. an opened file), skipping blanks."""
+    for line in lines:
+        if line.strip():
+            yield json.loads(line)
+
+
+def write_ndjson(fp: IO[str], stac_dicts: Iterable[dict[str, Any]]) -> int:
+    """Write STAC dicts as NDJSON lines, and return the number of lines."""
+    count = 0
+    for stac_dict in stac_dicts:
+        fp.write(json.dumps(stac_dict, separators=(",", ":")))
+        fp.write("\n")
+        count += 1
+    return count
+
+
+def read_dict(
+    ext_cls: Type[BaseExtension], fields: dict[str, Any]
+) -> Optional[BaseExtension]:
+    """Read the extension from the fields of a STAC dict.
+
+    Returns None when none of the extension fields are present.
+    """
+    kwargs = ext_cls.get_layout().read(fields)
+    return ext_cls(**kwargs) if kwargs else None
+
+
+def apply_dict(
+    ext_cls: Type[BaseExtension],
+    stac_dict: dict[str, Any],
+    md: BaseExtension,
+    asset_key: Optional[str] = None,
+    only_changed: bool = False,
+) -> bool:
+    """Apply the extension metadata to a STAC dict.
+
+    Args:
+        ext_cls: extension class
+        stac_dict: item or collection as dict
+        md: extension metadata
+        asset_key: apply to this asset of the STAC dict instead of the
+            object itself
+        only_changed: only write the fields assigned since `md` was read
+            (see `BaseExtension.changed_fields`)
+
+    Returns:
+        whether the STAC dict was modified
+
+    """
+    fields = (
+        get_properties(stac_dict)
+        if asset_key is None
+        else stac_dict["assets"][asset_key]
+    )
+    changed = ext_cls.get_layout().write(
+        fields, md, include=md.changed_fields if only_changed else None
+    )
+    schema_uri = ext_cls.get_schema_uri()
+    stac_extensions = stac_dict.setdefault("stac_extensions", [])
+    if schema_uri not in stac_extensions:
+        stac_extensions.append(schema_uri)
+        changed = True
+    return changed
+
+
+def iter_models(
+    ext_cls: Type[BaseExtension], stac_dicts: Iterable[dict[str, Any]]
+) -> Iterator[tuple[dict[str, Any], Optional[BaseExtension]]]:
+    """Yield STAC dicts with the extension read from their fields (or None)."""
+    for stac_dict in stac_dicts:
+        yield stac_dict, read_dict(ext_cls, get_properties(stac_dict))
+
+
+def iter_asset_models(
+    ext_cls: Type[BaseExtension], stac_dicts: Iterable[dict[str, Any]]
+) -> Iterator[tuple[dict[str, Any], dict[str, BaseExtension]]]:
+    """Yield STAC dicts with the extension read from their assets.
+
+    Assets which do not carry the extension are left out.
+    """
+    for stac_dict in stac_dicts:
+        models = {}
+        for key, asset in stac_dict.get("assets", {}).items():
+            if (md := read_dict(ext_cls, asset)) is not None:
+                models[key] = md
+        yield stac_dict, models
+
+
+def update_ndjson(
+    ext_cls: Type[BaseExtension],
+    src: Iterable[str | bytes],
+    dst: IO[str],
+    func: Callable[[dict[str, Any], Optional[BaseExtension]], Any],
+) -> int:
+    """Update the extension metadata of a NDJSON stream, line by line.
+
+    Args:
+        ext_cls: extension class
+        src: NDJSON lines (e.g. an opened file)
+        dst: output NDJSON file
+        func: called with each STAC dict and its current extension metadata
+            (None when missing). The metadata it returns is applied to the
+            STAC dict; returning None leaves the STAC dict unchanged.
+
+    Returns:
+        number of lines written
+
+    """
+
+    def _updated():
+        for stac_dict, md in iter_models(ext_cls, read_ndjson(src)):
+            if (new_md := func(stac_dict, md)) is not None:
+                apply_dict(ext_cls, stac_dict, new_md)
+            yield stac_dict
+
+    return write_ndjson(dst, _updated())
@@ -1,14 +1,27 @@
-"""Testing module."""
+"""Testing module.
 
+`requests` and the schema cache are only imported by the functions that use
+them, so that importing e.g. `create_dummy_item` stays cheap.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+import dataclasses
 import random
 import json
 import difflib
 from datetime import datetime
-import requests
+from typing import TYPE_CHECKING
 import pystac
 
 from pydantic_pystac_extensions.core import BaseExtension, T, DROPPED_ATTRIBUTES_NAMES
 
+if TYPE_CHECKING:
+    from pydantic_pystac_extensions.schema_cache import SchemaCache
+
 
 def create_dummy_item(date: datetime | None = None):
     """Create dummy item."""
@@ -83,6 +96,9 @@ def basic_test(  # pylint: disable = too-many-arguments, too-many-positional-arg
         print(f"Check extension applied to {stac_obj.__class__.__name__}")
         ext = ext_cls.ext(stac_obj, add_if_missing=True)
         ext.apply(**ext_md)
+        if validate:
+            # Offline validation against the schema generated from the model
+            ext_cls.get_validator().validate(stac_obj)
 
     def print_stac_obj(stac_obj: T):
         """Print item as JSON."""
@@ -152,11 +168,24 @@ def basic_test(  # pylint: disable = too-many-arguments, too-many-positional-arg
         test_collection()
 
 
-def is_schema_url_synced(cls):
-    """Check if the schema is in sync with the repository."""
+def is_schema_url_synced(cls, cache: SchemaCache | None = None):
+    """Check if the schema is in sync with the repository.
+
+    The remote schema is fetched through `cache` when provided, or through
+    the cache configured with environment variables, if any (see
+    `pydantic_pystac_extensions.schema_cache`).
+    """
+    # pylint: disable=import-outside-toplevel
+    import requests
+    from pydantic_pystac_extensions.schema_cache import get_default_cache
+
     local_schema = cls.get_schema()
     url = cls.get_schema_uri()
-    remote_schema = requests.get(url, timeout=10).json()
+    cache = cache or get_default_cache()
+    if cache:
+        remote_schema = cache.fetch_json(url)
+    else:
+        remote_schema = requests.get(url, timeout=10).json()
     print(
         f"Local schema is :\n"
         f"{local_schema}\n"
@@ -166,10 +195,126 @@ def is_schema_url_synced(cls):
     )
     if local_schema != remote_schema:
         print("Schema differs:")
+        print("\n".join(_schema_diff(local_schema, remote_schema)))
+        raise ValueError(f"Please update the schema located in {url}")
 
-        def _json2str(dic):
-            return json.dumps(dic, indent=2).split("\n")
 
-        diff = difflib.unified_diff(_json2str(local_schema), _json2str(remote_schema))
-        print("\n".join(diff))
-        raise ValueError(f"Please update the schema located in {url}")
+def _schema_diff(local_schema: dict, remote_schema: dict) -> list[str]:
+    """Unified diff between the local and the remote schemas."""
+
+    def _json2str(dic):
+        return json.dumps(dic, indent=2).split("\n")
+
+    return list(
+        difflib.unified_diff(
+            _json2str(local_schema),
+            _json2str(remote_schema),
+            fromfile="local",
+            tofile="remote",
+            lineterm="",
+        )
+    )
+
+
+@dataclasses.dataclass
+class SchemaSyncReport:
+    """Result of the check of an extension schema against its URL."""
+
+    ext_cls: type
+    url: str
+    synced: bool
+    diff: list[str] = dataclasses.field(default_factory=list)
+    error: str | None = None
+
+
+def _check_schemas(
+    classes: list[type],
+    max_connections: int,
+    cache: SchemaCache | None,
+    timeout: float,
+) -> list[SchemaSyncReport]:
+    """Check the schemas of extension classes, fetched in a thread pool."""
+    # pylint: disable=import-outside-toplevel
+    import requests
+    import requests.adapters
+    from pydantic_pystac_extensions.schema_cache import get_default_cache
+
+    cache = cache or get_default_cache()
+    with (
+        ThreadPoolExecutor(max_workers=max_connections) as executor,
+        requests.Session() as session,
+    ):
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=max_connections)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+        def _fetch(url: str) -> dict | Exception:
+            try:
+                if cache:
+                    return cache.fetch_json(url)
+                response = session.get(url, timeout=timeout)
+                response.raise_for_status()
+                return response.json()
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                return err
+
+        urls = [cls.get_schema_uri() for cls in classes]
+        unique_urls = list(dict.fromkeys(urls))
+        remote_schemas = dict(zip(unique_urls, executor.map(_fetch, unique_urls)))
+
+    reports = []
+    for cls, url in zip(classes, urls):
+        remote_schema = remote_schemas[url]
+        if isinstance(remote_schema, Exception):
+            reports.append(
+                SchemaSyncReport(
+                    cls,
+                    url,
+                    False,
+                    error=f"{type(remote_schema).__name__}: {remote_schema}",
+                )
+            )
+            continue
+        local_schema = cls.get_schema()
+        diff = (
+            _schema_diff(local_schema, remote_schema)
+            if local_schema != remote_schema
+            else []
+        )
+        reports.append(SchemaSyncReport(cls, url, not diff, diff))
+    return reports
+
+
+def check_all_schemas(
+    classes: Iterable[type],
+    max_connections: int = 8,
+    cache: SchemaCache | None = None,
+    timeout: float = 10.0,
+) -> list[SchemaSyncReport]:
+    """Check concurrently if the schemas of extension classes are in sync.
+
+    Each schema URL is fetched once, at most `max_connections` at a time (in
+    a thread pool), through `cache` when provided (or the cache configured
+    with environment variables, if any). Within a running event loop, use
+    `check_all_schemas_async` not to block it.
+
+    Returns:
+        one report per class, in the order of `classes`
+
+    """
+    return _check_schemas(list(classes), max_connections, cache, timeout)
+
+
+async def check_all_schemas_async(
+    classes: Iterable[type],
+    max_connections: int = 8,
+    cache: SchemaCache | None = None,
+    timeout: float = 10.0,
+) -> list[SchemaSyncReport]:
+    """Check concurrently if the schemas of extension classes are in sync.
+
+    Same as `check_all_schemas`, without blocking the running event loop.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        None, _check_schemas, list(classes), max_connections, cache, timeout
+    )
@@ -0,0 +1,185 @@
+"""Trusted reads: build models from STAC objects without validating them.
+
+For catalogs that were generated and validated beforehand, reading an
+extension only needs to map the aliases to the fields names. Trusted reads
+build the models directly from the values of the STAC object, as
+`BaseModel.model_construct()` does but a lot faster. The fields whose types
+are not plain JSON (e.g. nested models, datetimes, enums) are still
+validated on their own, so that the models hold values of the expected
+types. Validators and constraints of the other fields are not run. As with
+validated reads, lists and dicts are copied, so that modifying them in place
+leaves the STAC object unchanged (nested containers are shared, though).
+
+Trusted reads are enabled per call (`BaseExtension.read_trusted()`), per
+class (`__trusted__ = True`), or within a `trusted_reads()` block. To catch
+corrupted catalogs nonetheless, a percentage of the trusted reads can be
+fully validated instead (see `set_sample_rate()`, or the
+`PYDANTIC_PYSTAC_EXTENSIONS_TRUSTED_SAMPLE` environment variable).
+
+Example:
+    with trusted_reads():
+        models = [MyExtension(item) for item in items]
+
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+import os
+import random
+import types
+from typing import Any, Literal, Optional, Union, get_args, get_origin
+
+
+SAMPLE_RATE_ENV = "PYDANTIC_PYSTAC_EXTENSIONS_TRUSTED_SAMPLE"
+
+_MISSING = object()
+_TRUSTED: ContextVar[bool] = ContextVar("trusted_reads", default=False)
+_JSON_TYPES = (str, int, float, bool, type(None), Any)
+_JSON_CONTAINERS = (list, dict, Union, types.UnionType)
+#: Values copied when reading, not to share them with the STAC object
+_CONTAINERS = frozenset((list, dict))
+
+
+class _State:
+    """Trusted reads state."""
+
+    #: Percentage of the trusted reads that are fully validated instead
+    sample_rate = float(os.environ.get(SAMPLE_RATE_ENV) or 0.0)
+
+
+def set_sample_rate(percent: float):
+    """Fully validate `percent`% of the trusted reads (0 to disable)."""
+    if not 0.0 <= percent <= 100.0:
+        raise ValueError(f"Sample rate must be a percentage, got {percent}")
+    _State.sample_rate = percent
+
+
+def get_sample_rate() -> float:
+    """Percentage of the trusted reads that are fully validated."""
+    return _State.sample_rate
+
+
+@contextmanager
+def trusted_reads(enabled: bool = True) -> Iterator[None]:
+    """Enable (or disable) trusted reads within a block (of the current context)."""
+    token = _TRUSTED.set(enabled)
+    try:
+        yield
+    finally:
+        _TRUSTED.reset(token)
+
+
+def is_trusted(ext_cls: Any, trusted: Optional[bool] = None) -> bool:
+    """Whether reads of an extension class are trusted.
+
+    Args:
+        ext_cls: extension class
+        trusted: per call setting, overriding the context and class ones
+
+    """
+    if trusted is not None:
+        return trusted
+    return _TRUSTED.get() or ext_cls.__trusted__
+
+
+def _is_json_annotation(annotation: Any) -> bool:
+    """Whether values of an annotation are plain JSON values, as read."""
+    if annotation in _JSON_TYPES or annotation in (list, dict):
+        return True
+    origin = get_origin(annotation)
+    if origin is Literal:
+        return True
+    return origin in _JSON_CONTAINERS and all(
+        arg is Ellipsis or _is_json_annotation(arg) for arg in get_args(annotation)
+    )
+
+
+class TrustedLayout:
+    """How to build the models of an extension class without validation."""
+
+    __slots__ = ("template", "required", "factories", "adapters")
+
+    def __init__(self, ext_cls: Any):
+        """Initializer."""
+        # pylint: disable-next=import-outside-toplevel
+        from .view import _get_field_adapter
+
+        #: All the fields in order, with their default (if immutable)
+        self.template: dict[str, Any] = {}
+        self.required: frozenset[str] = frozenset(
+            name for name, info in ext_cls.model_fields.items() if info.is_required()
+        )
+        #: Fields with mutable defaults or default factories
+        self.factories: list[tuple[str, Any]] = []
+        #: Validators of the fields whose values are not plain JSON
+        self.adapters: dict[str, Any] = {}
+        for name, info in ext_cls.model_fields.items():
+            self.template[name] = _MISSING
+            if name == "properties":
+                continue
+            if not _is_json_annotation(info.annotation):
+                self.adapters[name] = _get_field_adapter(ext_cls, name)
+            if name in self.required:
+                continue
+            if info.default_factory is None and info.default.__hash__ is not None:
+                self.template[name] = info.default
+            else:
+                self.factories.append((name, info))
+
+
+def get_trusted_layout(ext_cls: Any) -> Optional[TrustedLayout]:
+    """Get the trusted layout of a class, built once per class.
+
+    Returns:
+        None when the models cannot be built without validation (models with
+        private attributes or `model_post_init`)
+
+    """
+    layout = ext_cls.__dict__.get("__ext_trusted_layout__", _MISSING)
+    if layout is _MISSING:
+        supported = (
+            not ext_cls.__private_attributes__
+            and ext_cls.__pydantic_post_init__ is None
+        )
+        layout = TrustedLayout(ext_cls) if supported else None
+        ext_cls.__ext_trusted_layout__ = layout
+    return layout
+
+
+def init_trusted(model: Any, fields: dict[str, Any]) -> bool:
+    """Initialize a model from the fields of a STAC object, without validation.
+
+    Args:
+        model: uninitialized model
+        fields: values read from the STAC object, keyed by field name
+
+    Returns:
+        False when the model must be validated instead: when the class is not
+        supported, when required fields are missing (so that validation
+        reports them), or when the read is sampled for validation
+
+    """
+    layout = get_trusted_layout(type(model))
+    if (
+        layout is None
+        or (_State.sample_rate and random.random() * 100.0 < _State.sample_rate)
+        or not layout.required <= fields.keys()
+    ):
+        return False
+    values = layout.template.copy()
+    for name, value in fields.items():
+        values[name] = value.copy() if type(value) in _CONTAINERS else value
+    for name, info in layout.factories:
+        if values[name] is _MISSING:
+            values[name] = info.get_default(call_default_factory=True)
+    for name, adapter in layout.adapters.items():
+        if name in fields:
+            values[name] = adapter.validate_python(fields[name])
+    values["properties"] = fields
+    # Same state as set by `BaseModel.model_construct()`
+    object.__setattr__(model, "__dict__", values)
+    object.__setattr__(model, "__pydantic_fields_set__", {*fields, "properties"})
+    object.__setattr__(model, "__pydantic_extra__", None)
+    object.__setattr__(model, "__pydantic_private__", None)
+    return True
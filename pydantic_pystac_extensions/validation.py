@@ -0,0 +1,90 @@
+"""Offline validation of STAC objects against an extension schema."""
+
+from collections.abc import Iterable, Iterator
+from typing import Any, Type, Union
+
+import pystac
+
+from .core import BaseExtension, T
+
+
+class ExtensionValidator:
+    """Validator of STAC objects, compiled once from the extension schema.
+
+    Unlike `pystac` validation, the schema is generated locally from the
+    extension model, so no network access is needed, and only the
+    extension schema is checked (not the core STAC schemas nor the other
+    extensions).
+    """
+
+    def __init__(self, ext_cls: Type[BaseExtension]):
+        """Initializer."""
+        try:
+            from jsonschema.validators import (  # pylint: disable=import-outside-toplevel
+                validator_for,
+            )
+        except ImportError as err:
+            raise ImportError(
+                "jsonschema is required for validation, install pystac[validation]"
+            ) from err
+
+        schema = ext_cls.get_schema()
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        self.ext_cls = ext_cls
+        self._validator = validator_cls(schema)
+        # Assets are validated against the fields definitions only
+        fields_schema = {key: value for key, value in schema.items() if key != "oneOf"}
+        fields_schema.update(schema["definitions"]["fields"])
+        self._fields_validator = validator_cls(fields_schema)
+
+    def iter_errors(self, obj: Union[T, dict[str, Any]]) -> Iterator[str]:
+        """Yield the validation error messages of a STAC object.
+
+        Args:
+            obj: item, asset or collection, as pystac object or dict. Dicts of
+                assets must not have a "type" member set to "Feature" or
+                "Collection", which would make them validated as items or
+                collections.
+
+        """
+        if isinstance(obj, pystac.Asset):
+            validator, instance = self._fields_validator, obj.extra_fields
+        elif isinstance(obj, (pystac.Item, pystac.Collection)):
+            validator = self._validator
+            instance = obj.to_dict(include_self_link=False, transform_hrefs=False)
+        elif isinstance(obj, dict):
+            is_stac = obj.get("type") in ("Feature", "Collection", "Catalog")
+            validator = self._validator if is_stac else self._fields_validator
+            instance = obj
+        else:
+            raise pystac.ExtensionTypeError(
+                f"{self.ext_cls.__name__} cannot validate type {type(obj).__name__}"
+            )
+        for error in validator.iter_errors(instance):
+            yield error.message
+
+    def is_valid(self, obj: Union[T, dict[str, Any]]) -> bool:
+        """Whether the STAC object is valid."""
+        return next(self.iter_errors(obj), None) is None
+
+    def validate(self, obj: Union[T, dict[str, Any]]):
+        """Validate a STAC object.
+
+        Raises:
+            pystac.STACValidationError: if the object is not valid
+
+        """
+        if errors := list(self.iter_errors(obj)):
+            raise pystac.STACValidationError(
+                f"Validation failed against {self.ext_cls.get_schema_uri()}: "
+                + "; ".join(errors),
+                source=errors,
+            )
+
+    def validate_many(
+        self, objs: Iterable[Union[T, dict[str, Any]]]
+    ) -> Iterator[tuple[Any, list[str]]]:
+        """Yield each STAC object with its list of validation error messages."""
+        for obj in objs:
+            yield obj, list(self.iter_errors(obj))
@@ -0,0 +1,148 @@
+"""Lazy views over the extension fields of STAC objects."""
+
+from typing import Annotated, Any, Type, Union
+
+from pydantic import TypeAdapter
+
+from .core import BaseExtension, T, get_properties
+
+
+def _get_field_adapter(ext_cls: Type[BaseExtension], name: str) -> TypeAdapter:
+    """Get the validator of a single field, built once per class and field."""
+    adapters = ext_cls.__dict__.get("__ext_field_adapters__")
+    if adapters is None:
+        adapters = {}
+        ext_cls.__ext_field_adapters__ = adapters
+    adapter = adapters.get(name)
+    if adapter is None:
+        info = ext_cls.model_fields[name]
+        annotation = (
+            Annotated[(info.annotation, *info.metadata)]
+            if info.metadata
+            else info.annotation
+        )
+        adapter = TypeAdapter(annotation)
+        adapters[name] = adapter
+    return adapter
+
+
+def _get_model_validated(ext_cls: Type[BaseExtension]) -> frozenset[str]:
+    """Get the fields that must be validated by the model, once per class.
+
+    Those are the fields with field validators, or all the fields when the
+    class has model validators or its own config, as validating them on
+    their own would give other values than the model does.
+    """
+    names = ext_cls.__dict__.get("__ext_model_validated__")
+    if names is None:
+        decorators = ext_cls.__pydantic_decorators__
+        if (
+            decorators.model_validators
+            or decorators.root_validators
+            or ext_cls.model_config != BaseExtension.model_config
+        ):
+            names = frozenset(ext_cls.get_layout().aliases_by_name)
+        else:
+            validated = [
+                field
+                for decorator in (
+                    *decorators.field_validators.values(),
+                    *decorators.validators.values(),
+                )
+                for field in decorator.info.fields
+            ]
+            names = frozenset(
+                ext_cls.get_layout().aliases_by_name if "*" in validated else validated
+            )
+        ext_cls.__ext_model_validated__ = names
+    return names
+
+
+class ExtensionView:
+    """Lazy view over the extension fields of a STAC object.
+
+    Fields are read from the properties (items) or extra fields (assets,
+    collections) of the STAC object on first access only, validated on their
+    own, then cached in the view. Setting a field validates it and writes it
+    back to the STAC object (setting None removes it).
+
+    Fields having validators (or all the fields, for classes with model
+    validators or their own config) are validated by the model instead, so
+    that views and models always hold the same values: the whole model is
+    then built on first access.
+
+    Missing fields default to the model defaults. Accessing a missing field
+    without default raises an `AttributeError`.
+    """
+
+    __slots__ = ("_ext_cls", "_aliases", "_props", "_values", "_model")
+
+    def __init__(self, ext_cls: Type[BaseExtension], obj: Union[T, dict[str, Any]]):
+        """Initializer."""
+        object.__setattr__(self, "_ext_cls", ext_cls)
+        object.__setattr__(self, "_aliases", ext_cls.get_layout().aliases_by_name)
+        object.__setattr__(self, "_props", get_properties(obj))
+        object.__setattr__(self, "_values", {})
+        object.__setattr__(self, "_model", None)
+
+    def _get_model(self) -> BaseExtension:
+        """Get the model of the STAC object, built once (until a field is set)."""
+        if self._model is None:
+            object.__setattr__(self, "_model", self.to_model())
+        return self._model
+
+    def __getattr__(self, name: str) -> Any:
+        """Get a field value, validated on first access."""
+        try:
+            return self._values[name]
+        except KeyError:
+            pass
+        alias = self._aliases.get(name)
+        if alias is None:
+            raise AttributeError(
+                f"{self._ext_cls.__name__} view has no attribute {name!r}"
+            )
+        raw = self._props.get(alias)
+        if raw is None:
+            info = self._ext_cls.model_fields[name]
+            if info.is_required():
+                raise AttributeError(f"{alias} is missing from the STAC object")
+            value = info.get_default(call_default_factory=True)
+        elif name in _get_model_validated(self._ext_cls):
+            value = getattr(self._get_model(), name)
+        else:
+            value = _get_field_adapter(self._ext_cls, name).validate_python(raw)
+        self._values[name] = value
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        """Validate a field value and write it to the STAC object."""
+        alias = self._aliases.get(name)
+        if alias is None:
+            raise AttributeError(
+                f"{self._ext_cls.__name__} view has no attribute {name!r}"
+            )
+        if value is None:
+            self._props.pop(alias, None)
+            self._values.pop(name, None)
+            object.__setattr__(self, "_model", None)
+            return
+        if name in _get_model_validated(self._ext_cls):
+            model = self._get_model()
+            self._ext_cls.__pydantic_validator__.validate_assignment(model, name, value)
+            value = getattr(model, name)
+            self._props[alias] = model.model_dump(include={name})[name]
+        else:
+            adapter = _get_field_adapter(self._ext_cls, name)
+            value = adapter.validate_python(value)
+            self._props[alias] = adapter.dump_python(value)
+            object.__setattr__(self, "_model", None)
+        self._values[name] = value
+
+    def to_model(self) -> BaseExtension:
+        """Build (and fully validate) the extension model."""
+        return self._ext_cls(**self._ext_cls.get_layout().read(self._props))
+
+    def __repr__(self) -> str:
+        """Representation."""
+        return f"<{self._ext_cls.__name__} view>"
@@ -0,0 +1,149 @@
+"""Lazy walker of static catalogs, reading items with a bounded thread pool.
+
+Catalog, collection and item links are followed lazily from the root
+catalog, without building pystac objects. Item files are read (and their
+extension read) in a thread pool so that file I/O overlaps, with only a
+window of items in flight at a time: memory stays bounded whatever the
+number of items in the catalog.
+
+Example:
+    for item_id, md in walk_models(MyExtension, "catalog/catalog.json"):
+        ...
+
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+import json
+import os
+from typing import Any, Optional, Type, TypeVar
+from urllib.parse import urljoin, urlparse
+
+from .core import BaseExtension, get_properties
+from .trusted import is_trusted
+
+
+R = TypeVar("R")
+
+ReadJson = Callable[[str], dict[str, Any]]
+
+
+def read_json_file(href: str) -> dict[str, Any]:
+    """Read a local JSON file (path or file:// URL)."""
+    parsed = urlparse(href)
+    path = parsed.path if parsed.scheme == "file" else href
+    with open(path, "rb") as f:
+        return json.loads(f.read())
+
+
+def _resolve(href: str, base: str) -> str:
+    """Resolve a link href relative to the href of the file holding it."""
+    if urlparse(base).scheme and not os.path.isabs(base):
+        return urljoin(base, href)
+    if urlparse(href).scheme or os.path.isabs(href):
+        return href
+    return os.path.normpath(os.path.join(os.path.dirname(base), href))
+
+
+def iter_item_hrefs(
+    root_href: str, read_json: ReadJson = read_json_file
+) -> Iterator[str]:
+    """Yield the hrefs of the items of a catalog, depth first, in links order.
+
+    Args:
+        root_href: href of the root catalog (or collection)
+        read_json: function reading a JSON file from its href
+
+    """
+    stack = [root_href]
+    visited = set()
+    while stack:
+        href = stack.pop()
+        if href in visited:
+            continue
+        visited.add(href)
+        children = []
+        for link in read_json(href).get("links", ()):
+            rel = link.get("rel")
+            if rel == "item":
+                yield _resolve(link["href"], href)
+            elif rel == "child":
+                children.append(_resolve(link["href"], href))
+        stack.extend(reversed(children))
+
+
+def walk_items(
+    root_href: str,
+    func: Callable[[dict[str, Any]], R],
+    max_workers: int = 8,
+    window: int = 256,
+    read_json: ReadJson = read_json_file,
+) -> Iterator[R]:
+    """Read the items of a catalog in a thread pool and yield `func(item)`.
+
+    Results are yielded in the order of the items in the catalog.
+
+    Args:
+        root_href: href of the root catalog (or collection)
+        func: function called (in the thread pool) with each item as dict
+        max_workers: number of threads
+        window: maximum number of items read ahead of the consumer
+        read_json: function reading a JSON file from its href
+
+    """
+
+    def _read(href: str) -> R:
+        return func(read_json(href))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future] = deque()
+        try:
+            for href in iter_item_hrefs(root_href, read_json):
+                pending.append(executor.submit(_read, href))
+                if len(pending) >= window:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def walk_models(  # pylint: disable=too-many-arguments
+    ext_cls: Type[BaseExtension],
+    root_href: str,
+    max_workers: int = 8,
+    window: int = 256,
+    read_json: ReadJson = read_json_file,
+    trusted: Optional[bool] = None,
+) -> Iterator[tuple[str, BaseExtension]]:
+    """Yield the ids of the items of a catalog, with their extension models.
+
+    Items without any of the extension fields are skipped.
+
+    Args:
+        ext_cls: extension class
+        root_href: href of the root catalog (or collection)
+        max_workers: number of threads
+        window: maximum number of items read ahead of the consumer
+        read_json: function reading a JSON file from its href
+        trusted: read the models without validation (see
+            `pydantic_pystac_extensions.trusted`), defaults to the class or
+            context setting
+
+    """
+    layout = ext_cls.get_layout()
+    # Resolved here, as the context of the caller is not the one of the threads
+    trusted = is_trusted(ext_cls, trusted)
+
+    def _read_model(item: dict[str, Any]) -> tuple[str, Optional[BaseExtension]]:
+        fields = layout.read(get_properties(item))
+        # pylint: disable-next=protected-access
+        return item["id"], ext_cls._from_fields(fields, trusted) if fields else None
+
+    for item_id, md in walk_items(
+        root_href, _read_model, max_workers, window, read_json
+    ):
+        if md is not None:
+            yield item_id, md
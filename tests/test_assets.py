@@ -0,0 +1,113 @@
+"""Test the bulk apply and read of extensions over assets."""
+
+import pystac
+from pydantic import Field
+import pytest
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+
+class BandExtension(BaseExtension):
+    """Band extension."""
+
+    __schema_uri__ = "https://example.com/band/v1.0.0/schema.json"
+    band: str = Field(alias="band:name")
+    scale: float = Field(alias="band:scale", default=1.0)
+
+
+def _create_item(nb_bands: int = 13) -> pystac.Item:
+    """Create an item with band assets."""
+    item, _ = create_dummy_item()
+    for i in range(nb_bands):
+        item.add_asset(f"B{i}", pystac.Asset(href=f"/tmp/B{i}.tif"))
+    return item
+
+
+def test_apply_read_assets():
+    """Test applying and reading per-asset models."""
+    item = _create_item()
+    values = {f"B{i}": {"band": f"B{i}", "scale": i} for i in range(13)}
+    assert BandExtension.apply_assets(item, values) == 13
+    assert BandExtension.has_extension(item)
+    assert item.stac_extensions.count(BandExtension.get_schema_uri()) == 1
+    assert item.assets["B3"].extra_fields == {"band:name": "B3", "band:scale": 3}
+
+    models = BandExtension.read_assets(item)
+    assert list(models) == list(values)
+    assert models["B3"] == BandExtension(item.assets["B3"])
+    assert models["B3"].changed_fields == frozenset()
+    assert BandExtension.read_assets(item, keys=["B1"]) == {
+        "B1": BandExtension(band="B1", scale=1)
+    }
+
+    # Nothing changes when applying the same values again
+    assert BandExtension.apply_assets(item, values) == 0
+    models["B2"].scale = 0.5
+    assert BandExtension.apply_assets(item, {"B2": models["B2"]}) == 1
+
+    # A single model applies to every asset
+    assert BandExtension.apply_assets(item, BandExtension(band="x")) == len(item.assets)
+    with pytest.raises(KeyError):
+        BandExtension.apply_assets(item, {"nope": {"band": "x"}})
+
+
+def test_apply_read_models():
+    """Test applying models read from the assets of another item."""
+    item = _create_item(3)
+    BandExtension.apply_assets(item, {f"B{i}": {"band": f"B{i}"} for i in range(3)})
+    models = BandExtension.read_assets(item)
+
+    other = _create_item(3)
+    assert BandExtension.apply_assets(other, models) == 3
+    assert BandExtension.read_assets(other) == models
+
+    models["B1"].scale = 2.0
+    other.assets["B1"].extra_fields["band:name"] = "renamed"
+    assert BandExtension.apply_assets(other, {"B1": models["B1"]}, only_changed=True)
+    assert other.assets["B1"].extra_fields == {"band:name": "renamed", "band:scale": 2}
+
+
+def test_item_assets():
+    """Test applying and reading collection item_assets definitions."""
+    _, col = create_dummy_item()
+    col.item_assets = {"B1": {"type": "image/tiff"}, "B2": {"roles": ["data"]}}
+    BandExtension.apply_assets(col, {"B1": BandExtension(band="B1")}, item_assets=True)
+    assert BandExtension.has_extension(col)
+    assert col.item_assets["B1"].properties["band:name"] == "B1"
+    assert BandExtension.read_assets(col, item_assets=True) == {
+        "B1": BandExtension(band="B1", scale=1.0)
+    }
+    with pytest.raises(pystac.ExtensionTypeError):
+        BandExtension.read_assets(_create_item(), item_assets=True)
+
+
+def test_read_does_not_modify():
+    """Test that reading assets leaves the STAC object unchanged."""
+    _, col = create_dummy_item()
+    col.extra_fields.pop("item_assets", None)
+    col_dict = col.to_dict()
+    assert not BandExtension.read_assets(col, item_assets=True)
+    assert col.to_dict() == col_dict
+    assert (
+        BandExtension.apply_assets(col, BandExtension(band="x"), item_assets=True) == 0
+    )
+    assert "item_assets" not in col.extra_fields
+    assert not BandExtension.has_extension(col)
+
+
+def test_missing_extension():
+    """Test that the owner is checked once."""
+    item = _create_item()
+    with pytest.raises(pystac.ExtensionNotImplemented):
+        BandExtension.apply_assets(item, BandExtension(band="x"), add_if_missing=False)
+
+
+def test_unknown_keys():
+    """Test that unknown asset keys are named in the errors."""
+    item = _create_item(2)
+    with pytest.raises(KeyError, match="No such assets: B3"):
+        BandExtension.read_assets(item, ["B1", "B3"])
+    with pytest.raises(KeyError, match="No such assets: B3"):
+        BandExtension.apply_assets(item, {"B3": BandExtension(band="x")})
+    assert not BandExtension.has_extension(item)
@@ -0,0 +1,18 @@
+"""Smoke test of the benchmark suite."""
+
+import json
+
+from benchmarks.suite import MODELS, compare, main, run_suite
+
+
+def test_suite(tmp_path):
+    """Run the suite on single objects and compare with itself."""
+    suite = run_suite(sizes=(1,))
+    for model in MODELS:
+        assert f"{model}/get_schema" in suite["results"]
+        assert f"{model}/read/1" in suite["results"]
+    assert compare(suite, suite) == []
+
+    output = tmp_path / "results.json"
+    assert main(["--sizes", "1", "--models", "small", "--output", str(output)]) == 0
+    assert "small/apply_md/1" in json.loads(output.read_text())["results"]
@@ -0,0 +1,76 @@
+"""Test columnar extraction of extension metadata."""
+
+from typing import List, Optional
+
+import pytest
+from pydantic import Field
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+
+class ColExtension(BaseExtension):
+    """Extension metadata model example."""
+
+    __schema_uri__ = "https://example.com/col/v1.0.0/schema.json"
+    label: str = Field(alias="col:label")
+    count: Optional[int] = Field(alias="col:count", default=None)
+    score: float = Field(alias="col:score")
+    valid: bool = Field(alias="col:valid")
+    tags: List[str] = Field(alias="col:tags")
+
+
+def _items():
+    """Create items carrying the extension."""
+    items = [create_dummy_item()[0] for _ in range(3)]
+    ColExtension.apply_many(
+        items,
+        [
+            {"label": "a", "count": 1, "score": 0.5, "valid": True, "tags": []},
+            {"label": "b", "score": 1.5, "valid": False, "tags": ["x"]},
+            {"label": "c", "count": 3, "score": 2.0, "valid": True, "tags": ["y"]},
+        ],
+    )
+    return items
+
+
+def test_list_columns():
+    """Test extraction as lists."""
+    items = _items()
+    columns = ColExtension.to_columns(items)
+    assert columns == {
+        "label": ["a", "b", "c"],
+        "count": [1, None, 3],
+        "score": [0.5, 1.5, 2.0],
+        "valid": [True, False, True],
+        "tags": [[], ["x"], ["y"]],
+    }
+    dicts = [item.to_dict() for item in items]
+    assert ColExtension.to_columns(dicts, by_alias=True)["col:count"] == [1, None, 3]
+    assets = [item.assets["ndvi"] for item in items]
+    assert ColExtension.to_columns(assets)["label"] == [None] * 3
+    with pytest.raises(ValueError):
+        ColExtension.to_columns(items, backend="csv")
+
+
+def test_numpy_columns():
+    """Test extraction as numpy arrays."""
+    np = pytest.importorskip("numpy")
+    columns = ColExtension.to_columns(_items(), backend="numpy")
+    assert columns["score"].dtype == np.float64
+    assert columns["valid"].dtype == np.bool_
+    assert columns["count"].dtype == np.int64
+    assert columns["count"].mask.tolist() == [False, True, False]
+    assert columns["count"].sum() == 4
+    assert columns["label"].tolist() == ["a", "b", "c"]
+    assert columns["tags"].tolist() == [[], ["x"], ["y"]]
+
+
+def test_arrow_columns():
+    """Test extraction as a pyarrow table."""
+    pa = pytest.importorskip("pyarrow")
+    table = ColExtension.to_columns(_items(), backend="arrow")
+    assert table.schema.field("count").type == pa.int64()
+    assert table.schema.field("label").type == pa.string()
+    assert table.column("count").null_count == 1
+    assert table.column("tags").to_pylist() == [[], ["x"], ["y"]]
@@ -1,5 +1,7 @@
 """Tests example."""
 
+from concurrent.futures import ThreadPoolExecutor
+import json
 from typing import Final, List, Optional
 
 import pystac
@@ -232,3 +234,186 @@ def test_ext_invalid_type():
     should_fail(
         MyExt.ext, args={"obj": 3}, exception_cls=pystac.errors.ExtensionTypeError
     )
+
+
+def test_ext_classes_reused():
+    """Test that the extension classes are built once per extension class."""
+    item, col = create_dummy_item()
+    ext1 = MyExt.ext(item, add_if_missing=True)
+    ext2 = MyExt.ext(item)
+    assert type(ext1) is type(ext2)
+    assert type(MyExt.ext(col, add_if_missing=True)) is not type(ext1)
+    assert type(MyOtherExtension.ext(item, add_if_missing=True)) is not type(ext1)
+    assert type(ext1).get_schema_uri() == MyExt.get_schema_uri()
+
+
+def test_layout():
+    """Test the compiled field/alias layout."""
+    layout = MyExtensionWAlias.get_layout()
+    assert layout is MyExtensionWAlias.get_layout()
+    assert layout.aliases == (NAME, AUTHORS, VERSION, OPT_FIELD)
+    assert layout.names_by_alias[NAME] == "name_custom"
+    assert MyExtensionWOAlias.get_layout().aliases == (
+        "name_custom",
+        "authors",
+        "version",
+        "opt_field",
+    )
+    props = {NAME: "a", AUTHORS: ["b"], OPT_FIELD: None, "foo": 1}
+    assert layout.read(props) == {"name_custom": "a", "authors": ["b"]}
+
+
+def test_apply_many():
+    """Test applying the extension to many STAC objects at once."""
+    items = pystac.ItemCollection([create_dummy_item()[0] for _ in range(3)])
+    MyOtherExtension.apply_many(items, {"orbit": 2})
+    for item in items:
+        assert MyOtherExtension.has_extension(item)
+        assert item.properties == {ORBIT: 2, RANDOM_NUMBER: 42}
+
+    MyOtherExtension.apply_many(
+        items, [MyOtherExtension(orbit=i) for i in range(2)] + [{ORBIT: 5}]
+    )
+    assert [MyOtherExtension(item).orbit for item in items] == [0, 1, 5]
+
+    assets = [item.assets["ndvi"] for item in items]
+    MyExtensionWAlias.apply_many(
+        assets, MyExtensionWAlias(name_custom="a", authors=[], version="1")
+    )
+    for item, asset in zip(items, assets):
+        assert MyExtensionWAlias.has_extension(item)
+        assert MyExtensionWAlias(asset).name_custom == "a"
+    assert assets[0].extra_fields[AUTHORS] is not assets[1].extra_fields[AUTHORS]
+
+    should_fail(
+        MyOtherExtension.apply_many,
+        [items, [{"orbit": 1}]],
+        exception_cls=ValueError,
+    )
+    should_fail(
+        MyOtherExtension.apply_many,
+        [items, [{"orbit": "a"}] * 3],
+        exception_cls=ValidationError,
+    )
+    should_fail(
+        MyOtherExtension.apply_many,
+        [[1], {"orbit": 1}],
+        exception_cls=pystac.ExtensionTypeError,
+    )
+
+
+def test_schema_cache():
+    """Test that the schema is generated once per class."""
+    schema = MyExtensionWAlias.get_schema()
+    assert schema == MyExtensionWAlias.get_schema()
+    assert schema is not MyExtensionWAlias.get_schema()
+    schema["title"] = "changed"
+    assert MyExtensionWAlias.get_schema()["title"] != "changed"
+
+    schema_json = MyExtensionWAlias.get_schema_json()
+    assert schema_json is MyExtensionWAlias.get_schema_json()
+    assert json.loads(schema_json) == MyExtensionWAlias.get_schema()
+    assert schema_json != MyOtherExtension.get_schema_json()
+    etag = MyExtensionWAlias.get_schema_etag()
+    assert etag.startswith('"') and etag != MyOtherExtension.get_schema_etag()
+    assert MyExtensionWAlias.get_schema_etag() is etag
+
+    MyExtensionWAlias.__schema_uri__ = SCHEMA_URI + "/changed"
+    try:
+        assert MyExtensionWAlias.get_schema()["$id"] == SCHEMA_URI
+        layout = MyExtensionWAlias.get_layout()
+        MyExtensionWAlias.invalidate_schema()
+        assert MyExtensionWAlias.get_schema()["$id"] == SCHEMA_URI + "/changed"
+        assert MyExtensionWAlias.get_schema_etag() != etag
+        assert MyExtensionWAlias.get_layout() is not layout
+    finally:
+        MyExtensionWAlias.__schema_uri__ = SCHEMA_URI
+        MyExtensionWAlias.invalidate_schema()
+    assert MyExtensionWAlias.get_schema_etag() == etag
+
+
+def test_incremental_apply():
+    """Test that only the modified fields are written."""
+    item, _ = create_dummy_item()
+    ext = MyOtherExtension.ext(item, add_if_missing=True)
+    assert ext.apply(orbit=1)
+    assert not ext.apply(orbit=1)
+    assert ext.apply(orbit=2, optional_number=3)
+
+    md = MyOtherExtension(item)
+    assert md.changed_fields == frozenset()
+    assert MyOtherExtension(orbit=2).changed_fields is None
+    assert md == MyOtherExtension(**MyOtherExtension(item).properties)
+    assert not ext.apply(md)
+
+    # Only the assigned fields are written when asked
+    random_number = item.properties[RANDOM_NUMBER]
+    item.properties[RANDOM_NUMBER] = 0
+    md.orbit = 5
+    assert md.changed_fields == {"orbit"}
+    assert ext.apply(md, only_changed=True)
+    assert item.properties == {ORBIT: 5, RANDOM_NUMBER: 0, OPTIONAL_NUMBER: 3}
+    assert not ext.apply(md, only_changed=True)
+    # By default, all the fields are written
+    assert ext.apply(md)
+    assert item.properties[RANDOM_NUMBER] == random_number
+    assert not ext.apply(md)
+
+    other, _ = create_dummy_item()
+    assert MyOtherExtension.apply_many([item, other], {"orbit": 6}) == 2
+    assert MyOtherExtension.apply_many([item, other], {"orbit": 6}) == 0
+
+
+def test_apply_read_model():
+    """Test applying models read from another STAC object, or copied."""
+    item, _ = create_dummy_item()
+    MyOtherExtension.ext(item, add_if_missing=True).apply(orbit=1, optional_number=2)
+    md = MyOtherExtension(item)
+
+    other, _ = create_dummy_item()
+    assert MyOtherExtension.ext(other, add_if_missing=True).apply(md)
+    assert MyOtherExtension(other) == md
+
+    updated = md.model_copy(update={"orbit": 7})
+    assert updated.changed_fields == {"orbit"}
+    assert md.changed_fields == frozenset()
+    assert MyOtherExtension.ext(item).apply(updated, only_changed=True)
+    assert MyOtherExtension(item).orbit == 7
+    assert MyOtherExtension.ext(other).apply(updated)
+    assert MyOtherExtension(other).orbit == 7
+
+    others = [create_dummy_item()[0] for _ in range(3)]
+    assert MyOtherExtension.apply_many(others, md) == 3
+    assert all(MyOtherExtension(obj) == md for obj in others)
+    assert MyOtherExtension.apply_many(others, updated, only_changed=True) == 3
+    assert all(MyOtherExtension(obj).orbit == 7 for obj in others)
+
+
+def test_threaded_ext():
+    """Test creating and applying extensions concurrently from many threads."""
+    items = [create_dummy_item()[0] for _ in range(200)]
+
+    def _apply(index):
+        item = items[index]
+        for ext_cls, args in (
+            (MyOtherExtension, {"orbit": index}),
+            (
+                MyExtensionWAlias,
+                {"name_custom": str(index), "authors": [], "version": "1"},
+            ),
+        ):
+            ext = ext_cls.ext(item, add_if_missing=True)
+            assert not hasattr(ext, "__dict__") or not ext.__dict__
+            assert type(ext).__name__ == f"Item{ext_cls.__name__}"
+            ext.apply(**args)
+            ext_cls.ext(item.assets["ndvi"]).apply(**args)
+        return index
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        assert list(executor.map(_apply, range(len(items)))) == list(range(len(items)))
+
+    for index, item in enumerate(items):
+        assert MyOtherExtension(item).orbit == index
+        assert MyOtherExtension(item.assets["ndvi"]).orbit == index
+        assert MyExtensionWAlias(item).name_custom == str(index)
+        assert MyExtensionWAlias.has_extension(item)
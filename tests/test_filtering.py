@@ -0,0 +1,135 @@
+"""Test the vectorized filtering of STAC objects on extension fields."""
+
+from typing import Optional
+
+import numpy as np
+from pydantic import Field
+import pytest
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.filtering import ExtensionFilter, Predicate, col
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+
+class FilteredExtension(BaseExtension):
+    """Filtered extension."""
+
+    __schema_uri__ = "https://example.com/filtered/v1.0.0/schema.json"
+    label: str = Field(alias="flt:label")
+    score: Optional[float] = Field(alias="flt:score", default=None)
+    count: int = Field(alias="flt:count", default=0)
+    valid: bool = Field(alias="flt:valid", default=True)
+    tags: list[str] = Field(alias="flt:tags", default=[])
+
+
+def _create_items(nb_items=30):
+    """Create items carrying the extension (except the last one)."""
+    items = []
+    for i in range(nb_items):
+        item, _ = create_dummy_item()
+        item.id = f"item{i}"
+        if i < nb_items - 1:
+            FilteredExtension.ext(item, add_if_missing=True).apply(
+                label=f"label{i % 3}",
+                score=i / 10 if i % 2 else None,
+                count=i,
+                valid=i % 4 == 0,
+                tags=[str(i)],
+            )
+        items.append(item)
+    return items
+
+
+def _expected(items, func):
+    """Ids of the items whose model satisfies a python condition."""
+    return [
+        item.id
+        for item in items
+        if FilteredExtension.has_extension(item) and func(FilteredExtension(item))
+    ]
+
+
+def test_predicates():
+    """Test comparisons, isin, is_null and their combinations."""
+    items = _create_items()
+    cases = [
+        (col("count") >= 20, lambda md: md.count >= 20),
+        (col("count") != 3, lambda md: md.count != 3),
+        (col("label") == "label1", lambda md: md.label == "label1"),
+        (col("score") < 1.0, lambda md: md.score is not None and md.score < 1.0),
+        (col("valid") == True, lambda md: md.valid),  # noqa: E712
+        (
+            (col("count") > 5) & col("label").isin(["label0", "label2"]),
+            lambda md: md.count > 5 and md.label in ("label0", "label2"),
+        ),
+        (
+            (col("count") < 3) | (col("score") > 2.5),
+            lambda md: md.count < 3 or (md.score is not None and md.score > 2.5),
+        ),
+    ]
+    for predicate, func in cases:
+        flt = ExtensionFilter(FilteredExtension, predicate)
+        selected = [item.id for item in flt.select(items, chunksize=7)]
+        assert selected == _expected(items, func), predicate
+
+    # Missing values only satisfy is_null() and negations
+    mask = ExtensionFilter(FilteredExtension, col("score").is_null()).mask(items)
+    assert mask.dtype == np.bool_
+    assert mask.tolist() == [i % 2 == 0 or i == 29 for i in range(30)]
+    mask = ExtensionFilter(FilteredExtension, ~(col("count") >= 10)).mask(items)
+    assert mask.tolist() == [i < 10 or i == 29 for i in range(30)]
+
+
+def test_invalid_values():
+    """Test that values not of the type of the field are missing values."""
+    items = [item.to_dict() for item in _create_items(5)]
+    items[0]["properties"]["flt:label"] = 5
+    items[1]["properties"]["flt:count"] = "x"
+    items[2]["properties"]["flt:count"] = 2**64
+    items[3]["properties"]["flt:count"] = True
+    flt = ExtensionFilter(FilteredExtension, col("count").is_null())
+    assert flt.mask(items).tolist() == [False, True, True, True, True]
+    flt = ExtensionFilter(FilteredExtension, col("label") == "5")
+    assert not flt.mask(items).any()
+    flt = ExtensionFilter(FilteredExtension, col("score") > 0)
+    assert flt.mask(items).tolist() == [False, True, False, True, False]
+
+
+def test_dicts():
+    """Test filtering items as dicts."""
+    items = [item.to_dict() for item in _create_items()]
+    flt = ExtensionFilter(FilteredExtension, col("count").isin([1, 2, 40]))
+    assert [item["id"] for item in flt.select(items)] == ["item1", "item2"]
+    assert not flt.mask([]).tolist()
+
+
+def test_type_checks():
+    """Test the predicates checks against the fields of the class."""
+    with pytest.raises(ValueError, match="no field"):
+        ExtensionFilter(FilteredExtension, col("nope") == 1)
+    with pytest.raises(ValueError, match="not a scalar field"):
+        ExtensionFilter(FilteredExtension, col("tags") == "a")
+    with pytest.raises(ValueError, match="cannot be ordered"):
+        ExtensionFilter(FilteredExtension, col("valid") > False)
+    with pytest.raises(TypeError, match="of type int"):
+        ExtensionFilter(FilteredExtension, (col("label") == "a") & (col("count") > 2.5))
+    with pytest.raises(TypeError, match="of type str"):
+        ExtensionFilter(FilteredExtension, col("label").isin(["a", 1]))
+    with pytest.raises(TypeError, match="truth value"):
+        bool(col("count") > 2)
+    # ints are valid float values
+    ExtensionFilter(FilteredExtension, col("score") > 2)
+
+
+def test_abstract_predicate():
+    """Test that incomplete predicates cannot be instantiated."""
+
+    class Incomplete(Predicate):  # pylint: disable=abstract-method
+        """Predicate without evaluation."""
+
+        def fields(self):
+            """No fields."""
+            return set()
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()
@@ -0,0 +1,76 @@
+"""Test fingerprints of the extension fields of STAC objects."""
+
+from datetime import datetime, timezone
+import json
+
+from pydantic import Field
+import pystac
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.fingerprint import canonical_json, fingerprints
+from pydantic_pystac_extensions.serialization import item_json
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+from tests.test_core import AUTHORS, NAME, VERSION, MyExtensionWAlias, MyOtherExtension
+
+
+def test_fingerprint():
+    """Test that fingerprints only depend on the extension metadata."""
+    item1, col = create_dummy_item()
+    item2, _ = create_dummy_item()
+    md = {"name_custom": "a", "authors": ["b"], "version": "1"}
+    MyExtensionWAlias.apply_many([item1, item2, col], md)
+    item2.properties["foo"] = "bar"
+    MyOtherExtension.apply_many([item2], {"orbit": 1})
+
+    fp1 = MyExtensionWAlias.fingerprint(item1)
+    assert len(fp1) == 32
+    assert MyExtensionWAlias.fingerprint(item2) == fp1
+    assert MyExtensionWAlias.fingerprint(col) == fp1
+    assert MyExtensionWAlias.fingerprint(item1.to_dict()) == fp1
+    assert MyOtherExtension.fingerprint(item1) != MyOtherExtension.fingerprint(item2)
+
+    # Key order does not matter
+    item2.properties = dict(reversed(item2.properties.items()))
+    assert MyExtensionWAlias.fingerprint(item2) == fp1
+
+    assert canonical_json(MyExtensionWAlias, item1) == (
+        f'{{"{AUTHORS}":["b"],"{NAME}":"a","{VERSION}":"1"}}'.encode()
+    )
+
+    item2.properties[VERSION] = "2"
+    assert list(fingerprints(MyExtensionWAlias, [item1, item2]))[1] != fp1
+
+
+def test_numbers():
+    """Test numbers normalization."""
+    item1, _ = create_dummy_item()
+    item2, _ = create_dummy_item()
+    item1.properties.update({"other_prefix:orbit": 1, "other_prefix:opt_number": 0.5})
+    item2.properties.update({"other_prefix:orbit": 1.0, "other_prefix:opt_number": 0.5})
+    assert MyOtherExtension.fingerprint(item1) == MyOtherExtension.fingerprint(item2)
+
+
+class DatedExtension(BaseExtension):
+    """Extension with a datetime field."""
+
+    __schema_uri__ = "https://example.com/dated/v1.0.0/schema.json"
+    processed: datetime = Field(alias="dated:processed")
+    versions: list[datetime] = Field(alias="dated:versions", default=[])
+
+
+def test_datetimes():
+    """Test that applied datetimes hash as their JSON serialization."""
+    item, _ = create_dummy_item()
+    processed = datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone.utc)
+    DatedExtension.ext(item, add_if_missing=True).apply(
+        processed=processed, versions=[processed]
+    )
+    assert isinstance(item.properties["dated:processed"], datetime)
+
+    fp = DatedExtension.fingerprint(item)
+    loaded = json.loads(item_json(item, backend="pydantic"))
+    assert isinstance(loaded["properties"]["dated:processed"], str)
+    assert DatedExtension.fingerprint(loaded) == fp
+    assert DatedExtension.fingerprint(pystac.Item.from_dict(loaded)) == fp
+    assert DatedExtension.fingerprint(pystac.Item.from_dict(item.to_dict())) == fp
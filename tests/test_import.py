@@ -0,0 +1,68 @@
+"""Test the import time of the package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import pydantic_pystac_extensions
+
+
+#: Import time budgets (in seconds), generous enough for slow CI runners
+BARE_IMPORT_BUDGET_S = 0.05
+
+
+def _run(code: str) -> str:
+    """Run python code in a fresh interpreter and get its output."""
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, check=True, text=True
+    ).stdout.strip()
+
+
+def _loaded_after(statement: str, modules: tuple[str, ...]) -> list[str]:
+    """Get which of `modules` are imported by `statement`."""
+    output = _run(
+        f"import sys\n{statement}\n"
+        f"print(','.join(m for m in {modules!r} if m in sys.modules))"
+    )
+    return [m for m in output.split(",") if m]
+
+
+def test_bare_import_is_lazy():
+    """Test that importing the package does not import its dependencies."""
+    assert not _loaded_after(
+        "import pydantic_pystac_extensions", ("pystac", "pydantic", "requests")
+    )
+
+
+def test_testing_import_is_lazy():
+    """Test that importing the testing helpers does not import requests."""
+    assert not _loaded_after(
+        "from pydantic_pystac_extensions.testing import create_dummy_item",
+        ("requests", "jsonschema"),
+    )
+
+
+def test_bare_import_time():
+    """Test that importing the package stays within its budget."""
+    duration = min(
+        float(
+            _run(
+                "import time\nstart = time.perf_counter()\n"
+                "import pydantic_pystac_extensions\n"
+                "print(time.perf_counter() - start)"
+            )
+        )
+        for _ in range(3)
+    )
+    assert duration < BARE_IMPORT_BUDGET_S
+
+
+def test_lazy_attributes():
+    """Test that the lazy attributes are loaded on access."""
+    from pydantic_pystac_extensions.core import BaseExtension  # pylint: disable=import-outside-toplevel
+
+    assert pydantic_pystac_extensions.BaseExtension is BaseExtension
+    assert "BaseExtension" in dir(pydantic_pystac_extensions)
+    with pytest.raises(AttributeError):
+        pydantic_pystac_extensions.Nope  # pylint: disable=pointless-statement
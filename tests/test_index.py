@@ -0,0 +1,105 @@
+"""Test the SQLite index of extension fields."""
+
+import io
+import json
+from typing import Optional
+
+from pydantic import Field
+import pytest
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.index import ExtensionIndex, between
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+
+class IndexedExtension(BaseExtension):
+    """Indexed extension."""
+
+    __schema_uri__ = "https://example.com/indexed/v1.0.0/schema.json"
+    label: str = Field(alias="idx:label")
+    score: Optional[float] = Field(alias="idx:score", default=None)
+    count: int = Field(alias="idx:count", default=0)
+    valid: bool = Field(alias="idx:valid", default=True)
+    tags: list[str] = Field(alias="idx:tags", default=[])
+
+
+def _create_items(nb_items=50):
+    """Create items carrying the extension."""
+    items = []
+    for i in range(nb_items):
+        item, _ = create_dummy_item()
+        item.id = f"item{i}"
+        item.collection_id = "col"
+        item.bbox = [i, 0, i + 1, 1]
+        IndexedExtension.ext(item, add_if_missing=True).apply(
+            label=f"label{i % 5}",
+            score=i / 10 if i % 2 else None,
+            count=i,
+            valid=i % 3 == 0,
+            tags=[str(i)],
+        )
+        items.append(item)
+    return items
+
+
+def test_queries():
+    """Test equality, range and IN queries."""
+    index = ExtensionIndex(IndexedExtension)
+    assert index.add(_create_items()) == 50
+    assert len(index) == 50
+
+    def _ids(**conditions):
+        return sorted(int(i[4:]) for _, i in index.query(**conditions))
+
+    assert _ids(label="label2") == list(range(2, 50, 5))
+    assert _ids(count=between(10, 12)) == [10, 11, 12]
+    assert _ids(count=between(high=1)) == [0, 1]
+    assert _ids(score=between(4.5)) == [45, 47, 49]
+    assert _ids(label=["label1", "label3"], valid=True) == [3, 6, 18, 21, 33, 36, 48]
+    assert _ids(bbox=[10.5, 0, 12.5, 1]) == [10, 11, 12]
+    assert _ids(collection="other") == []
+    assert len(index.query(limit=3)) == 3
+    assert index.query(count=7) == [("col", "item7")]
+    assert _ids(score=None, count=between(high=6)) == [0, 2, 4, 6]
+
+    with pytest.raises(ValueError):
+        index.query(tags="1")
+    with pytest.raises(ValueError):
+        index.query(nope=1)
+    with pytest.raises(TypeError):
+        index.query(count="1")
+
+
+def test_incremental(tmp_path):
+    """Test incremental updates, NDJSON loading and persistence."""
+    path = str(tmp_path / "index.sqlite")
+    items = _create_items(10)
+    index = ExtensionIndex(IndexedExtension, path)
+    index.add(items[:5])
+    lines = io.StringIO("\n".join(json.dumps(item.to_dict()) for item in items[5:]))
+    assert index.add_ndjson(lines) == 5
+
+    IndexedExtension.ext(items[0]).apply(label="renamed")
+    index.add(items[:1])
+    assert index.query(label="renamed") == [("col", "item0")]
+    assert index.remove(["item1", "item2"], collection="col") == 2
+    index.close()
+
+    index = ExtensionIndex(IndexedExtension, path)
+    assert len(index) == 8
+    assert index.query(count=between(1, 3)) == [("col", "item3")]
+
+
+def test_3d_bbox():
+    """Test that the heights of 3D bboxes are ignored."""
+    index = ExtensionIndex(IndexedExtension)
+    items = _create_items(3)
+    for i, item in enumerate(items):
+        item.bbox = [i, 0, -10, i + 1, 1, 10]
+    index.add(items)
+    assert index.query(bbox=[1.5, 0.5, 2.5, 0.6]) == [
+        ("col", "item1"),
+        ("col", "item2"),
+    ]
+    assert index.query(bbox=[2.5, 0, -1, 3, 1, 1]) == [("col", "item2")]
+    assert index.query(bbox=[1.5, 2, 2.5, 3]) == []
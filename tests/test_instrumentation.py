@@ -0,0 +1,88 @@
+"""Test the instrumentation of the extensions hot paths."""
+
+import pytest
+
+from pydantic_pystac_extensions import instrumentation
+from pydantic_pystac_extensions.reader import MultiExtensionReader
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+from tests.test_core import MyExt, MyOtherExtension
+
+
+def test_disabled():
+    """Test that nothing is recorded when disabled."""
+    instrumentation.get_stats().reset()
+    assert not instrumentation.is_enabled()
+    item, _ = create_dummy_item()
+    MyOtherExtension.ext(item, add_if_missing=True).apply(orbit=1)
+    assert not instrumentation.get_stats().snapshot()
+
+
+def test_profile():
+    """Test scoped profiling and callbacks."""
+    calls = []
+
+    def _callback(ext_cls, op, duration, error):
+        calls.append((ext_cls, op, error))
+        assert duration >= 0
+
+    item, _ = create_dummy_item()
+    instrumentation.add_callback(_callback)
+    try:
+        with instrumentation.profile() as stats:
+            assert instrumentation.is_enabled()
+            ext = MyOtherExtension.ext(item, add_if_missing=True)
+            ext.apply(orbit=1)
+            MyOtherExtension(item)
+            MyOtherExtension(orbit=2)
+            MyExt.get_schema()
+            with pytest.raises(ValueError):
+                ext.apply()
+    finally:
+        instrumentation.remove_callback(_callback)
+    assert not instrumentation.is_enabled()
+
+    assert stats.get(MyOtherExtension, "ext").count == 1
+    apply_stats = stats.get(MyOtherExtension, "apply")
+    assert (apply_stats.count, apply_stats.errors) == (2, 1)
+    assert sum(apply_stats.histogram) == 2
+    assert stats.get(MyOtherExtension, "read").count == 1
+    assert stats.get(MyExt, "get_schema").count == 1
+    assert (MyOtherExtension, "apply", True) in calls
+    assert len(calls) == 5
+    assert "MyOtherExtension.apply: 2 calls (1 errors)" in stats.summary()
+
+    # Global statistics are recorded as well, until reset
+    assert instrumentation.get_stats().get(MyOtherExtension, "ext").count >= 1
+    instrumentation.get_stats().reset()
+    assert not instrumentation.get_stats().snapshot()
+
+
+def test_enable_disable():
+    """Test enabling the instrumentation globally."""
+    instrumentation.get_stats().reset()
+    item, _ = create_dummy_item()
+    instrumentation.enable()
+    try:
+        MyOtherExtension.ext(item, add_if_missing=True)
+    finally:
+        instrumentation.disable()
+    assert instrumentation.get_stats().get(MyOtherExtension, "ext").count == 1
+    instrumentation.get_stats().reset()
+
+
+def test_bulk_calls():
+    """Test that bulk applies and reads are recorded."""
+    items = [create_dummy_item()[0] for _ in range(3)]
+    with instrumentation.profile() as stats:
+        MyOtherExtension.apply_many(items, MyOtherExtension(orbit=1))
+        MyOtherExtension.apply_assets(items[0], MyOtherExtension(orbit=2))
+        MyOtherExtension.read_assets(items[0])
+        MyOtherExtension.read_trusted(items[0])
+        MultiExtensionReader([MyOtherExtension]).read(items[1])
+    assert stats.get(MyOtherExtension, "apply_many").count == 1
+    assert stats.get(MyOtherExtension, "apply_assets").count == 1
+    assert stats.get(MyOtherExtension, "read_assets").count == 1
+    assert stats.get(MyOtherExtension, "read").count == 2 + len(items[0].assets)
+    assert "MyOtherExtension.apply_many: 1 calls" in stats.summary()
+    instrumentation.get_stats().reset()
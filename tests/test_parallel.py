@@ -0,0 +1,30 @@
+"""Test parallel application and validation of extensions."""
+
+from pydantic_pystac_extensions.parallel import parallel_apply
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+from tests.test_core import ORBIT, MyOtherExtension
+
+
+def test_parallel_apply():
+    """Test applying an extension in worker processes."""
+    stac_dicts = [create_dummy_item()[0].to_dict() for _ in range(10)]
+    values = [{"orbit": i} for i in range(9)] + [{"orbit": "a"}]
+    results = list(
+        parallel_apply(
+            MyOtherExtension, iter(stac_dicts), values, max_workers=2, chunksize=3
+        )
+    )
+    assert [res.index for res in results] == list(range(10))
+    assert [res.stac_dict["id"] for res in results] == [d["id"] for d in stac_dicts]
+    assert all(res.ok for res in results[:9])
+    assert [res.stac_dict["properties"][ORBIT] for res in results[:9]] == list(range(9))
+    assert "ValidationError" in results[9].error
+
+
+def test_parallel_validate():
+    """Test validating STAC dicts in worker processes."""
+    stac_dicts = [create_dummy_item()[0].to_dict() for _ in range(3)]
+    del stac_dicts[1]["geometry"]
+    results = list(parallel_apply(MyOtherExtension, stac_dicts, validate=True))
+    assert [res.ok for res in results] == [True, False, True]
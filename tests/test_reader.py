@@ -0,0 +1,68 @@
+"""Test the multi-extension reader."""
+
+from pydantic import Field
+import pytest
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.reader import MultiExtensionReader
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+
+class FirstExtension(BaseExtension):
+    """First extension."""
+
+    __schema_uri__ = "https://example.com/first/v1.0.0/schema.json"
+    label: str = Field(alias="first:label")
+    count: int = Field(alias="first:count", default=0)
+
+
+class SecondExtension(BaseExtension):
+    """Second extension."""
+
+    __schema_uri__ = "https://example.com/second/v1.0.0/schema.json"
+    ratio: float = Field(alias="second:ratio")
+
+
+class ThirdExtension(BaseExtension):
+    """Third extension, absent from the items."""
+
+    __schema_uri__ = "https://example.com/third/v1.0.0/schema.json"
+    flag: bool = Field(alias="third:flag")
+
+
+def test_read():
+    """Test reading several extensions in a single pass."""
+    item, _ = create_dummy_item()
+    FirstExtension.ext(item, add_if_missing=True).apply(label="a", count=2)
+    SecondExtension.ext(item, add_if_missing=True).apply(ratio=0.5)
+    item.properties["stray:field"] = 1
+
+    reader = MultiExtensionReader([FirstExtension, SecondExtension, ThirdExtension])
+    result = reader.read(item)
+    assert result.models == {
+        FirstExtension: FirstExtension(item),
+        SecondExtension: SecondExtension(item),
+    }
+    assert result.unknown == ["stray:field"]
+    assert not result.errors
+    assert result.models[FirstExtension].changed_fields == frozenset()
+    assert reader.read(item.to_dict()).models == result.models
+
+    reader = MultiExtensionReader([FirstExtension], ignore=())
+    assert set(reader.read(item).unknown) == {
+        "datetime",
+        "second:ratio",
+        "stray:field",
+    }
+
+
+def test_read_invalid():
+    """Test the validation errors."""
+    item, _ = create_dummy_item()
+    item.properties.update({"first:count": "nope", "second:ratio": 1.0})
+    reader = MultiExtensionReader([FirstExtension, SecondExtension])
+    with pytest.raises(ValueError):
+        reader.read(item)
+    result = reader.read(item, skip_invalid=True)
+    assert list(result.errors) == [FirstExtension]
+    assert result.models == {SecondExtension: SecondExtension(ratio=1.0)}
@@ -0,0 +1,119 @@
+"""Test the extensions registry."""
+
+import gc
+
+from pydantic import Field
+import pytest
+
+from pydantic_pystac_extensions import BaseExtension, read_all
+from pydantic_pystac_extensions.registry import ExtensionRegistry, get_registry
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+
+class RegAExtension(BaseExtension):
+    """First registered extension."""
+
+    __schema_uri__ = "https://example.com/reg-a/v1.0.0/schema.json"
+    label: str = Field(alias="reg-a:label")
+
+
+class RegBExtension(BaseExtension):
+    """Second registered extension."""
+
+    __schema_uri__ = "https://example.com/reg-b/v1.1.0/schema.json"
+    count: int = Field(alias="reg-b:count")
+
+
+def test_auto_registration():
+    """Test that subclasses are registered when defined."""
+    registry = get_registry()
+    assert {RegAExtension, RegBExtension} <= set(registry.classes)
+    assert registry.lookup(RegAExtension.get_schema_uri()) == (RegAExtension,)
+    # Any version of the schema URI matches, as in pystac
+    assert registry.lookup("https://example.com/reg-b/v2.0.0/schema.json") == (
+        RegBExtension,
+    )
+    assert not registry.lookup("https://example.com/unknown/v1.0.0/schema.json")
+
+
+def test_read_all():
+    """Test reading all the extensions of items, assets and dicts."""
+    item, _ = create_dummy_item()
+    assert not read_all(item)
+    RegAExtension.ext(item, add_if_missing=True).apply(label="a")
+    RegBExtension.ext(item, add_if_missing=True).apply(count=3)
+    asset = item.assets[next(iter(item.assets))]
+    RegAExtension.ext(asset).apply(label="asset")
+
+    assert read_all(item) == {
+        RegAExtension: RegAExtension(label="a"),
+        RegBExtension: RegBExtension(count=3),
+    }
+    assert read_all(item.to_dict()) == read_all(item)
+    # Extensions listed by the owner without fields in the asset are skipped
+    assert read_all(asset) == {RegAExtension: RegAExtension(label="asset")}
+    asset.extra_fields["reg-b:count"] = "x"
+    assert read_all(asset, skip_invalid=True) == {
+        RegAExtension: RegAExtension(label="asset")
+    }
+    with pytest.raises(ValueError):
+        read_all(asset)
+
+
+def test_read_all_assets_only():
+    """Test reading an item listing an extension applied to its assets only."""
+    item, _ = create_dummy_item()
+    RegBExtension.apply_assets(item, RegBExtension(count=1))
+    assert RegBExtension.has_extension(item)
+    assert not read_all(item)
+    assert read_all(item.to_dict()) == {}
+    model = read_all(item.assets["ndvi"])[RegBExtension]
+    assert model == RegBExtension(count=1)
+    assert model.changed_fields == frozenset()
+
+
+def test_registry_reindex():
+    """Test registering classes and reindexing on schema URI change."""
+    registry = ExtensionRegistry()
+    registry.register(RegAExtension)
+    item, _ = create_dummy_item()
+    RegAExtension.add_to(item)
+    RegBExtension.add_to(item)
+    assert registry.classes_for(item) == [RegAExtension]
+
+    registry.register(RegBExtension)
+    assert registry.classes_for(item) == [RegAExtension, RegBExtension]
+    registry.unregister(RegAExtension)
+    assert registry.classes_for(item) == [RegBExtension]
+
+    uri = RegBExtension.__schema_uri__
+    RegBExtension.__schema_uri__ = "https://example.com/reg-c/v1.0.0/schema.json"
+    try:
+        registry.invalidate()
+        assert not registry.classes_for(item)
+    finally:
+        RegBExtension.__schema_uri__ = uri
+        registry.invalidate()
+    assert registry.classes_for(item) == [RegBExtension]
+
+
+def test_garbage_collected():
+    """Test that classes are dropped from the registry once collected."""
+    uri = "https://example.com/reg-tmp/v1.0.0/schema.json"
+
+    def _define():
+        class RegTmpExtension(BaseExtension):
+            """Temporary extension."""
+
+            __schema_uri__ = uri
+            label: str = Field(alias="reg-tmp:label")
+
+        return RegTmpExtension
+
+    ext_cls = _define()
+    registry = get_registry()
+    assert registry.lookup(uri) == (ext_cls,)
+    del ext_cls
+    gc.collect()
+    assert not registry.lookup(uri)
+    assert all(cls.__name__ != "RegTmpExtension" for cls in registry.classes)
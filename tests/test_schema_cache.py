@@ -0,0 +1,67 @@
+"""Test the local cache of remote schemas."""
+
+import pystac
+import pytest
+
+from pydantic_pystac_extensions.schema_cache import (
+    CachedSTACValidator,
+    SchemaCache,
+    SchemaNotCachedError,
+    use_schema_cache,
+)
+from pydantic_pystac_extensions.testing import create_dummy_item, is_schema_url_synced
+
+from tests.test_core import MyOtherExtension
+from tests.utils import SchemaServer
+
+
+def test_fetch_and_revalidate(tmp_path):
+    """Test fetching, revalidating and offline use of cached schemas."""
+    with SchemaServer({"/schema.json": {"a": 1}}) as server:
+        url = server.url("/schema.json")
+        cache = SchemaCache(tmp_path, max_age=3600)
+        assert cache.get(url) is None
+        assert cache.fetch_json(url) == {"a": 1}
+        assert cache.fetch_json(url) == {"a": 1}
+        assert server.requests == [("/schema.json", 200)]
+
+        # Expired entries are revalidated
+        cache.max_age = 0
+        assert cache.fetch_json(url) == {"a": 1}
+        assert server.requests[-1] == ("/schema.json", 304)
+        server.documents["/schema.json"] = {"a": 2}
+        assert cache.fetch_json(url) == {"a": 2}
+        assert server.requests[-1] == ("/schema.json", 200)
+        assert len(list((tmp_path / "objects").iterdir())) == 2
+
+        with pytest.raises(SchemaNotCachedError):
+            cache.fetch(server.url("/missing.json"))
+
+    # Server is down: use the cached schema
+    assert cache.fetch_json(url) == {"a": 2}
+    offline_cache = SchemaCache(tmp_path, offline=True)
+    assert offline_cache.fetch_json(url) == {"a": 2}
+    with pytest.raises(SchemaNotCachedError):
+        offline_cache.fetch("http://example.com/other.json")
+
+
+def test_seed_and_sync(tmp_path):
+    """Test the sync check and item validation with a pre-seeded cache."""
+    cache = SchemaCache(tmp_path, offline=True)
+    uri = MyOtherExtension.get_schema_uri()
+    cache.seed(uri, MyOtherExtension.get_schema())
+    is_schema_url_synced(MyOtherExtension, cache=cache)
+
+    item, _ = create_dummy_item()
+    MyOtherExtension.ext(item, add_if_missing=True).apply(orbit=1)
+    item.validate(validator=CachedSTACValidator(cache))
+    previous = pystac.validation.RegisteredValidator.get_validator()
+    try:
+        use_schema_cache(cache)
+        item.validate()
+    finally:
+        pystac.validation.set_validator(previous)
+
+    cache.seed(uri, b'{"a": 1}')
+    with pytest.raises(ValueError):
+        is_schema_url_synced(MyOtherExtension, cache=cache)
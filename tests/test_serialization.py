@@ -0,0 +1,123 @@
+"""Test the serialization to JSON bytes."""
+
+from datetime import datetime, timezone
+import io
+import json
+from typing import Optional
+
+from pydantic import BaseModel, Field
+import pytest
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.serialization import (
+    feature_collection_json,
+    item_json,
+    write_items_json,
+)
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+
+class AliasedStuff(BaseModel):
+    """Nested model with an aliased field."""
+
+    value: int = Field(alias="the_value")
+
+
+class SerExtension(BaseExtension):
+    """Extension to serialize."""
+
+    __schema_uri__ = "https://example.com/ser/v1.0.0/schema.json"
+    label: str = Field(alias="ser:label")
+    count: Optional[int] = Field(alias="ser:count", default=None)
+    tags: list[str] = Field(alias="ser:tags", default=[])
+
+
+class NestedSerExtension(BaseExtension):
+    """Extension with nested aliases."""
+
+    __schema_uri__ = "https://example.com/nested-ser/v1.0.0/schema.json"
+    stuff: AliasedStuff = Field(alias="nser:stuff")
+
+
+class OptionalStuff(BaseModel):
+    """Nested model with an optional field."""
+
+    value: int
+    comment: Optional[str] = None
+
+
+class OptionalSerExtension(BaseExtension):
+    """Extension with optional nested fields."""
+
+    __schema_uri__ = "https://example.com/opt-ser/v1.0.0/schema.json"
+    stuff: OptionalStuff = Field(alias="oser:stuff")
+    other: Optional[OptionalStuff] = Field(alias="oser:other", default=None)
+
+
+def _applied(item, models):
+    """Get the item dict after applying the models."""
+    item = item.clone()
+    for md in models:
+        md.ext(item, add_if_missing=True).apply(md)
+    return item.to_dict()
+
+
+@pytest.mark.parametrize("backend", ["orjson", "pydantic"])
+def test_item_json(backend):
+    """Test that splicing the models equals applying them."""
+    item, _ = create_dummy_item()
+    item.properties["ser:label"] = "old"
+    models = [
+        SerExtension(label="new", tags=["a"]),
+        NestedSerExtension(stuff=AliasedStuff(the_value=1)),
+    ]
+    data = item_json(item, models, backend=backend)
+    assert json.loads(data) == _applied(item, models)
+    assert item.properties["ser:label"] == "old"
+    assert json.loads(item_json(item, backend=backend)) == item.to_dict()
+    assert json.loads(item_json(item.to_dict(), models)) == _applied(item, models)
+
+
+def test_nested_nones():
+    """Test that only the top-level None values are dropped, as by apply()."""
+    item, _ = create_dummy_item()
+    models = [OptionalSerExtension(stuff=OptionalStuff(value=1))]
+    data = json.loads(item_json(item, models))
+    assert data == _applied(item, models)
+    assert data["properties"]["oser:stuff"] == {"value": 1, "comment": None}
+    assert "oser:other" not in data["properties"]
+
+
+@pytest.mark.parametrize("backend", ["orjson", "pydantic"])
+def test_datetimes(backend):
+    """Test that the backends write datetimes as pydantic does."""
+    processed = datetime(2024, 5, 6, 7, 8, 9, tzinfo=timezone.utc)
+    item, _ = create_dummy_item()
+    item.properties["ser:processed"] = processed
+    data = json.loads(item_json(item, backend=backend))
+    assert data["properties"]["ser:processed"] == "2024-05-06T07:08:09Z"
+
+
+def test_to_json():
+    """Test the serialization of the extension fields."""
+    assert SerExtension(label="a").to_json() == b'{"ser:label":"a","ser:tags":[]}'
+    assert json.loads(
+        NestedSerExtension(stuff=AliasedStuff(the_value=1)).to_json()
+    ) == {"nser:stuff": {"value": 1}}
+
+
+def test_batch():
+    """Test the batch writers."""
+    items = [create_dummy_item()[0] for _ in range(3)]
+    models = [[SerExtension(label=str(i))] for i in range(3)]
+    fp = io.BytesIO()
+    assert write_items_json(fp, items, models) == 3
+    lines = fp.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        _applied(item, item_models) for item, item_models in zip(items, models)
+    ]
+    collection = json.loads(feature_collection_json(items, models))
+    assert collection["type"] == "FeatureCollection"
+    assert collection["features"] == [json.loads(line) for line in lines]
+    with pytest.raises(ValueError):
+        feature_collection_json(items, models[:2])
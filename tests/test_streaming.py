@@ -0,0 +1,64 @@
+"""Test streaming of extension metadata over STAC dicts."""
+
+import io
+import json
+
+import pystac
+
+from pydantic_pystac_extensions.streaming import (
+    apply_dict,
+    iter_asset_models,
+    iter_models,
+    read_ndjson,
+    update_ndjson,
+    write_ndjson,
+)
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+from tests.test_core import ORBIT, MyOtherExtension
+
+
+def _ndjson(count: int) -> str:
+    """Create NDJSON lines of items, half of them carrying the extension."""
+    buf = io.StringIO()
+    items = [create_dummy_item()[0] for _ in range(count)]
+    MyOtherExtension.apply_many(items[::2], {"orbit": 1})
+    write_ndjson(buf, (item.to_dict() for item in items))
+    return buf.getvalue()
+
+
+def test_read():
+    """Test reading the extension from NDJSON lines."""
+    lines = _ndjson(4).splitlines()
+    assert len(lines) == 4
+    models = [md for _, md in iter_models(MyOtherExtension, read_ndjson(lines))]
+    assert [md.orbit if md else None for md in models] == [1, None, 1, None]
+
+
+def test_apply_dict_and_assets():
+    """Test applying the extension to STAC dicts and reading it from assets."""
+    item_dict = create_dummy_item()[0].to_dict()
+    apply_dict(MyOtherExtension, item_dict, MyOtherExtension(orbit=3), "ndvi")
+    apply_dict(MyOtherExtension, item_dict, MyOtherExtension(orbit=3), "ndvi")
+    assert item_dict["stac_extensions"] == [MyOtherExtension.get_schema_uri()]
+    assert item_dict["assets"]["ndvi"][ORBIT] == 3
+    assert ORBIT not in item_dict["properties"]
+    ((_, models),) = iter_asset_models(MyOtherExtension, [item_dict])
+    assert models["ndvi"].orbit == 3
+    item = pystac.Item.from_dict(item_dict)
+    assert MyOtherExtension(item.assets["ndvi"]).orbit == 3
+
+
+def test_update_ndjson():
+    """Test updating a NDJSON stream."""
+    src = io.StringIO(_ndjson(4))
+    dst = io.StringIO()
+
+    def _incr(_, md):
+        return MyOtherExtension(orbit=md.orbit + 1 if md else 0)
+
+    assert update_ndjson(MyOtherExtension, src, dst, _incr) == 4
+    items = [json.loads(line) for line in dst.getvalue().splitlines()]
+    assert [item["properties"][ORBIT] for item in items] == [2, 0, 2, 0]
+    for item in items:
+        assert MyOtherExtension.has_extension(pystac.Item.from_dict(item))
@@ -0,0 +1,86 @@
+"""Test the concurrent check of schemas synchronization."""
+
+import asyncio
+
+from pydantic import Field
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.schema_cache import SchemaCache
+from pydantic_pystac_extensions.testing import (
+    check_all_schemas,
+    check_all_schemas_async,
+)
+
+from tests.utils import SchemaServer
+
+
+def test_check_all_schemas(tmp_path):
+    """Test checking several extension classes at once."""
+    with SchemaServer({}) as server:
+
+        class SyncedExt(BaseExtension):
+            """Extension with a synced schema."""
+
+            __schema_uri__ = server.url("/synced.json")
+            value: int = Field(alias="synced:value")
+
+        class SyncedExtBis(BaseExtension):
+            """Extension sharing the schema URL of SyncedExt (but not its title)."""
+
+            __schema_uri__ = server.url("/synced.json")
+            value: int = Field(alias="synced:value")
+
+        class OutdatedExt(BaseExtension):
+            """Extension with an outdated schema."""
+
+            __schema_uri__ = server.url("/outdated.json")
+            value: int = Field(alias="outdated:value")
+
+        class MissingExt(BaseExtension):
+            """Extension without published schema."""
+
+            __schema_uri__ = server.url("/missing.json")
+            value: int = Field(alias="missing:value")
+
+        server.documents["/synced.json"] = SyncedExt.get_schema()
+        outdated = OutdatedExt.get_schema()
+        outdated["title"] = "Old title"
+        server.documents["/outdated.json"] = outdated
+
+        classes = [SyncedExt, OutdatedExt, MissingExt, SyncedExtBis]
+        reports = check_all_schemas(classes, max_connections=2)
+        assert [report.ext_cls for report in reports] == classes
+        assert [report.synced for report in reports] == [True, False, False, False]
+        assert not reports[0].diff and reports[0].error is None
+        assert '-  "title": "STAC extension from OutdatedExt model",' in reports[1].diff
+        assert '+  "title": "Old title",' in reports[1].diff
+        assert "404" in reports[2].error
+        assert len(server.requests) == 3
+
+        cache = SchemaCache(tmp_path)
+        check_all_schemas(classes, cache=cache)
+        assert len(server.requests) == 6
+        reports = check_all_schemas(classes, cache=cache)
+        assert len(server.requests) == 7
+        assert [report.synced for report in reports] == [True, False, False, False]
+
+
+def test_check_all_schemas_in_event_loop():
+    """Test checking schemas from a running event loop."""
+    with SchemaServer({}) as server:
+
+        class LoopExt(BaseExtension):
+            """Extension checked from an event loop."""
+
+            __schema_uri__ = server.url("/loop.json")
+            value: int = Field(alias="loop:value")
+
+        server.documents["/loop.json"] = LoopExt.get_schema()
+
+        async def _check():
+            reports = await check_all_schemas_async([LoopExt])
+            # The synchronous variant does not need its own event loop
+            return reports + check_all_schemas([LoopExt])
+
+        reports = asyncio.run(_check())
+        assert [report.synced for report in reports] == [True, True]
@@ -0,0 +1,105 @@
+"""Test the trusted reads."""
+
+from typing import Optional
+
+from pydantic import BaseModel, Field, ValidationError
+import pytest
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.testing import create_dummy_item
+from pydantic_pystac_extensions.trusted import (
+    get_sample_rate,
+    set_sample_rate,
+    trusted_reads,
+)
+
+
+class Nested(BaseModel):
+    """Nested model."""
+
+    value: int
+
+
+class TrustedExtension(BaseExtension):
+    """Extension read in trusted mode."""
+
+    __schema_uri__ = "https://example.com/trusted/v1.0.0/schema.json"
+    label: str = Field(alias="trusted:label")
+    count: int = Field(alias="trusted:count", default=0)
+    tags: list[str] = Field(alias="trusted:tags", default=[])
+    nested: Optional[Nested] = Field(alias="trusted:nested", default=None)
+
+
+class AlwaysTrustedExtension(TrustedExtension):
+    """Extension always read in trusted mode."""
+
+    __trusted__ = True
+
+
+def _create_item(**props):
+    """Create an item with the extension fields."""
+    item, _ = create_dummy_item()
+    item.properties.update(props)
+    return item
+
+
+def test_trusted_equals_validated():
+    """Test that trusted reads build the same models as validated ones."""
+    item = _create_item(
+        **{"trusted:label": "a", "trusted:nested": {"value": 1}, "foo": "bar"}
+    )
+    model = TrustedExtension.read_trusted(item)
+    assert model == TrustedExtension(item)
+    assert model.model_dump() == TrustedExtension(item).model_dump()
+    assert model.nested == Nested(value=1)
+    assert model.count == 0
+    # Mutable defaults are not shared
+    model.tags.append("x")
+    assert TrustedExtension.read_trusted(item).tags == []
+
+    # Nor are the values of the STAC object, as with validated reads
+    item.properties["trusted:tags"] = ["a"]
+    for model in (TrustedExtension.read_trusted(item), TrustedExtension(item)):
+        model.tags.append("y")
+        assert item.properties["trusted:tags"] == ["a"]
+
+    # Changes are tracked as with validated reads
+    assert model.changed_fields == frozenset()
+    model.count = 3
+    assert TrustedExtension.ext(item, add_if_missing=True).apply(model)
+    assert item.properties["trusted:count"] == 3
+
+
+def test_trusted_modes():
+    """Test the per class and context trusted modes."""
+    item = _create_item(**{"trusted:label": "a", "trusted:count": "nope"})
+    with pytest.raises(ValidationError):
+        TrustedExtension(item)
+    # Values are not validated in trusted mode
+    assert TrustedExtension.read_trusted(item).count == "nope"
+    assert AlwaysTrustedExtension(item).count == "nope"
+    with trusted_reads():
+        assert TrustedExtension(item).count == "nope"
+        with trusted_reads(False):
+            with pytest.raises(ValidationError):
+                TrustedExtension(item)
+    with pytest.raises(ValidationError):
+        TrustedExtension(item)
+
+    # Missing required fields are always reported
+    with pytest.raises(ValidationError):
+        TrustedExtension.read_trusted(_create_item())
+
+
+def test_sample_rate():
+    """Test that sampled trusted reads are fully validated."""
+    item = _create_item(**{"trusted:label": "a", "trusted:count": "nope"})
+    assert get_sample_rate() == 0
+    set_sample_rate(100)
+    try:
+        with pytest.raises(ValidationError):
+            TrustedExtension.read_trusted(item)
+    finally:
+        set_sample_rate(0)
+    with pytest.raises(ValueError):
+        set_sample_rate(101)
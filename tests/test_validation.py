@@ -0,0 +1,58 @@
+"""Test offline validation against extension schemas."""
+
+import pystac
+import pytest
+
+from pydantic_pystac_extensions.testing import basic_test, create_dummy_item
+
+from tests.test_core import ORBIT, MyExt, MyOtherExtension
+
+
+def test_validate():
+    """Test validating items, assets and collections."""
+    validator = MyOtherExtension.get_validator()
+    assert validator is MyOtherExtension.get_validator()
+    item, col = create_dummy_item()
+    asset = item.assets["ndvi"]
+
+    # Missing extension URI
+    assert not validator.is_valid(item)
+    for obj in (item, asset, col):
+        MyOtherExtension.ext(obj, add_if_missing=True).apply(orbit=1)
+        validator.validate(obj)
+        validator.validate(obj.to_dict())
+
+    for obj, props in (
+        (item, item.properties),
+        (asset, asset.extra_fields),
+        (col, col.extra_fields),
+    ):
+        props[ORBIT] = "one"
+        with pytest.raises(pystac.STACValidationError):
+            validator.validate(obj)
+
+    results = list(validator.validate_many([item, asset, col]))
+    assert all(errors for _, errors in results)
+
+    with pytest.raises(pystac.ExtensionTypeError):
+        validator.validate(1)
+
+
+def test_validate_nested():
+    """Test validating an extension with nested models."""
+    item, _ = create_dummy_item()
+    MyExt.ext(item, add_if_missing=True).apply(stuff={"j": 1}, other_stuff={"j": 2})
+    MyExt.get_validator().validate(item)
+    item.properties["my:stuff"] = {"j": "a"}
+    assert not MyExt.get_validator().is_valid(item)
+
+
+def test_basic_test_without_validation(monkeypatch):
+    """Test that basic_test() only validates when asked."""
+
+    def _get_validator():
+        raise AssertionError("validation should not run")
+
+    monkeypatch.setattr(MyOtherExtension, "get_validator", _get_validator)
+    md = {"orbit": 1, "random_number": 42}
+    basic_test(ext_cls=MyOtherExtension, ext_md=md, validate=False)
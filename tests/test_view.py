@@ -0,0 +1,124 @@
+"""Test lazy views over the extension fields of STAC objects."""
+
+from typing import Optional
+
+import pystac
+import pytest
+from pydantic import Field, ValidationError, field_validator, model_validator
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.testing import create_dummy_item
+
+from tests.test_core import NAME, MyExt, MyExtensionWAlias, Stuff
+
+
+class ConstrainedExt(BaseExtension):
+    """Extension with constrained fields."""
+
+    __schema_uri__ = "https://example.com/constrained/v1.0.0/schema.json"
+    count: int = Field(alias="c:count", gt=0)
+    ratio: Optional[float] = Field(alias="c:ratio", default=None)
+
+
+def test_read():
+    """Test reading fields lazily."""
+    item, _ = create_dummy_item()
+    MyExt.ext(item, add_if_missing=True).apply(stuff={"j": 1}, other_stuff={"j": 2})
+    view = MyExt.view(item)
+    assert isinstance(view.stuff, Stuff)
+    assert view.stuff is view.stuff
+    assert view.other_stuff.j == 2
+    assert view.to_model() == MyExt(item)
+    with pytest.raises(AttributeError):
+        _ = view.unknown
+
+    view = MyExtensionWAlias.view(item.assets["ndvi"])
+    assert view.opt_field is None
+    with pytest.raises(AttributeError):
+        _ = view.name_custom
+
+    item.properties["my:stuff"] = {"j": "a"}
+    with pytest.raises(ValidationError):
+        _ = MyExt.view(item).stuff
+
+
+def test_write():
+    """Test writing fields through a view."""
+    item, col = create_dummy_item()
+    view = MyExtensionWAlias.view(col, add_if_missing=True)
+    assert MyExtensionWAlias.has_extension(col)
+    view.name_custom = "a"
+    assert col.extra_fields[NAME] == "a"
+    assert view.name_custom == "a"
+    view.name_custom = None
+    assert NAME not in col.extra_fields
+
+    view = ConstrainedExt.view(item.to_dict())
+    view.count = "3"
+    assert view.count == 3
+    with pytest.raises(ValidationError):
+        view.count = 0
+    with pytest.raises(AttributeError):
+        view.unknown = 1
+
+    view = MyExt.view(item)
+    view.stuff = Stuff(j=5)
+    assert item.properties["my:stuff"] == {"j": 5}
+
+
+class ValidatedExt(BaseExtension):
+    """Extension with field and model validators."""
+
+    __schema_uri__ = "https://example.com/validated/v1.0.0/schema.json"
+    label: str = Field(alias="v:label")
+    count: int = Field(alias="v:count", default=0)
+
+    @field_validator("label")
+    @classmethod
+    def _upper(cls, value: str) -> str:
+        """Upper case labels."""
+        return value.upper()
+
+
+class ModelValidatedExt(ValidatedExt):
+    """Extension with a model validator."""
+
+    __schema_uri__ = "https://example.com/model-validated/v1.0.0/schema.json"
+
+    @model_validator(mode="after")
+    def _double(self):
+        """Double the count of labels starting with "X"."""
+        if self.label.startswith("X") and self.count < 100:
+            object.__setattr__(self, "count", self.count * 100)
+        return self
+
+
+def test_validators():
+    """Test that views hold the same values as the models."""
+    for ext_cls in (ValidatedExt, ModelValidatedExt):
+        item, _ = create_dummy_item()
+        item.properties.update({"v:label": "xa", "v:count": 2})
+        view = ext_cls.view(item)
+        model = ext_cls(item)
+        assert (view.label, view.count) == (model.label, model.count)
+        assert view.count == (200 if ext_cls is ModelValidatedExt else 2)
+
+        view.label = "b"
+        assert view.label == "B"
+        assert item.properties["v:label"] == "B"
+        assert ext_cls.view(item).label == ext_cls(item).label == "B"
+        with pytest.raises(ValidationError):
+            view.count = "x"
+
+
+def test_dicts_add_if_missing():
+    """Test adding the schema URI to STAC dicts."""
+    item, col = create_dummy_item()
+    for stac_dict in (item.to_dict(), col.to_dict()):
+        view = ConstrainedExt.view(stac_dict, add_if_missing=True)
+        assert ConstrainedExt.get_schema_uri() in stac_dict["stac_extensions"]
+        view.count = 1
+        ConstrainedExt.view(stac_dict, add_if_missing=True)
+        assert stac_dict["stac_extensions"].count(ConstrainedExt.get_schema_uri()) == 1
+    with pytest.raises(pystac.ExtensionTypeError):
+        ConstrainedExt.view(item.assets["ndvi"].to_dict(), add_if_missing=True)
@@ -0,0 +1,90 @@
+"""Test the catalog walker."""
+
+import threading
+
+import pystac
+from pydantic import Field
+
+from pydantic_pystac_extensions import BaseExtension
+from pydantic_pystac_extensions.testing import create_dummy_item
+from pydantic_pystac_extensions.trusted import trusted_reads
+from pydantic_pystac_extensions.walker import (
+    iter_item_hrefs,
+    read_json_file,
+    walk_models,
+)
+
+
+class WalkExtension(BaseExtension):
+    """Extension read by the walker."""
+
+    __schema_uri__ = "https://example.com/walk/v1.0.0/schema.json"
+    index: int = Field(alias="walk:index")
+
+
+def _create_catalog(directory, nb_collections=3, nb_items=20) -> str:
+    """Create a catalog of collections of items on disk."""
+    catalog = pystac.Catalog(id="root", description="root")
+    index = 0
+    for i in range(nb_collections):
+        _, col = create_dummy_item()
+        col.id = f"col{i}"
+        catalog.add_child(col)
+        for j in range(nb_items):
+            item, _ = create_dummy_item()
+            item.id = f"item{i}_{j}"
+            if j % 5:
+                WalkExtension.ext(item, add_if_missing=True).apply(index=index)
+            index += 1
+            col.add_item(item)
+    catalog.normalize_hrefs(str(directory))
+    catalog.save(pystac.CatalogType.SELF_CONTAINED)
+    return str(directory / "catalog.json")
+
+
+def test_walk_models(tmp_path):
+    """Test that the walker reads the same models as pystac."""
+    root_href = _create_catalog(tmp_path)
+    expected = [
+        (item.id, WalkExtension(item))
+        for item in pystac.Catalog.from_file(root_href).get_items(recursive=True)
+        if WalkExtension.has_extension(item)
+    ]
+    assert len(expected) == 48
+    assert list(walk_models(WalkExtension, root_href, window=4)) == expected
+    assert list(walk_models(WalkExtension, root_href, trusted=True)) == expected
+
+
+def test_bounded_window(tmp_path):
+    """Test that only a window of items is read ahead of the consumer."""
+    root_href = _create_catalog(tmp_path)
+    nb_reads = 0
+    lock = threading.Lock()
+
+    def _read_json(href):
+        nonlocal nb_reads
+        with lock:
+            nb_reads += 1
+        return read_json_file(href)
+
+    nb_catalogs = 4
+    walker = walk_models(WalkExtension, root_href, window=5, read_json=_read_json)
+    next(walker)
+    assert nb_reads <= nb_catalogs + 6
+    walker.close()
+    assert len(list(iter_item_hrefs(root_href))) == len(
+        list(pystac.Catalog.from_file(root_href).get_items(recursive=True))
+    )
+
+
+def test_trusted_context(tmp_path):
+    """Test that the trusted reads context applies to the threads."""
+    root_href = _create_catalog(tmp_path, nb_collections=1, nb_items=2)
+    with open(tmp_path / "col0" / "item0_1" / "item0_1.json", encoding="utf-8") as f:
+        content = f.read()
+    with open(
+        tmp_path / "col0" / "item0_1" / "item0_1.json", "w", encoding="utf-8"
+    ) as f:
+        f.write(content.replace('"walk:index": 1', '"walk:index": "one"'))
+    with trusted_reads():
+        assert [md.index for _, md in walk_models(WalkExtension, root_href)] == ["one"]
@@ -1,5 +1,10 @@
 """Utils module."""
 
+import hashlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import threading
+
 
 def should_fail(func, args, exception_cls):
     """Helper with intended failing tests."""
@@ -12,3 +17,54 @@ def should_fail(func, args, exception_cls):
         raise AssertionError("This test should fail!")
     except exception_cls:
         print("Failing as expected :)")
+
+
+class SchemaServer:
+    """Local HTTP server serving JSON documents, with ETag support."""
+
+    def __init__(self, documents: dict):
+        """Initializer."""
+        self.documents = documents
+        self.requests: list[tuple[str, int]] = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            """Request handler."""
+
+            def do_GET(self):  # pylint: disable=invalid-name
+                """Serve a document."""
+                doc = server.documents.get(self.path)
+                if doc is None:
+                    code = 404
+                    self.send_response(code)
+                    self.end_headers()
+                else:
+                    body = json.dumps(doc).encode("utf-8")
+                    etag = f'"{hashlib.sha256(body).hexdigest()}"'
+                    code = 304 if self.headers.get("If-None-Match") == etag else 200
+                    self.send_response(code)
+                    self.send_header("ETag", etag)
+                    self.end_headers()
+                    if code == 200:
+                        self.wfile.write(body)
+                server.requests.append((self.path, code))
+
+            def log_message(self, *args):  # pylint: disable=arguments-differ
+                """Silence logs."""
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def url(self, path: str) -> str:
+        """URL of a document."""
+        return f"http://127.0.0.1:{self._httpd.server_address[1]}{path}"
+
+    def __enter__(self):
+        """Start serving."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *args):
+        """Stop serving."""
+        self._httpd.shutdown()
+        self._httpd.server_close()